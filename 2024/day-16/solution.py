@@ -98,48 +98,51 @@ def find_shortest_path(grid: List[List[str]], start_state: State, end_pos: Tuple
     return float('inf')
 
 def find_all_optimal_paths(grid: List[List[str]], start_state: State, end_pos: Tuple[int, int]) -> Set[Tuple[int, int]]:
-    queue = [(0, 0, start_state, [(start_state.row, start_state.col)])]
-    visited = set()
+    # Dijkstra that records every predecessor achieving a state's best score,
+    # then walks that DAG back from the end - no per-path lists are kept
+    queue = [(0, start_state)]
     g_scores = {start_state: 0}
+    predecessors = {start_state: []}
+    visited = set()
     optimal_score = float('inf')
-    optimal_paths = []
+    end_states = []
     
     while queue:
-        _, g_score, current, path = heapq.heappop(queue)
+        g_score, current = heapq.heappop(queue)
         
         if g_score > optimal_score:
-            continue
+            break
         
-        if (current.row, current.col) == end_pos:
-            if g_score < optimal_score:
-                optimal_score = g_score
-                optimal_paths = [path]
-            elif g_score == optimal_score:
-                optimal_paths.append(path)
+        if current in visited:
             continue
         
-        state_key = (current.row, current.col, current.direction)
-        if state_key in visited and g_scores[current] > g_score:
-            continue
+        visited.add(current)
         
-        visited.add(state_key)
-        g_scores[current] = g_score
+        if (current.row, current.col) == end_pos:
+            optimal_score = g_score
+            end_states.append(current)
+            continue
         
         for next_state, cost in get_next_states(current, grid):
             new_g_score = g_score + cost
             
-            if next_state not in g_scores or new_g_score <= g_scores[next_state]:
+            if next_state not in g_scores or new_g_score < g_scores[next_state]:
                 g_scores[next_state] = new_g_score
-                f_score = new_g_score + manhattan_distance(
-                    (next_state.row, next_state.col), 
-                    end_pos
-                )
-                new_path = path + [(next_state.row, next_state.col)]
-                heapq.heappush(queue, (f_score, new_g_score, next_state, new_path))
+                predecessors[next_state] = [current]
+                heapq.heappush(queue, (new_g_score, next_state))
+            elif new_g_score == g_scores[next_state]:
+                predecessors[next_state].append(current)
     
     optimal_tiles = set()
-    for path in optimal_paths:
-        optimal_tiles.update(path)
+    seen = set()
+    stack = end_states
+    while stack:
+        state = stack.pop()
+        if state in seen:
+            continue
+        seen.add(state)
+        optimal_tiles.add((state.row, state.col))
+        stack.extend(predecessors[state])
     
     return optimal_tiles
 
@@ -1,5 +1,6 @@
 import unittest
-from solution import parse_input, find_shortest_path, State, Direction, part2
+from solution import (parse_input, find_shortest_path, find_all_optimal_paths, State, Direction,
+                      part1, part2)
 
 class TestSolution(unittest.TestCase):
     def test_small_example(self):
@@ -62,6 +63,79 @@ class TestSolution(unittest.TestCase):
         
         self.assertEqual(result, 45)
 
+    def test_second_example(self):
+        grid = [
+            "#################",
+            "#...#...#...#..E#",
+            "#.#.#.#.#.#.#.#.#",
+            "#.#.#.#...#...#.#",
+            "#.#.#.#.###.#.#.#",
+            "#...#.#.#.....#.#",
+            "#.#.#.#.#.#####.#",
+            "#.#...#.#.#.....#",
+            "#.#.#####.#.###.#",
+            "#.#.#.......#...#",
+            "#.#.###.#####.###",
+            "#.#.#...#.....#.#",
+            "#.#.#.#####.###.#",
+            "#.#.#.........#.#",
+            "#.#.#.#########.#",
+            "#S#.............#",
+            "#################"
+        ]
+
+        with open('test_input.txt', 'w') as f:
+            f.write('\n'.join(grid))
+
+        grid, start_state, end_pos = parse_input('test_input.txt')
+        tiles = find_all_optimal_paths(grid, start_state, end_pos)
+        score = part1('test_input.txt')
+        tile_count = part2('test_input.txt')
+
+        import os
+        os.remove('test_input.txt')
+
+        self.assertEqual(score, 11048)
+        self.assertEqual(tile_count, 64)
+        self.assertEqual(len(tiles), 64)
+        self.assertIn((start_state.row, start_state.col), tiles)
+        self.assertIn(end_pos, tiles)
+        self.assertTrue(all(grid[row][col] != '#' for row, col in tiles))
+
+    def test_first_example_tiles(self):
+        grid = [
+            "###############",
+            "#.......#....E#",
+            "#.#.###.#.###.#",
+            "#.....#.#...#.#",
+            "#.###.#####.#.#",
+            "#.#.#.......#.#",
+            "#.#.#####.###.#",
+            "#...........#.#",
+            "###.#.#####.#.#",
+            "#...#.....#.#.#",
+            "#.#.#.###.#.#.#",
+            "#.....#...#.#.#",
+            "#.###.#.#.#.#.#",
+            "#S..#.....#...#",
+            "###############"
+        ]
+
+        with open('test_input.txt', 'w') as f:
+            f.write('\n'.join(grid))
+
+        grid, start_state, end_pos = parse_input('test_input.txt')
+        score = part1('test_input.txt')
+
+        import os
+        os.remove('test_input.txt')
+
+        tiles = find_all_optimal_paths(grid, start_state, end_pos)
+        self.assertEqual(score, 7036)
+        self.assertEqual(len(tiles), 45)
+        # Every optimal route runs along the corridor on row 7
+        self.assertTrue({(7, col) for col in range(3, 12)} <= tiles)
+
 def run_tests():
     print("Running unit tests...")
     test_suite = unittest.TestLoader().loadTestsFromTestCase(TestSolution)
@@ -0,0 +1,118 @@
+"""
+Benchmark the 2025 day 8 pair engines against sorting every pair in Python.
+
+Usage:
+    python 2025/benchmarks/day8_pairs.py [--boxes N] [--repeat N]
+
+For each part, times how long each engine takes to produce the pairs that part
+consumes: the closest 1000 for part 1, and everything up to the union that
+joins the last circuit for part 2. "sort" is the original approach of building
+all n(n-1)/2 pairs and calling list.sort(); it is skipped above --max-sort boxes.
+"""
+
+import argparse
+import random
+import sys
+import timeit
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+sys.path.append(str(REPO_ROOT))
+
+from aoc.solutions import load_solution  # noqa: E402
+
+day8 = load_solution(2025, 8).module
+
+Point = Tuple[int, int, int]
+
+
+def sorted_pairs(positions: List[Point]) -> Iterator[Tuple[int, int, int]]:
+    """All pairs as (squared distance, i, j), built and sorted up front."""
+    edges = []
+    for i, (xi, yi, zi) in enumerate(positions):
+        for j in range(i + 1, len(positions)):
+            xj, yj, zj = positions[j]
+            edges.append(((xi - xj) ** 2 + (yi - yj) ** 2 + (zi - zj) ** 2, i, j))
+    edges.sort()
+    return iter(edges)
+
+
+def pairs_to_connect(positions: List[Point]) -> int:
+    """Number of closest pairs part 2 reads before everything is one circuit."""
+    parents = list(range(len(positions)))
+
+    def find(x: int) -> int:
+        while parents[x] != x:
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+        return x
+
+    components = len(positions)
+    for count, (_, i, j) in enumerate(day8.closest_pairs(positions), 1):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parents[root_i] = root_j
+            components -= 1
+            if components == 1:
+                return count
+    return 0
+
+
+def engines(positions: List[Point]) -> List[Tuple[str, Callable[[int], Iterator]]]:
+    """(name, factory) where factory(limit) returns a pair iterator."""
+    return [
+        ("sort", lambda limit: sorted_pairs(positions)),
+        ("grid", lambda limit: day8.closest_pairs(positions)),
+        (
+            "numpy",
+            lambda limit: (
+                day8.growing_numpy_pairs(positions)
+                if limit is None
+                else day8.numpy_pairs(positions, limit)
+            ),
+        ),
+    ]
+
+
+def main() -> None:
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--boxes", type=int, help="Use this many random boxes, not the input")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs (default 5)")
+    parser.add_argument("--max-sort", type=int, default=3000, help="Largest n for 'sort'")
+    args = parser.parse_args()
+
+    if args.boxes:
+        rng = random.Random(2025)
+        positions = [tuple(rng.randrange(100_000) for _ in range(3)) for _ in range(args.boxes)]
+        label = f"{args.boxes} random boxes"
+    else:
+        positions = day8.parse_input(str(REPO_ROOT / "2025" / "day-8" / "input.txt")).positions
+        label = f"2025 day 8 input ({len(positions)} boxes)"
+
+    needed = {"part 1": min(1000, len(positions) * (len(positions) - 1) // 2)}
+    needed["part 2"] = pairs_to_connect(positions)
+    print(label)
+
+    for part, count in needed.items():
+        print(f"  {part}: first {count} pairs")
+        expected = list(islice(day8.closest_pairs(positions), count))
+        for name, factory in engines(positions):
+            if name == "sort" and len(positions) > args.max_sort:
+                print(f"    {name:5}  skipped")
+                continue
+            limit = count if part == "part 1" else None
+            if list(islice(factory(limit), count)) != expected:
+                raise SystemExit(f"{name} produced different pairs")
+            best = min(
+                timeit.repeat(
+                    lambda: list(islice(factory(limit), count)), number=1, repeat=args.repeat
+                )
+            )
+            print(f"    {name:5}  best {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
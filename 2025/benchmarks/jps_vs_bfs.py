@@ -0,0 +1,103 @@
+"""
+Benchmark jump_point_search against bfs on the 2024 day 18 and day 20 grids.
+
+Usage:
+    python 2025/benchmarks/jps_vs_bfs.py [--repeat N]
+
+Both searches run to the goal on the same Grid; distances must match. Expanded
+counts come from SearchStats: BFS expands cells, JPS expands jump points.
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils import Grid, SearchStats, bfs, jump_point_search  # noqa: E402
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+Case = Tuple[str, Grid, Tuple[int, int], Tuple[int, int]]
+
+
+def memory_space(path: Path, size: int = 71, fallen: int = 1024) -> Grid:
+    """2024 day 18: an open grid with the first bytes marked as walls."""
+    grid = Grid([["."] * size for _ in range(size)])
+    with open(path) as f:
+        for line in f.read().split()[:fallen]:
+            x, y = map(int, line.split(","))
+            grid[y, x] = "#"
+    return grid
+
+
+def load_cases() -> List[Case]:
+    """Build the benchmark grids from the 2024 inputs."""
+    memory = memory_space(REPO_ROOT / "2024" / "day-18" / "input.txt")
+    track = Grid.from_file(str(REPO_ROOT / "2024" / "day-20" / "input.txt"))
+    return [
+        ("2024 day 18 (71x71, 1024 walls)", memory, (0, 0), (70, 70)),
+        (
+            f"2024 day 20 ({track.rows}x{track.cols} racetrack)",
+            track,
+            track.find("S"),
+            track.find("E"),
+        ),
+    ]
+
+
+def run_bfs(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], **kwargs) -> int:
+    """Distance from start to goal with the generic BFS."""
+    _, _, distances = bfs(
+        start,
+        lambda pos: grid.get_neighbors(*pos, condition=lambda char: char != "#"),
+        lambda pos: pos == goal,
+        **kwargs,
+    )
+    return distances[goal]
+
+
+def run_jps(grid: Grid, start: Tuple[int, int], goal: Tuple[int, int], **kwargs) -> int:
+    """Distance from start to goal with jump point search."""
+    distance, _ = jump_point_search(grid, start, goal, **kwargs)
+    return distance
+
+
+def measure(search: Callable[..., int], case: Case, repeat: int) -> Tuple[int, float, SearchStats]:
+    """Best-of-repeat time, plus the distance and work counters of one run."""
+    _, grid, start, goal = case
+    stats = SearchStats()
+    distance = search(grid, start, goal, stats=stats)
+    best = min(timeit.repeat(lambda: search(grid, start, goal), number=1, repeat=repeat))
+    return distance, best, stats
+
+
+def main() -> None:
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs (default 20)")
+    args = parser.parse_args()
+
+    for case in load_cases():
+        print(case[0])
+        results = {
+            name: measure(search, case, args.repeat)
+            for name, search in [
+                ("bfs", run_bfs),
+                ("jps", run_jps),
+            ]
+        }
+        for name, (distance, best, stats) in results.items():
+            print(
+                f"    {name}  distance {distance:>5}  best {best * 1000:8.2f} ms  "
+                f"expanded {stats.expanded:>6}  max frontier {stats.max_frontier:>5}"
+            )
+        if results["bfs"][0] != results["jps"][0]:
+            raise SystemExit("Distance mismatch between bfs and jump_point_search")
+        print(f"    speedup {results['bfs'][1] / results['jps'][1]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,9 @@ def parse_input(input_file: str) -> List[str]:
         input_file: Path to the input file
 
     Returns:
-        Parsed data in appropriate structure
+        Parsed data in appropriate structure, shared by both parts.
+        Precomputation both parts need (e.g. a sorted edge list) can live on
+        this object so it is only built once - see 2025/day-8 for an example.
 
     Example patterns:
         # Simple lines
@@ -64,36 +66,44 @@ def parse_input(input_file: str) -> List[str]:
     return data
 
 
-def part1(input_file: str) -> int:
+def solve_part1(data: List[str]) -> int:
     """
     Solve Part 1 of the puzzle.
 
     Args:
-        input_file: Path to the input file
+        data: Parsed input from parse_input()
 
     Returns:
         Solution for Part 1
     """
-    data = parse_input(input_file)  # noqa: F841 - Template variable
     # Implement Part 1 logic here
     return 0
 
 
-def part2(input_file: str) -> int:
+def solve_part2(data: List[str]) -> int:
     """
     Solve Part 2 of the puzzle.
 
     Args:
-        input_file: Path to the input file
+        data: Parsed input from parse_input()
 
     Returns:
         Solution for Part 2
     """
-    data = parse_input(input_file)  # noqa: F841 - Template variable
     # Implement Part 2 logic here
     return 0
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     # Uncomment when unit_tests.py exists
@@ -101,8 +111,9 @@ def main():
     #
     # if run_tests():
     #     print("\nAll tests passed! Running actual solution...\n")
-    #     result1 = part1('input.txt')
-    #     result2 = part2('input.txt')
+    #     data = parse_input("input.txt")
+    #     result1 = solve_part1(data)
+    #     result2 = solve_part2(data)
     #     print(f"Part 1: {result1}")
     #     print(f"Part 2: {result2}")
     # else:
@@ -110,8 +121,9 @@ def main():
 
     # Simple execution without tests
     print("Running solution...")
-    result1 = part1("input.txt")
-    result2 = part2("input.txt")
+    data = parse_input("input.txt")
+    result1 = solve_part1(data)
+    result2 = solve_part2(data)
     print(f"\nPart 1: {result1}")
     print(f"Part 2: {result2}")
 
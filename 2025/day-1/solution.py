@@ -37,9 +37,8 @@ def parse_input(input_file: str) -> List[Tuple[str, int]]:
     return rotations
 
 
-def part1(input_file: str) -> int:
+def solve_part1(rotations: List[Tuple[str, int]]) -> int:
     """Count how many times we end up at position 0 after a rotation."""
-    rotations = parse_input(input_file)
     position = 50
     count = 0
 
@@ -55,9 +54,8 @@ def part1(input_file: str) -> int:
     return count
 
 
-def part2(input_file: str) -> int:
+def solve_part2(rotations: List[Tuple[str, int]]) -> int:
     """Count every time we pass through 0, including mid-rotation."""
-    rotations = parse_input(input_file)
     position = 50
     count = 0
 
@@ -90,13 +88,24 @@ def part2(input_file: str) -> int:
     return count
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
@@ -18,6 +18,9 @@ from scipy.optimize import milp, Bounds, LinearConstraint
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+# (target lights, buttons, joltage requirements)
+Machine = Tuple[List[bool], List[Set[int]], List[int]]
+
 
 def parse_machine(
     line: str, include_joltage: bool = False
@@ -44,10 +47,20 @@ def parse_machine(
     return target, buttons
 
 
-def parse_input(input_file: str) -> List[str]:
-    """Parse input file into list of machine lines."""
+def parse_input(input_file: str) -> List[Machine]:
+    """Parse input file into (target, buttons, joltage) tuples, one per machine."""
+    machines = []
     with open(input_file) as f:
-        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "{" in line:
+                machines.append(parse_machine(line, include_joltage=True))
+            else:
+                target, buttons = parse_machine(line)
+                machines.append((target, buttons, []))
+    return machines
 
 
 def min_presses_for_machine(target: List[bool], buttons: List[Set[int]]) -> int:
@@ -116,40 +129,47 @@ def min_presses_part2(buttons: List[Set[int]], targets: List[int]) -> int:
         return -1
 
 
-def part1(input_file: str) -> int:
+def solve_part1(machines: List[Machine]) -> int:
     """Find total minimum button presses for all machines (indicator lights)."""
-    lines = parse_input(input_file)
     total = 0
 
-    for line in lines:
-        target, buttons = parse_machine(line)
+    for target, buttons, _ in machines:
         presses = min_presses_for_machine(target, buttons)
         total += presses
 
     return total
 
 
-def part2(input_file: str) -> int:
+def solve_part2(machines: List[Machine]) -> int:
     """Find total minimum button presses for all machines (joltage counters)."""
-    lines = parse_input(input_file)
     total = 0
 
-    for line in lines:
-        _, buttons, joltage = parse_machine(line, include_joltage=True)
+    for _, buttons, joltage in machines:
         presses = min_presses_part2(buttons, joltage)
         total += presses
 
     return total
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
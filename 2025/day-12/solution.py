@@ -18,8 +18,14 @@ from typing import FrozenSet, List, Set, Tuple
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from utils import cached_parse  # noqa: E402
 
-def parse_input(input_file: str):
+# (shapes as sets of (row, col) cells, regions as (width, height, piece counts))
+Puzzle = Tuple[List[Set[Tuple[int, int]]], List[Tuple[int, int, List[int]]]]
+
+
+@cached_parse()
+def parse_input(input_file: str) -> Puzzle:
     """Parse shapes and regions from input file."""
     with open(input_file) as f:
         content = f.read()
@@ -143,9 +149,9 @@ def can_fit_pieces(w: int, h: int, piece_list: List[List[FrozenSet]]) -> bool:
     return backtrack(0)
 
 
-def part1(input_file: str) -> int:
+def solve_part1(data: Puzzle) -> int:
     """Count regions that can fit all their required presents."""
-    shapes, regions = parse_input(input_file)
+    shapes, regions = data
 
     # Pre-compute all variants for each shape
     shape_variants = [get_all_variants(shape) for shape in shapes]
@@ -164,19 +170,30 @@ def part1(input_file: str) -> int:
     return count
 
 
-def part2(input_file: str) -> str:
+def solve_part2(data: Puzzle) -> str:
     """Part 2 is narrative only - no additional computation required."""
     return "No puzzle - star awarded for completing Part 1!"
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> str:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
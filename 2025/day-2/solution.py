@@ -90,17 +90,16 @@ def parse_input(input_file: str) -> List[Tuple[int, int]]:
     return ranges
 
 
-def part1(input_file: str) -> int:
+def solve_part1(ranges: List[Tuple[int, int]]) -> int:
     """
     Find and sum all invalid IDs in the given ranges.
 
     Args:
-        input_file: Path to the input file
+        ranges: List of (start, end) tuples from parse_input()
 
     Returns:
         Sum of all invalid IDs
     """
-    ranges = parse_input(input_file)
     total = 0
 
     for start, end in ranges:
@@ -111,17 +110,16 @@ def part1(input_file: str) -> int:
     return total
 
 
-def part2(input_file: str) -> int:
+def solve_part2(ranges: List[Tuple[int, int]]) -> int:
     """
     Find and sum all invalid IDs in the given ranges (at least twice repetition).
 
     Args:
-        input_file: Path to the input file
+        ranges: List of (start, end) tuples from parse_input()
 
     Returns:
         Sum of all invalid IDs
     """
-    ranges = parse_input(input_file)
     total = 0
 
     for start, end in ranges:
@@ -132,14 +130,25 @@ def part2(input_file: str) -> int:
     return total
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
@@ -47,17 +47,16 @@ def find_max_joltage(bank: str) -> int:
     return max_joltage
 
 
-def part1(input_file: str) -> int:
+def solve_part1(banks: List[str]) -> int:
     """
     Solve Part 1: Find the total output joltage from all battery banks.
 
     Args:
-        input_file: Path to the input file
+        banks: Battery bank strings from parse_input()
 
     Returns:
         Sum of maximum joltages from all banks
     """
-    banks = parse_input(input_file)
     total = 0
 
     for bank in banks:
@@ -102,17 +101,16 @@ def find_max_joltage_n_batteries(bank: str, num_batteries: int) -> int:
     return int("".join(result))
 
 
-def part2(input_file: str) -> int:
+def solve_part2(banks: List[str]) -> int:
     """
     Solve Part 2: Find the total output joltage using 12 batteries per bank.
 
     Args:
-        input_file: Path to the input file
+        banks: Battery bank strings from parse_input()
 
     Returns:
         Sum of maximum 12-digit joltages from all banks
     """
-    banks = parse_input(input_file)
     total = 0
 
     for bank in banks:
@@ -122,14 +120,25 @@ def part2(input_file: str) -> int:
     return total
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
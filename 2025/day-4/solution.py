@@ -4,13 +4,21 @@ Advent of Code 2025 - Day 4: Printing Department
 Count rolls of paper that can be accessed by forklifts.
 A roll is accessible if it has fewer than 4 neighboring rolls in the 8 adjacent positions.
 
-Algorithm: Grid traversal with neighbor counting
-Time Complexity: O(rows * cols)
+Algorithm: Vectorized neighbor counting (shifted sums over a NumPy mask)
+Time Complexity: O(rows * cols) per round
 Space Complexity: O(rows * cols) for the grid
 """
 
+import sys
+from pathlib import Path
 from typing import List
 
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils import ArrayGrid, neighbor_counts  # noqa: E402
+
 
 def parse_input(input_file: str) -> List[str]:
     """Parse the input file into a list of strings representing the grid."""
@@ -34,41 +42,34 @@ def count_accessible_rolls(grid: List[str]) -> int:
     Returns:
         Number of accessible rolls
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    accessible = 0
+    rolls = ArrayGrid.from_lines(grid).mask("@")
+    return int(accessible(rolls).sum())
 
-    # All 8 directions: N, NE, E, SE, S, SW, W, NW
-    directions = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
 
-    for row in range(rows):
-        for col in range(cols):
-            if grid[row][col] == "@":
-                # Count neighbors that are also rolls
-                neighbor_count = 0
-                for dr, dc in directions:
-                    nr, nc = row + dr, col + dc
-                    if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == "@":
-                        neighbor_count += 1
+def accessible(rolls: np.ndarray) -> np.ndarray:
+    """
+    Mask of rolls with fewer than 4 rolls among their 8 neighbors.
 
-                # Accessible if fewer than 4 neighbors
-                if neighbor_count < 4:
-                    accessible += 1
+    Args:
+        rolls: Boolean mask of roll positions
 
-    return accessible
+    Returns:
+        Boolean mask of accessible rolls
+    """
+    counts = neighbor_counts(rolls, diagonal=True)
+    return rolls & (counts < 4)
 
 
-def part1(input_file: str) -> int:
+def solve_part1(grid: List[str]) -> int:
     """
     Solve Part 1: Count accessible rolls of paper.
 
     Args:
-        input_file: Path to the input file
+        grid: Grid rows from parse_input()
 
     Returns:
         Number of accessible rolls
     """
-    grid = parse_input(input_file)
     return count_accessible_rolls(grid)
 
 
@@ -83,68 +84,54 @@ def remove_accessible_rolls_iteratively(grid: List[str]) -> int:
     Returns:
         Total number of rolls removed
     """
-    # Convert to list of lists so we can modify it
-    grid = [list(row) for row in grid]
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    directions = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
-
+    rolls = ArrayGrid.from_lines(grid).mask("@")
     total_removed = 0
 
     while True:
-        # Find all accessible rolls (fewer than 4 neighbors)
-        accessible_positions = []
-
-        for row in range(rows):
-            for col in range(cols):
-                if grid[row][col] == "@":
-                    # Count neighbors that are also rolls
-                    neighbor_count = 0
-                    for dr, dc in directions:
-                        nr, nc = row + dr, col + dc
-                        if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == "@":
-                            neighbor_count += 1
-
-                    # Accessible if fewer than 4 neighbors
-                    if neighbor_count < 4:
-                        accessible_positions.append((row, col))
-
-        # If no accessible rolls, we're done
-        if not accessible_positions:
+        # All accessible rolls are removed together each round
+        removable = accessible(rolls)
+        removed = int(removable.sum())
+        if not removed:
             break
-
-        # Remove all accessible rolls
-        for row, col in accessible_positions:
-            grid[row][col] = "."
-
-        total_removed += len(accessible_positions)
+        rolls &= ~removable
+        total_removed += removed
 
     return total_removed
 
 
-def part2(input_file: str) -> int:
+def solve_part2(grid: List[str]) -> int:
     """
     Solve Part 2: Count total rolls that can be removed by iteratively
     removing accessible rolls.
 
     Args:
-        input_file: Path to the input file
+        grid: Grid rows from parse_input()
 
     Returns:
         Total number of rolls removed
     """
-    grid = parse_input(input_file)
     return remove_accessible_rolls_iteratively(grid)
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
@@ -27,6 +27,8 @@ from typing import List, Tuple
 # Add utils to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from utils import iter_blocks  # noqa: E402
+
 
 def parse_input(input_file: str) -> Tuple[List[Tuple[int, int]], List[int]]:
     """
@@ -39,25 +41,24 @@ def parse_input(input_file: str) -> Tuple[List[Tuple[int, int]], List[int]]:
         Tuple of (ranges, ingredient_ids)
         - ranges: List of (start, end) tuples
         - ingredient_ids: List of ingredient IDs to check
-    """
-    with open(input_file) as f:
-        content = f.read()
 
-    # Split by blank line
-    sections = content.strip().split("\n\n")
-    ranges_section = sections[0]
-    ids_section = sections[1]
-
-    # Parse ranges
+    Raises:
+        ValueError: If the file lacks the ranges block or the IDs block
+    """
+    # Streamed block by block: ranges first, then the IDs
+    blocks = iter_blocks(input_file)
+    range_lines = next(blocks, None)
+    if range_lines is None:
+        raise ValueError(f"{input_file}: expected a block of ID ranges, found no input")
     ranges = []
-    for line in ranges_section.strip().split("\n"):
+    for line in range_lines:
         start, end = line.split("-")
         ranges.append((int(start), int(end)))
 
-    # Parse ingredient IDs
-    ingredient_ids = []
-    for line in ids_section.strip().split("\n"):
-        ingredient_ids.append(int(line))
+    id_lines = next(blocks, None)
+    if id_lines is None:
+        raise ValueError(f"{input_file}: expected a blank line and then ingredient IDs")
+    ingredient_ids = [int(line) for line in id_lines]
 
     return ranges, ingredient_ids
 
@@ -102,17 +103,17 @@ def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
     return merged
 
 
-def part1(input_file: str) -> int:
+def solve_part1(inventory: Tuple[List[Tuple[int, int]], List[int]]) -> int:
     """
     Count how many ingredient IDs are fresh.
 
     Args:
-        input_file: Path to the input file
+        inventory: (ranges, ingredient_ids) from parse_input()
 
     Returns:
         Number of fresh ingredient IDs
     """
-    ranges, ingredient_ids = parse_input(input_file)
+    ranges, ingredient_ids = inventory
 
     fresh_count = 0
     for ingredient_id in ingredient_ids:
@@ -122,17 +123,17 @@ def part1(input_file: str) -> int:
     return fresh_count
 
 
-def part2(input_file: str) -> int:
+def solve_part2(inventory: Tuple[List[Tuple[int, int]], List[int]]) -> int:
     """
     Count total number of unique IDs covered by all ranges.
 
     Args:
-        input_file: Path to the input file
+        inventory: (ranges, ingredient_ids) from parse_input()
 
     Returns:
         Total number of fresh ingredient IDs
     """
-    ranges, _ = parse_input(input_file)
+    ranges, _ = inventory
 
     # Merge overlapping ranges to avoid double-counting
     merged = merge_ranges(ranges)
@@ -145,15 +146,25 @@ def part2(input_file: str) -> int:
     return total_count
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        print(f"Part 1: {result1}")
-        print(f"Part 2: {part2('input.txt')}")
+        data = parse_input("input.txt")
+        print(f"Part 1: {solve_part1(data)}")
+        print(f"Part 2: {solve_part2(data)}")
     else:
         print("\nTests failed! Please fix the issues before running the actual solution.")
 
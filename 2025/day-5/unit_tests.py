@@ -89,6 +89,22 @@ class TestSolution(unittest.TestCase):
         # Fresh IDs: 3,4,5,10,11,12,13,14,15,16,17,18,19,20 = 14 total
         self.assertEqual(result, 14, "Should have 14 total fresh IDs")
 
+    def test_parse_crlf_and_whitespace_separator(self):
+        """Test that CRLF line endings and a whitespace-only separator parse cleanly."""
+        with open(self.test_file, "wb") as f:
+            f.write(b"3-5\r\n10-14 \r\n  \r\n1\r\n5\r\n\r\n")
+
+        self.assertEqual(parse_input(self.test_file), ([(3, 5), (10, 14)], [1, 5]))
+
+    def test_parse_missing_blocks(self):
+        """Test that missing blocks raise ValueError instead of StopIteration."""
+        for text, message in (("", "ID ranges"), ("\n\n", "ID ranges"), ("3-5\n", "ingredient")):
+            with open(self.test_file, "w") as f:
+                f.write(text)
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(ValueError, message):
+                    parse_input(self.test_file)
+
 
 def run_tests():
     """Run all tests and return success status."""
@@ -19,17 +19,18 @@ from typing import List, Tuple
 sys.path.append(str(Path(__file__).parent.parent))
 
 
-def parse_input(input_file: str) -> List[Tuple[List[int], str]]:
+def parse_input(input_file: str) -> List[List[str]]:
     """
-    Parse the vertical math worksheet into problems.
+    Split the vertical math worksheet into problem blocks.
 
-    Each problem is a tuple of (numbers, operator).
+    Each block holds the rows of one problem's columns, padded to equal width, so
+    both the Part 1 and Part 2 readings can be derived without reparsing the file.
 
     Args:
         input_file: Path to the input file
 
     Returns:
-        List of problems as (numbers, operator) tuples
+        List of blocks, each a list of row segments for one problem
     """
     with open(input_file) as f:
         lines = [line.rstrip("\n") for line in f if line.strip()]
@@ -67,14 +68,26 @@ def parse_input(input_file: str) -> List[Tuple[List[int], str]]:
     if start_col is not None:
         problem_ranges.append((start_col, max_len))
 
-    # Extract problems from each range
+    return [[line[start:end] for line in lines] for start, end in problem_ranges]
+
+
+def read_problems(blocks: List[List[str]]) -> List[Tuple[List[int], str]]:
+    """
+    Read problems left-to-right, one number per row (Part 1).
+
+    Args:
+        blocks: Problem blocks from parse_input()
+
+    Returns:
+        List of problems as (numbers, operator) tuples
+    """
     problems = []
-    for start, end in problem_ranges:
+    for block in blocks:
         numbers = []
         operator = None
 
-        for line in lines:
-            segment = line[start:end].strip()
+        for row in block:
+            segment = row.strip()
             if not segment:
                 continue
 
@@ -107,81 +120,45 @@ def solve_problems(numbers: List[int], operator: str) -> int:
         raise ValueError(f"Unknown operator: {operator}")
 
 
-def part1(input_file: str) -> int:
+def solve_part1(blocks: List[List[str]]) -> int:
     """
     Solve Part 1: Calculate the grand total of all problems.
 
     Args:
-        input_file: Path to the input file
+        blocks: Problem blocks from parse_input()
 
     Returns:
         Grand total (sum of all problem answers)
     """
-    problems = parse_input(input_file)
     grand_total = 0
 
-    for numbers, operator in problems:
+    for numbers, operator in read_problems(blocks):
         answer = solve_problems(numbers, operator)
         grand_total += answer
 
     return grand_total
 
 
-def parse_input_part2(input_file: str) -> List[Tuple[List[int], str]]:
+def read_problems_cephalopod(blocks: List[List[str]]) -> List[Tuple[List[int], str]]:
     """
-    Parse the worksheet for Part 2 (cephalopod math - right-to-left reading).
+    Read problems in cephalopod math (Part 2).
 
     In cephalopod math, each character column (read top-to-bottom) forms a number,
     and we read columns right-to-left.
 
     Args:
-        input_file: Path to the input file
+        blocks: Problem blocks from parse_input()
 
     Returns:
         List of problems as (numbers, operator) tuples
     """
-    with open(input_file) as f:
-        lines = [line.rstrip("\n") for line in f if line.strip()]
-
-    if not lines:
-        return []
-
-    # Ensure all lines are the same length by padding with spaces
-    max_len = max(len(line) for line in lines)
-    lines = [line.ljust(max_len) for line in lines]
-
-    # Find separator columns (columns where ALL rows have spaces)
-    separator_cols = set(range(max_len))
-    for line in lines:
-        for col_idx in range(len(line)):
-            if line[col_idx] != " ":
-                separator_cols.discard(col_idx)
-
-    # Find problem column ranges
-    problem_ranges = []
-    start_col = None
-
-    for col_idx in range(max_len):
-        if col_idx not in separator_cols:
-            if start_col is None:
-                start_col = col_idx
-        else:
-            if start_col is not None:
-                problem_ranges.append((start_col, col_idx))
-                start_col = None
-
-    if start_col is not None:
-        problem_ranges.append((start_col, max_len))
-
-    # Extract problems with cephalopod reading
     problems = []
-    for start, end in problem_ranges:
+    for block in blocks:
         # Extract the text segments for this problem (preserving spacing)
         segments = []
         operator = None
 
-        for line in lines:
-            segment = line[start:end]
+        for segment in block:
             stripped = segment.strip()
 
             if not stripped:
@@ -226,34 +203,57 @@ def parse_input_part2(input_file: str) -> List[Tuple[List[int], str]]:
     return problems
 
 
-def part2(input_file: str) -> int:
+def parse_input_part2(input_file: str) -> List[Tuple[List[int], str]]:
     """
-    Solve Part 2: Calculate grand total using cephalopod math (right-to-left reading).
+    Parse the worksheet for Part 2 (cephalopod math - right-to-left reading).
 
     Args:
         input_file: Path to the input file
 
+    Returns:
+        List of problems as (numbers, operator) tuples
+    """
+    return read_problems_cephalopod(parse_input(input_file))
+
+
+def solve_part2(blocks: List[List[str]]) -> int:
+    """
+    Solve Part 2: Calculate grand total using cephalopod math (right-to-left reading).
+
+    Args:
+        blocks: Problem blocks from parse_input()
+
     Returns:
         Grand total for Part 2
     """
-    problems = parse_input_part2(input_file)
     grand_total = 0
 
-    for numbers, operator in problems:
+    for numbers, operator in read_problems_cephalopod(blocks):
         answer = solve_problems(numbers, operator)
         grand_total += answer
 
     return grand_total
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
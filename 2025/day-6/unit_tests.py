@@ -6,7 +6,7 @@ import os
 import unittest
 from textwrap import dedent
 
-from solution import parse_input, part1, solve_problems
+from solution import parse_input, part1, read_problems, solve_problems
 
 
 class TestSolution(unittest.TestCase):
@@ -69,7 +69,7 @@ class TestSolution(unittest.TestCase):
                 )
             )
 
-        problems = parse_input(self.test_file)
+        problems = read_problems(parse_input(self.test_file))
         # Should have 4 problems
         self.assertEqual(len(problems), 4)
 
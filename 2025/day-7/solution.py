@@ -113,9 +113,8 @@ def simulate_beams(grid: List[str], debug=False) -> int:
     return split_count
 
 
-def part1(input_file: str) -> int:
+def solve_part1(grid: List[str]) -> int:
     """Count how many times the beam is split."""
-    grid = parse_input(input_file)
     return simulate_beams(grid)
 
 
@@ -170,23 +169,33 @@ def count_timelines(grid: List[str], row: int, col: int, memo: dict) -> int:
     return 0
 
 
-def part2(input_file: str) -> int:
+def solve_part2(grid: List[str]) -> int:
     """Count the number of quantum timelines."""
-    grid = parse_input(input_file)
     start_row, start_col = find_start(grid)
 
     memo = {}
     return count_timelines(grid, start_row, start_col, memo)
 
 
+def part1(input_file: str) -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file))
+
+
+def part2(input_file: str) -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file))
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
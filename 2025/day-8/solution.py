@@ -4,192 +4,392 @@ Advent of Code 2025 - Day 8: Playground
 Connect junction boxes in 3D space to form circuits.
 Use Union-Find to track connected components.
 
-Algorithm: Union-Find with sorted edge list
-Time Complexity: O(n^2 log n) for sorting all pairs + O(n^2 * α(n)) for union-find
-Space Complexity: O(n^2) for storing all distances
+Algorithm: Union-Find over pairs generated lazily in increasing distance order
+Time Complexity: O(m log m) where m is the number of pairs up to the last distance used
+Space Complexity: O(n + m)
+
+Pairs come from a uniform grid whose cells double in size each round, so only
+pairs up to the distance a part actually consumes are ever built. They are
+cached on the parsed Playground and shared by both parts. engine="numpy"
+instead computes pairwise distances in NumPy blocks and keeps only the closest
+ones a part can still need (see numpy_pairs and growing_numpy_pairs).
 
 Key Insights:
 - Classic Minimum Spanning Tree problem using Kruskal's algorithm
 - Union-Find efficiently tracks connected components
-- Sort all pairwise distances and connect 1000 closest pairs
-- Track circuit sizes after connections complete
+- Integer squared distances order pairs exactly like Euclidean distances
+- Part 1 takes the 1000 closest pairs; Part 2 stops at the first union that
+  leaves a single circuit
 """
 
-import heapq
-from typing import List, Tuple
+import math
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
+sys.path.append(str(Path(__file__).parent.parent))
 
-class UnionFind:
-    """Union-Find data structure for tracking connected components."""
+from utils import UnionFind, parse_int_array  # noqa: E402
 
-    def __init__(self, n: int):
-        """Initialize with n separate components."""
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.size = [1] * n
+ENGINES = ("grid", "numpy")
 
-    def find(self, x: int) -> int:
-        """Find root of component containing x with path compression."""
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+# numpy_pairs() computes this many squared distances per block (32 MB of int64)
+NUMPY_BLOCK = 1 << 22
+NOT_A_PAIR = np.iinfo(np.int64).max  # Marks the unused lower triangle of a block
 
-    def union(self, x: int, y: int) -> bool:
-        """
-        Union components containing x and y.
-        Returns True if they were in different components, False if already connected.
-        """
-        root_x = self.find(x)
-        root_y = self.find(y)
+# Half of the 26 neighbouring cells, so each pair of cells is compared once
+FORWARD_CELLS = [
+    (dx, dy, dz)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    for dz in (-1, 0, 1)
+    if (dx, dy, dz) > (0, 0, 0)
+]
 
-        if root_x == root_y:
-            return False
 
-        # Union by rank
-        if self.rank[root_x] < self.rank[root_y]:
-            root_x, root_y = root_y, root_x
+def closest_pairs(positions: List[Tuple[int, int, int]]) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield every pair of positions as (squared distance, i, j), shortest first.
 
-        self.parent[root_y] = root_x
-        self.size[root_x] += self.size[root_y]
+    Works in rounds of growing radius. Each round buckets the points into grid
+    cells as wide as the radius, so partners within it are in the same or an
+    adjacent cell, then sorts and yields the pairs between the previous radius
+    and this one. Ties are ordered by (i, j), as a full sort would order them.
 
-        if self.rank[root_x] == self.rank[root_y]:
-            self.rank[root_x] += 1
+    The first radius assumes evenly spread points, which clusters and outliers
+    break, so a round that would hold more than max(4n, 8 * pairs yielded so
+    far) pairs is abandoned and retried with the radius halfway back to the
+    last one. Rounds stay geometric (doubling a radius in 3D holds about 8x the
+    pairs), and memory follows what the caller consumes rather than n^2.
 
-        return True
+    Args:
+        positions: (x, y, z) points
 
-    def get_component_sizes(self) -> List[int]:
-        """Get sizes of all connected components."""
-        roots = {}
-        for i in range(len(self.parent)):
-            root = self.find(i)
-            if root not in roots:
-                roots[root] = self.size[root]
-        return list(roots.values())
+    Yields:
+        (squared distance, i, j) with i < j
+    """
+    n = len(positions)
+    if n < 2:
+        return
+
+    spans = [max(axis) - min(axis) + 1 for axis in zip(*positions)]
+    farthest = sum((span - 1) ** 2 for span in spans)
+    # Start where evenly spread points would have about n pairs in range
+    radius = max(1, int((3 * math.prod(spans) / (2 * math.pi * n)) ** (1 / 3)))
+
+    done = 0  # Radius whose pairs have all been yielded
+    yielded = 0
+    while done * done < farthest:
+        batch = _pairs_between(positions, done, radius, max(4 * n, 8 * yielded))
+        if batch is None:
+            radius = done + (radius - done) // 2
+            continue
+        batch.sort()
+        yield from batch
+        yielded += len(batch)
+        done = radius
+        radius *= 2
+
+
+def _pairs_between(
+    positions: List[Tuple[int, int, int]], inner: int, outer: int, cap: int
+) -> Optional[List[Tuple[int, int, int]]]:
+    """
+    Pairs with inner^2 < squared distance <= outer^2, unsorted.
 
-    def count_components(self) -> int:
-        """Count number of distinct connected components."""
-        roots = set()
-        for i in range(len(self.parent)):
-            roots.add(self.find(i))
-        return len(roots)
+    Returns None as soon as there are more than cap of them, unless outer is
+    already the smallest step past inner (then the pairs are all needed next).
+    """
+    covered, limit = (inner * inner if inner else -1), outer * outer  # 0 is a distance too
+    capped = outer > inner + 1
+    cells: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+    for index, (x, y, z) in enumerate(positions):
+        cells[x // outer, y // outer, z // outer].append(index)
+
+    batch = []
+    for (cx, cy, cz), members in cells.items():
+        for a, i in enumerate(members):
+            xi, yi, zi = positions[i]
+            for j in members[a + 1 :]:
+                xj, yj, zj = positions[j]
+                dist = (xi - xj) ** 2 + (yi - yj) ** 2 + (zi - zj) ** 2
+                if covered < dist <= limit:
+                    batch.append((dist, i, j))
+            if capped and len(batch) > cap:
+                return None
+        for dx, dy, dz in FORWARD_CELLS:
+            others = cells.get((cx + dx, cy + dy, cz + dz))
+            if others is None:
+                continue
+            for i in members:
+                xi, yi, zi = positions[i]
+                for j in others:
+                    xj, yj, zj = positions[j]
+                    dist = (xi - xj) ** 2 + (yi - yj) ** 2 + (zi - zj) ** 2
+                    if covered < dist <= limit:
+                        batch.append((dist, i, j) if i < j else (dist, j, i))
+                if capped and len(batch) > cap:
+                    return None
+    return batch
+
+
+def distance_blocks(coords: np.ndarray) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield the upper triangle of the squared distance matrix a block of rows at a time.
 
+    Args:
+        coords: int64 array of shape (n, 3)
 
-def parse_input(input_file: str) -> List[Tuple[int, int, int]]:
+    Yields:
+        (start, dist) where dist[r, c] is the squared distance of the pair
+        (start + r, start + 1 + c), and NOT_A_PAIR where that would have j <= i
     """
-    Parse junction box positions from input file.
+    n = len(coords)
+    rows_per_block = max(1, NUMPY_BLOCK // n)
+    for start in range(0, n - 1, rows_per_block):
+        stop = min(start + rows_per_block, n - 1)
+        rows, cols = coords[start:stop], coords[start + 1 :]
+        dist = np.zeros((stop - start, n - start - 1), dtype=np.int64)
+        delta = np.empty_like(dist)
+        for axis in range(coords.shape[1]):
+            np.subtract(rows[:, axis, None], cols[None, :, axis], out=delta)
+            np.multiply(delta, delta, out=delta)
+            dist += delta
+        dist[np.tril_indices(stop - start, -1, n - start - 1)] = NOT_A_PAIR
+        yield start, dist
+
+
+def numpy_pairs(
+    positions: List[Tuple[int, int, int]], limit: Optional[int] = None
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield pairs as (squared distance, i, j) in closest_pairs() order, using NumPy.
+
+    Distances are computed in blocks of rows so temporaries stay around
+    NUMPY_BLOCK entries. With a limit, argpartition cuts each block down to the
+    pairs no farther than its limit-th closest before they are merged into the
+    running candidates, so only O(limit) pairs are kept. Without one every pair
+    is kept, which is O(n^2) memory; growing_numpy_pairs() streams all pairs
+    with bounded memory instead. Survivors are ordered by one argsort of int64
+    (distance, i, j) keys.
 
     Args:
-        input_file: Path to the input file
+        positions: (x, y, z) points
+        limit: Only yield the closest limit pairs (all pairs if None)
 
-    Returns:
-        List of (x, y, z) tuples representing junction box positions
+    Yields:
+        (squared distance, i, j) with i < j, shortest first
     """
-    positions = []
-    with open(input_file) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            x, y, z = map(int, line.split(","))
-            positions.append((x, y, z))
-    return positions
+    coords = np.asarray(positions, dtype=np.int64).reshape(-1, 3)
+    n = len(coords)
+    if n < 2 or limit == 0:
+        return
+
+    found: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    for start, block in distance_blocks(coords):
+        flat = block.ravel()
+        if limit is not None and len(flat) > limit:
+            # Keep ties with the cutoff; (i, j) decides between them later
+            cutoff = flat[np.argpartition(flat, limit - 1)[limit - 1]]
+            index = np.flatnonzero(flat <= cutoff)
+        else:
+            index = np.flatnonzero(flat != NOT_A_PAIR)
+        row, col = np.divmod(index, block.shape[1])
+        found.append((flat[index], row + start, col + start + 1))
+
+        if limit is not None and len(found) > 1:
+            found = [_closest(*(np.concatenate(parts) for parts in zip(*found)), limit)]
+
+    dist, first, second = (np.concatenate(parts) for parts in zip(*found))
+    keep = dist != NOT_A_PAIR
+    dist, first, second = dist[keep], first[keep], second[keep]
+
+    if int(dist.max()) < np.iinfo(np.int64).max // (n * n):
+        order = np.argsort((dist * n + first) * n + second)
+    else:
+        order = np.lexsort((second, first, dist))  # Keys would overflow int64
+    if limit is not None:
+        order = order[:limit]
 
+    for start in range(0, len(order), 4096):
+        chunk = order[start : start + 4096]
+        yield from zip(dist[chunk].tolist(), first[chunk].tolist(), second[chunk].tolist())
+
+
+def growing_numpy_pairs(positions: List[Tuple[int, int, int]]) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield all pairs in closest_pairs() order while only ever keeping O(n) of them.
 
-def euclidean_distance(p1: Tuple[int, int, int], p2: Tuple[int, int, int]) -> float:
-    """Calculate Euclidean distance between two 3D points."""
-    return ((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2 + (p1[2] - p2[2]) ** 2) ** 0.5
+    Calls numpy_pairs() with a limit of 4n pairs, doubling it whenever the caller
+    reads past the pairs already produced, so memory follows what is consumed
+    (part 2 usually stops after a few n pairs) instead of all n(n-1)/2 pairs.
+    The order is total, so each round's first pairs repeat the previous round's
+    and are skipped.
 
+    Args:
+        positions: (x, y, z) points
 
-def part1(input_file: str, num_connections: int = 1000) -> int:
+    Yields:
+        (squared distance, i, j) with i < j, shortest first
     """
-    Connect the closest pairs of junction boxes and find largest circuits.
+    total = len(positions) * (len(positions) - 1) // 2
+    limit = 4 * len(positions)
+    produced = 0
+    while produced < total:
+        for pair in islice(numpy_pairs(positions, limit), produced, None):
+            produced += 1
+            yield pair
+        limit *= 2
+
+
+def _closest(
+    dist: np.ndarray, first: np.ndarray, second: np.ndarray, limit: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Drop candidate pairs farther than the limit-th closest (ties are kept)."""
+    if len(dist) <= limit:
+        return dist, first, second
+    keep = dist <= dist[np.argpartition(dist, limit - 1)[limit - 1]]
+    return dist[keep], first[keep], second[keep]
+
+
+@dataclass
+class Playground:
+    """Junction box positions plus the closest pairs found so far, shared by both parts."""
+
+    positions: List[Tuple[int, int, int]]
+    _pairs: List[Tuple[int, int, int]] = field(default_factory=list, init=False, repr=False)
+    _source: Iterator[Tuple[int, int, int]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._source = closest_pairs(self.positions)
+
+    def edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Pairs as (squared distance, i, j), shortest first, generated only as needed."""
+        index = 0
+        while True:
+            if index == len(self._pairs):
+                pair = next(self._source, None)
+                if pair is None:
+                    return
+                self._pairs.append(pair)
+            yield self._pairs[index]
+            index += 1
+
+
+def pairs_for(
+    playground: Playground, engine: str, limit: Optional[int] = None
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Closest pairs from the chosen engine.
+
+    Args:
+        playground: Parsed input from parse_input()
+        engine: "grid" (lazy, shared between parts) or "numpy" (vectorised, with
+            a doubling limit when none is given)
+        limit: Number of pairs the caller needs at most, if known
+
+    Returns:
+        Iterator of (squared distance, i, j), shortest first
+
+    Raises:
+        ValueError: If engine is unknown
+    """
+    if engine == "grid":
+        return playground.edges()
+    if engine == "numpy":
+        if limit is None:
+            return growing_numpy_pairs(playground.positions)
+        return numpy_pairs(playground.positions, limit)
+    raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+
+
+def parse_input(input_file: str) -> Playground:
+    """
+    Parse junction box positions from input file.
 
     Args:
         input_file: Path to the input file
-        num_connections: Number of connections to make (default 1000)
 
     Returns:
-        Product of three largest circuit sizes
+        Playground holding the (x, y, z) junction box positions
     """
-    positions = parse_input(input_file)
-    n = len(positions)
+    return Playground(parse_int_array(input_file, arity=3))
 
-    # Build list of all pairwise distances with junction box indices
-    edges = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = euclidean_distance(positions[i], positions[j])
-            edges.append((dist, i, j))
 
-    # Sort by distance (smallest first) using heapq for efficiency
-    heapq.heapify(edges)
+def solve_part1(playground: Playground, num_connections: int = 1000, engine: str = "grid") -> int:
+    """
+    Connect the closest pairs of junction boxes and find largest circuits.
+
+    Args:
+        playground: Parsed input from parse_input()
+        num_connections: Number of connections to make (default 1000)
+        engine: Pair generator, one of ENGINES
 
-    # Initialize Union-Find
-    uf = UnionFind(n)
+    Returns:
+        Product of three largest circuit sizes
+    """
+    uf = UnionFind(len(playground.positions))
 
     # Try to connect the num_connections closest pairs
     # Count all attempts, not just successful ones
-    for _ in range(min(num_connections, len(edges))):
-        if edges:
-            dist, i, j = heapq.heappop(edges)
-            uf.union(i, j)  # May or may not succeed if already connected
-
-    # Get all component sizes
-    component_sizes = uf.get_component_sizes()
+    for dist, i, j in islice(pairs_for(playground, engine, num_connections), num_connections):
+        uf.union(i, j)  # May or may not succeed if already connected
 
-    # Find three largest components
-    component_sizes.sort(reverse=True)
+    # Three largest components, from the size histogram the union-find keeps
+    first, second, third = uf.largest(3)
+    return first * second * third
 
-    return component_sizes[0] * component_sizes[1] * component_sizes[2]
 
-
-def part2(input_file: str) -> int:
+def solve_part2(playground: Playground, engine: str = "grid") -> int:
     """
     Connect junction boxes until all form a single circuit.
 
     Args:
-        input_file: Path to the input file
+        playground: Parsed input from parse_input()
+        engine: Pair generator, one of ENGINES
 
     Returns:
         Product of X coordinates of the last two junction boxes connected
     """
-    positions = parse_input(input_file)
-    n = len(positions)
-
-    # Build list of all pairwise distances with junction box indices
-    edges = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = euclidean_distance(positions[i], positions[j])
-            edges.append((dist, i, j))
-
-    # Sort by distance (smallest first)
-    edges.sort()
-
-    # Initialize Union-Find
-    uf = UnionFind(n)
+    positions = playground.positions
+    uf = UnionFind(len(positions))
 
     # Keep connecting until we have a single component
     last_i, last_j = -1, -1
-    for dist, i, j in edges:
+    for dist, i, j in pairs_for(playground, engine):
         if uf.union(i, j):
             last_i, last_j = i, j
-            # Check if all boxes are now in one circuit
-            if uf.count_components() == 1:
+            if uf.components == 1:  # All boxes are now in one circuit
                 break
 
     # Return product of X coordinates
     return positions[last_i][0] * positions[last_j][0]
 
 
+def part1(input_file: str, num_connections: int = 1000, engine: str = "grid") -> int:
+    """Solve Part 1 from an input file."""
+    return solve_part1(parse_input(input_file), num_connections, engine)
+
+
+def part2(input_file: str, engine: str = "grid") -> int:
+    """Solve Part 2 from an input file."""
+    return solve_part2(parse_input(input_file), engine)
+
+
 def main():
     """Main execution function."""
     from unit_tests import run_tests
 
     if run_tests():
         print("\nAll tests passed! Running actual solution...\n")
-        result1 = part1("input.txt")
-        result2 = part2("input.txt")
+        data = parse_input("input.txt")
+        result1 = solve_part1(data)
+        result2 = solve_part2(data)
         print(f"Part 1: {result1}")
         print(f"Part 2: {result2}")
     else:
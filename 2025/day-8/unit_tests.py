@@ -1,8 +1,37 @@
 """Unit tests for Day 8: Playground."""
 
 import os
+import random
+import tracemalloc
 import unittest
+from itertools import islice
 from textwrap import dedent
+from unittest import mock
+
+EXAMPLE = dedent(
+    """\
+    162,817,812
+    57,618,57
+    906,360,560
+    592,479,940
+    352,342,300
+    466,668,158
+    542,29,236
+    431,825,988
+    739,650,466
+    52,470,668
+    216,146,977
+    819,987,18
+    117,168,530
+    805,96,715
+    346,949,466
+    970,615,88
+    941,993,340
+    862,61,35
+    984,92,344
+    425,690,689
+    """
+)
 
 
 class TestDay8(unittest.TestCase):
@@ -94,6 +123,119 @@ class TestDay8(unittest.TestCase):
         result = part2(self.test_file)
         self.assertEqual(result, 25272, "Should get 25272 from multiplying X coords 216 * 117")
 
+    def test_example_numpy_engine(self):
+        """The NumPy pair engine gives the same example answers."""
+        with open(self.test_file, "w") as f:
+            f.write(EXAMPLE)
+
+        from solution import part1, part2
+
+        self.assertEqual(part1(self.test_file, num_connections=10, engine="numpy"), 40)
+        self.assertEqual(part2(self.test_file, engine="numpy"), 25272)
+
+    def test_unknown_engine(self):
+        """An unknown engine name is rejected."""
+        with open(self.test_file, "w") as f:
+            f.write(EXAMPLE)
+
+        from solution import part1, part2
+
+        with self.assertRaises(ValueError):
+            part1(self.test_file, num_connections=10, engine="scipy")
+        with self.assertRaises(ValueError):
+            part2(self.test_file, engine="scipy")
+
+    def test_numpy_pairs_match_grid_across_blocks(self):
+        """Small NumPy blocks still yield closest_pairs() order, ties included."""
+        import solution
+
+        rng = random.Random(8)
+        # A small coordinate range makes many equal distances
+        positions = [tuple(rng.randrange(6) for _ in range(3)) for _ in range(40)]
+        expected = list(solution.closest_pairs(positions))
+
+        for block in (1, 7, 64):
+            with mock.patch.object(solution, "NUMPY_BLOCK", block):
+                for limit in (1, 5, 37, 200, len(expected), None):
+                    with self.subTest(block=block, limit=limit):
+                        self.assertEqual(
+                            list(solution.numpy_pairs(positions, limit)),
+                            list(islice(expected, limit)),
+                        )
+
+    def test_growing_numpy_pairs_match_grid(self):
+        """The doubling-limit stream yields every pair in closest_pairs() order."""
+        import solution
+
+        rng = random.Random(21)
+        positions = [tuple(rng.randrange(-4, 4) for _ in range(3)) for _ in range(30)]
+        self.assertEqual(
+            list(solution.growing_numpy_pairs(positions)),
+            list(solution.closest_pairs(positions)),
+        )
+
+    def test_numpy_part2_keeps_a_limit(self):
+        """Part 2 with the NumPy engine never asks for all pairs at once."""
+        import solution
+
+        with open(self.test_file, "w") as f:
+            f.write(EXAMPLE)
+
+        limits = []
+        real_numpy_pairs = solution.numpy_pairs
+
+        def recording_numpy_pairs(positions, limit=None):
+            limits.append(limit)
+            return real_numpy_pairs(positions, limit)
+
+        with mock.patch.object(solution, "numpy_pairs", recording_numpy_pairs):
+            self.assertEqual(solution.part2(self.test_file, engine="numpy"), 25272)
+        self.assertTrue(limits)
+        self.assertNotIn(None, limits)
+
+    def test_closest_pairs_match_full_sort(self):
+        """Lazy rounds yield exactly the fully sorted pair list."""
+        import solution
+
+        rng = random.Random(9)
+        cases = {
+            "ties": [tuple(rng.randrange(3) for _ in range(3)) for _ in range(30)],
+            "duplicates": [(5, 5, 5)] * 6 + [(5, 5, 6), (9, 9, 9)],
+            "negative": [tuple(rng.randrange(-500, 500) for _ in range(3)) for _ in range(60)],
+            "collinear": [(3 * k, -2 * k, 7) for k in range(-20, 25)],
+            "outlier": [tuple(rng.randrange(1000) for _ in range(3)) for _ in range(80)]
+            + [(10**9, 10**9, 10**9)],
+            "single": [(1, 2, 3)],
+        }
+        for name, positions in cases.items():
+            expected = sorted(
+                (sum((a - b) ** 2 for a, b in zip(positions[i], positions[j])), i, j)
+                for i in range(len(positions))
+                for j in range(i + 1, len(positions))
+            )
+            with self.subTest(case=name):
+                self.assertEqual(list(solution.closest_pairs(positions)), expected)
+
+    def test_closest_pairs_outlier_stays_small(self):
+        """One far outlier doesn't make the first round build every pair."""
+        import solution
+
+        rng = random.Random(10)
+        positions = [tuple(rng.randrange(1000) for _ in range(3)) for _ in range(1199)]
+        positions.append((10**9, 10**9, 10**9))
+
+        tracemalloc.start()
+        try:
+            pairs = list(islice(solution.closest_pairs(positions), 1000))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(pairs), 1000)
+        self.assertEqual(pairs, sorted(pairs))
+        # Building all ~720k pairs at once peaked near 100 MB
+        self.assertLess(peak, 16 * 1024 * 1024, f"Peak allocation {peak} bytes")
+
 
 def run_tests():
     """Run all tests and return success status."""
@@ -7,6 +7,29 @@ from textwrap import dedent
 from solution import parse_input, part1, part2
 
 
+def brute_force_part2(red_tiles):
+    """Largest red-cornered rectangle whose tiles are all inside or on the loop."""
+    edges = list(zip(red_tiles, red_tiles[1:] + red_tiles[:1]))
+
+    def allowed(x, y):
+        inside = False
+        for (x1, y1), (x2, y2) in edges:
+            if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+                return True
+            if x1 == x2 > x and min(y1, y2) <= y < max(y1, y2):
+                inside = not inside
+        return inside
+
+    best = 0
+    for i, (x1, y1) in enumerate(red_tiles):
+        for x2, y2 in red_tiles[i + 1 :]:
+            xs = range(min(x1, x2), max(x1, x2) + 1)
+            ys = range(min(y1, y2), max(y1, y2) + 1)
+            if all(allowed(x, y) for x in xs for y in ys):
+                best = max(best, len(xs) * len(ys))
+    return best
+
+
 class TestDay9(unittest.TestCase):
     """Test cases for Day 9 solution."""
 
@@ -119,6 +142,36 @@ class TestDay9(unittest.TestCase):
         result = part2(self.test_file)
         self.assertEqual(result, 24, "Largest valid rectangle should have area 24")
 
+    def test_part2_notch(self):
+        """Test Part 2 when the largest pair of corners spans a notch in the loop."""
+        with open(self.test_file, "w") as f:
+            f.write(
+                dedent(
+                    """\
+                    0,0
+                    10,0
+                    10,8
+                    6,8
+                    6,3
+                    4,3
+                    4,8
+                    0,8
+                    """
+                )
+            )
+        tiles = parse_input(self.test_file)
+        self.assertEqual(part1(self.test_file), 99, "Outer corners enclose the notch")
+        self.assertEqual(part2(self.test_file), 45)
+        self.assertEqual(part2(self.test_file), brute_force_part2(tiles))
+
+    def test_part2_comb(self):
+        """Test Part 2 on a comb with several notches against a brute-force scan."""
+        tiles = [(0, 0), (14, 0), (14, 9), (12, 9), (12, 2), (9, 2), (9, 6), (7, 6)]
+        tiles += [(7, 2), (4, 2), (4, 9), (2, 9), (2, 4), (0, 4)]
+        with open(self.test_file, "w") as f:
+            f.write("".join(f"{x},{y}\n" for x, y in tiles))
+        self.assertEqual(part2(self.test_file), brute_force_part2(tiles))
+
 
 def run_tests():
     """Run all tests and return True if all pass."""
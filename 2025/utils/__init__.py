@@ -4,26 +4,105 @@ Advent of Code 2025 - Utility Library
 Common utilities for solving Advent of Code puzzles.
 """
 
-from .grid import ALL_DIRS, CARDINAL_DIRS, Direction, Grid, get_neighbors, in_bounds
-from .parsing import parse_coords, parse_grid, parse_ints, parse_sections
-from .search import a_star, bfs, dfs, dijkstra
+from .grid import (
+    ALL_DIRS,
+    CARDINAL_DIRS,
+    ArrayGrid,
+    Direction,
+    FlatGrid,
+    Grid,
+    get_neighbors,
+    in_bounds,
+    neighbor_counts,
+)
+from .parsing import (
+    cached_parse,
+    clear_parse_cache,
+    iter_blocks,
+    iter_key_values,
+    iter_lines,
+    iter_records,
+    parse_coords,
+    parse_grid,
+    parse_int_array,
+    parse_ints,
+    parse_sections,
+)
+from .polygon import RectilinearPolygon
+from .search import (
+    CSRGraph,
+    InternedGraph,
+    PathCounter,
+    SearchStats,
+    a_star,
+    bfs,
+    bfs_csr,
+    bfs_indexed,
+    bidirectional_a_star,
+    bidirectional_bfs,
+    count_paths,
+    dfs,
+    dial_dijkstra,
+    dijkstra,
+    dijkstra_csr,
+    distance_field,
+    find_all_paths_dfs,
+    iter_all_paths_bfs,
+    jump_point_search,
+    multi_source_bfs,
+    shortest_path_dag,
+    zero_one_bfs,
+)
+from .unionfind import UnionFind
 
 __all__ = [
     # Grid utilities
     "Grid",
+    "ArrayGrid",
+    "FlatGrid",
     "Direction",
     "CARDINAL_DIRS",
     "ALL_DIRS",
     "in_bounds",
     "get_neighbors",
+    "neighbor_counts",
     # Search algorithms
     "bfs",
+    "bfs_indexed",
+    "bfs_csr",
+    "multi_source_bfs",
+    "distance_field",
     "dfs",
     "dijkstra",
+    "shortest_path_dag",
+    "dijkstra_csr",
+    "zero_one_bfs",
+    "dial_dijkstra",
+    "CSRGraph",
+    "InternedGraph",
     "a_star",
+    "bidirectional_bfs",
+    "bidirectional_a_star",
+    "jump_point_search",
+    "find_all_paths_dfs",
+    "iter_all_paths_bfs",
+    "count_paths",
+    "PathCounter",
+    "SearchStats",
+    # Union-Find
+    "UnionFind",
+    # Polygons
+    "RectilinearPolygon",
     # Parsing utilities
     "parse_grid",
     "parse_sections",
     "parse_ints",
+    "parse_int_array",
     "parse_coords",
+    "cached_parse",
+    "clear_parse_cache",
+    "iter_lines",
+    "iter_blocks",
+    "iter_records",
+    "iter_key_values",
 ]
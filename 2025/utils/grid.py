@@ -5,7 +5,10 @@ Common patterns from AoC 2024: Days 4, 6, 8, 10, 12, 15, 16, 18, 20
 """
 
 from enum import Enum
-from typing import Callable, List, Optional, Tuple
+from functools import cached_property
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 
 class Direction(Enum):
@@ -116,6 +119,29 @@ def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
     return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
 
+def neighbor_counts(mask: np.ndarray, diagonal: bool = False) -> np.ndarray:
+    """
+    Count, for every cell of a boolean mask, how many of its neighbours are set.
+
+    Computed as a sum of shifted copies of the zero-padded mask, so cells on the
+    border simply have fewer neighbours.
+
+    Args:
+        mask: 2D boolean array
+        diagonal: Count all 8 neighbours instead of the 4 cardinal ones
+
+    Returns:
+        uint8 array with the mask's shape
+    """
+    rows, cols = mask.shape
+    padded = np.pad(mask.astype(np.uint8), 1)
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for direction in ALL_DIRS if diagonal else CARDINAL_DIRS:
+        dr, dc = direction.value
+        counts += padded[1 + dr : 1 + dr + rows, 1 + dc : 1 + dc + cols]
+    return counts
+
+
 class Grid:
     """
     Grid wrapper with common operations.
@@ -265,3 +291,281 @@ class Grid:
     def __str__(self) -> str:
         """String representation."""
         return "\n".join("".join(row) for row in self.data)
+
+
+class FlatGrid:
+    """
+    Grid whose cells are addressed by a single int index row * cols + col.
+
+    Neighbour tables are precomputed once with walls filtered out, so searches
+    can iterate plain int tuples and keep visited/distance state in flat
+    array/bytearray buffers (see utils.search.bfs_indexed) instead of hashing
+    (row, col) tuples at every step.
+
+    Example usage:
+        grid = FlatGrid.from_file('input.txt')
+        distances, _ = bfs_indexed(grid.find('S'), grid.neighbors())
+        steps = distances[grid.find('E')]
+    """
+
+    def __init__(self, lines: List[str], walls: str = "#"):
+        """
+        Initialize grid.
+
+        Args:
+            lines: Equal-length row strings
+            walls: Characters that cannot be entered
+        """
+        self.rows = len(lines)
+        self.cols = len(lines[0]) if lines else 0
+        self.size = self.rows * self.cols
+        self.cells = "".join(lines)
+        self.walls = walls
+        self.passable = bytearray(char not in walls for char in self.cells)
+
+    @classmethod
+    def from_file(cls, filename: str, walls: str = "#") -> "FlatGrid":
+        """
+        Create grid from file.
+
+        Args:
+            filename: Path to input file
+            walls: Characters that cannot be entered
+
+        Returns:
+            FlatGrid instance
+        """
+        with open(filename) as f:
+            return cls([line.strip() for line in f if line.strip()], walls)
+
+    @classmethod
+    def from_grid(cls, grid: Grid, walls: str = "#") -> "FlatGrid":
+        """Create a FlatGrid from a list-backed Grid."""
+        return cls(["".join(row) for row in grid.data], walls)
+
+    def index(self, row: int, col: int) -> int:
+        """Flat index of (row, col)."""
+        return row * self.cols + col
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """(row, col) of a flat index."""
+        return divmod(index, self.cols)
+
+    def find(self, char: str) -> Optional[int]:
+        """Flat index of the first occurrence of char, or None."""
+        index = self.cells.find(char)
+        return index if index >= 0 else None
+
+    def find_all(self, char: str) -> List[int]:
+        """Flat indices of all occurrences of char."""
+        return [i for i, cell in enumerate(self.cells) if cell == char]
+
+    def neighbors(self, diagonal: bool = False) -> List[Tuple[int, ...]]:
+        """
+        Neighbour table: entry i holds the passable neighbours of cell i.
+
+        Wall cells have no neighbours. Order follows CARDINAL_DIRS / ALL_DIRS.
+
+        Args:
+            diagonal: Include diagonal neighbours
+
+        Returns:
+            List of neighbour index tuples, one per cell
+        """
+        return self._all_neighbors if diagonal else self._cardinal_neighbors
+
+    @cached_property
+    def _cardinal_neighbors(self) -> List[Tuple[int, ...]]:
+        """Cardinal neighbour table, built on first use."""
+        return self._build_neighbors(CARDINAL_DIRS)
+
+    @cached_property
+    def _all_neighbors(self) -> List[Tuple[int, ...]]:
+        """8-way neighbour table, built on first use."""
+        return self._build_neighbors(ALL_DIRS)
+
+    def _build_neighbors(self, directions: List[Direction]) -> List[Tuple[int, ...]]:
+        """Build the neighbour table for a set of directions."""
+        rows, cols, passable = self.rows, self.cols, self.passable
+        offsets = [direction.value for direction in directions]
+        table = []
+        for index in range(self.size):
+            if not passable[index]:
+                table.append(())
+                continue
+            row, col = divmod(index, cols)
+            table.append(
+                tuple(
+                    (row + dr) * cols + col + dc
+                    for dr, dc in offsets
+                    if 0 <= row + dr < rows
+                    and 0 <= col + dc < cols
+                    and passable[(row + dr) * cols + col + dc]
+                )
+            )
+        return table
+
+    def __getitem__(self, index: int) -> str:
+        """Character at a flat index."""
+        return self.cells[index]
+
+    def __str__(self) -> str:
+        """String representation."""
+        return "\n".join(
+            self.cells[start : start + self.cols] for start in range(0, self.size, self.cols)
+        )
+
+
+class ArrayGrid:
+    """
+    Grid stored as a NumPy array of uint8 character codes.
+
+    Whole-grid queries (find_all, masks, neighbour counts) are vectorized, and
+    row/col return views into the array rather than copies. Use this instead of
+    Grid for cellular-automaton style updates over the whole grid.
+
+    Example usage:
+        grid = ArrayGrid.from_file('input.txt')
+        rolls = grid.mask('@')
+        crowded = rolls & (grid.neighbor_counts(rolls, diagonal=True) >= 4)
+    """
+
+    def __init__(self, codes: np.ndarray):
+        """
+        Initialize grid.
+
+        Args:
+            codes: 2D uint8 array of character codes
+        """
+        self.codes = codes
+        self.rows, self.cols = codes.shape
+
+    @classmethod
+    def from_lines(cls, lines: List[str]) -> "ArrayGrid":
+        """
+        Create grid from list of equal-length ASCII strings.
+
+        Args:
+            lines: List of strings
+
+        Returns:
+            ArrayGrid instance
+        """
+        if not lines:
+            return cls(np.zeros((0, 0), dtype=np.uint8))
+        raw = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        return cls(raw.reshape(len(lines), len(lines[0])).copy())
+
+    @classmethod
+    def from_file(cls, filename: str) -> "ArrayGrid":
+        """
+        Create grid from file.
+
+        Args:
+            filename: Path to input file
+
+        Returns:
+            ArrayGrid instance
+        """
+        with open(filename) as f:
+            return cls.from_lines([line.strip() for line in f if line.strip()])
+
+    @classmethod
+    def from_grid(cls, grid: Grid) -> "ArrayGrid":
+        """Create an ArrayGrid from a list-backed Grid."""
+        return cls.from_lines(["".join(row) for row in grid.data])
+
+    def to_grid(self) -> Grid:
+        """Convert to a list-backed Grid."""
+        return Grid.from_lines(str(self).split("\n") if self.rows else [])
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """Check if position is within bounds."""
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def get(self, row: int, col: int, default: Optional[str] = None) -> Optional[str]:
+        """Get character at position, or default if out of bounds."""
+        if self.in_bounds(row, col):
+            return chr(self.codes[row, col])
+        return default
+
+    def mask(self, chars: Union[str, Iterable[str]]) -> np.ndarray:
+        """
+        Boolean mask of cells holding any of the given characters.
+
+        Args:
+            chars: A single character or several characters (e.g. '#O' or ['#', 'O'])
+
+        Returns:
+            Boolean array with the grid's shape
+        """
+        codes = [ord(char) for char in chars]
+        if len(codes) == 1:
+            return self.codes == codes[0]
+        return np.isin(self.codes, codes)
+
+    def find(self, char: str) -> Optional[Tuple[int, int]]:
+        """
+        Find first occurrence of character in row-major order.
+
+        Args:
+            char: Character to find
+
+        Returns:
+            (row, col) tuple or None if not found
+        """
+        flat = np.flatnonzero(self.codes == ord(char))
+        if flat.size == 0:
+            return None
+        row, col = divmod(int(flat[0]), self.cols)
+        return (row, col)
+
+    def find_all(self, char: str) -> List[Tuple[int, int]]:
+        """
+        Find all occurrences of character in row-major order.
+
+        Args:
+            char: Character to find
+
+        Returns:
+            List of (row, col) tuples
+        """
+        return [(int(r), int(c)) for r, c in np.argwhere(self.codes == ord(char))]
+
+    def neighbor_counts(self, cells: Union[str, np.ndarray], diagonal: bool = False) -> np.ndarray:
+        """
+        Count, for every cell, how many of its neighbours are set.
+
+        Args:
+            cells: Characters to count (see mask) or a boolean mask of the grid's shape
+            diagonal: Count all 8 neighbours instead of the 4 cardinal ones
+
+        Returns:
+            uint8 array with the grid's shape
+        """
+        mask = self.mask(cells) if isinstance(cells, str) else cells
+        return neighbor_counts(mask, diagonal)
+
+    def row(self, index: int) -> np.ndarray:
+        """View of one row's codes (writes go through to the grid)."""
+        return self.codes[index]
+
+    def col(self, index: int) -> np.ndarray:
+        """View of one column's codes (writes go through to the grid)."""
+        return self.codes[:, index]
+
+    def copy(self) -> "ArrayGrid":
+        """Create a deep copy of the grid."""
+        return ArrayGrid(self.codes.copy())
+
+    def __getitem__(self, key: Tuple[int, int]) -> str:
+        """Allow grid[row, col] syntax."""
+        return chr(self.codes[key])
+
+    def __setitem__(self, key: Tuple[int, int], value: str) -> None:
+        """Allow grid[row, col] = value syntax."""
+        self.codes[key] = ord(value)
+
+    def __str__(self) -> str:
+        """String representation."""
+        return "\n".join(row.tobytes().decode("ascii") for row in self.codes)
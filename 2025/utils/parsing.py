@@ -2,12 +2,161 @@
 Input parsing utilities for common AoC patterns.
 
 Common patterns from AoC 2024: All days
+
+File parsers are wrapped with @cached_parse, which stores their result on disk
+keyed by the input's content hash, so repeat runs skip parsing entirely.
+Set AOC_PARSE_CACHE=0 to disable, or AOC_PARSE_CACHE_DIR to move the cache.
+
+The iter_* parsers are streaming counterparts that yield lines, blocks or
+records lazily with memory bounded by one item; they are never cached.
 """
 
+import functools
+import hashlib
+import os
+import pickle
 import re
-from typing import Any, Callable, List, Optional, Tuple
+import types
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .search import InternedGraph
+
+CACHE_DIR = Path(
+    os.environ.get("AOC_PARSE_CACHE_DIR", Path(__file__).parent.parent / ".parse_cache")
+)
+
+# Argument types whose repr() is stable across runs and so can be part of a cache key
+_KEYABLE_TYPES = (str, int, float, bool, type(None))
+_KEYABLE_CALLABLES = (str, int, float, bool)
+
+# parse_int_array() byte tables: digits (and '-') are kept, everything else becomes a space
+_UNSIGNED_INT_BYTES = bytes(code if 48 <= code <= 57 else 32 for code in range(256))
+_SIGNED_INT_BYTES = bytes(code if 48 <= code <= 57 or code == 45 else 32 for code in range(256))
+# Runs of up to 18 digits always fit in int64; longer ones may not, and np.fromstring clamps them
+_LONG_DIGIT_RUN = re.compile(rb"[0-9]{19}")
+
+
+def _cache_enabled() -> bool:
+    """Whether the on-disk parse cache is switched on."""
+    return os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+
+def _arguments_key(args: tuple, kwargs: dict) -> Optional[str]:
+    """Stable representation of extra parser arguments, or None if uncacheable."""
+    values = list(args) + [value for _, value in sorted(kwargs.items())]
+    for value in values:
+        if not isinstance(value, _KEYABLE_TYPES) and value not in _KEYABLE_CALLABLES:
+            return None  # e.g. a lambda converter; its repr changes every run
+    return repr((args, sorted(kwargs.items())))
+
+
+def _constant_key(value: Any) -> str:
+    """repr() of a code constant that doesn't depend on set iteration order."""
+    if isinstance(value, frozenset):
+        return "frozenset(" + repr(sorted(map(_constant_key, value))) + ")"
+    if isinstance(value, tuple):
+        return "(" + ",".join(map(_constant_key, value)) + ")"
+    return repr(value)
+
+
+def _hash_code(digest: Any, code: types.CodeType) -> None:
+    """Feed a code object's bytecode, names and constants, recursing into nested code."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for value in code.co_consts:
+        if isinstance(value, types.CodeType):
+            _hash_code(digest, value)  # Lambdas, comprehensions, inner functions
+        else:
+            digest.update(_constant_key(value).encode())
+
+
+def _cache_path(parser: Callable, version: int, filename: str, extra: str) -> Path:
+    """Cache file for parsing filename with parser and the given extra arguments."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, "rb") as f:
+        digest.update(f.read())
+    code = parser.__code__
+    for part in (code.co_filename, parser.__qualname__, str(version), extra):
+        digest.update(part.encode())
+    # Editing the parser body, including its literals and the names it calls,
+    # invalidates its entries without a manual version bump
+    _hash_code(digest, code)
+    return CACHE_DIR / f"{parser.__name__}-{digest.hexdigest()}.pickle"
+
+
+def cached_parse(version: int = 1) -> Callable:
+    """
+    Decorator caching a file parser's result on disk.
+
+    The key combines the input file's content hash, the parser's location,
+    code (bytecode, constants and names, including nested functions) and
+    version, and any extra arguments. Results are pickled, so they must be built
+    from picklable types; anything that fails to load is simply reparsed. Each
+    call returns a fresh copy, so callers may mutate the result.
+
+    Args:
+        version: Bump to invalidate entries when a parser's output changes for
+            reasons its own code doesn't capture (e.g. a helper it calls)
 
+    Returns:
+        Decorator for functions taking the input path as the first argument
+
+    Example:
+        @cached_parse()
+        def parse_input(input_file: str):
+            ...
+    """
+
+    def decorator(parser: Callable) -> Callable:
+        @functools.wraps(parser)
+        def wrapper(filename: str, *args, **kwargs):
+            extra = _arguments_key(args, kwargs)
+            if not _cache_enabled() or extra is None:
+                return parser(filename, *args, **kwargs)
+
+            path = _cache_path(parser, version, filename, extra)
+            try:
+                with open(path, "rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # Missing, stale or unreadable entry
+
+            result = parser(filename, *args, **kwargs)
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp, "wb") as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)  # Atomic, so parallel runs never see partial files
+            except (OSError, pickle.PicklingError, TypeError, AttributeError):
+                pass  # Caching is best-effort
+            return result
+
+        wrapper.uncached = parser
+        return wrapper
+
+    return decorator
+
+
+def clear_parse_cache() -> int:
+    """
+    Delete all cached parse results.
 
+    Returns:
+        Number of cache files removed
+    """
+    removed = 0
+    for path in CACHE_DIR.glob("*.pickle"):
+        path.unlink()
+        removed += 1
+    return removed
+
+
+@cached_parse()
 def parse_grid(filename: str, converter: Callable[[str], Any] = str) -> List[List[Any]]:
     """
     Parse file into 2D grid.
@@ -38,6 +187,7 @@ def parse_grid(filename: str, converter: Callable[[str], Any] = str) -> List[Lis
         return [[converter(char) for char in line] for line in lines]
 
 
+@cached_parse()
 def parse_sections(filename: str) -> List[str]:
     """
     Parse file split by blank lines into sections.
@@ -105,6 +255,7 @@ def parse_coords(line: str, pattern: Optional[str] = None) -> Tuple[int, ...]:
     return tuple()
 
 
+@cached_parse()
 def parse_lines(filename: str, strip: bool = True, skip_empty: bool = True) -> List[str]:
     """
     Parse file into list of lines.
@@ -122,18 +273,10 @@ def parse_lines(filename: str, strip: bool = True, skip_empty: bool = True) -> L
         for line in lines:
             process(line)
     """
-    with open(filename) as f:
-        lines = f.readlines()
-
-    if strip:
-        lines = [line.strip() for line in lines]
-
-    if skip_empty:
-        lines = [line for line in lines if line]
-
-    return lines
+    return list(iter_lines(filename, strip, skip_empty))
 
 
+@cached_parse()
 def parse_blocks(filename: str) -> List[List[str]]:
     """
     Parse file into list of blocks (separated by blank lines).
@@ -154,7 +297,10 @@ def parse_blocks(filename: str) -> List[List[str]]:
     return [section.split("\n") for section in sections]
 
 
-def parse_graph(filename: str, directed: bool = False, separator: str = "-") -> dict:
+@cached_parse()
+def parse_graph(
+    filename: str, directed: bool = False, separator: str = "-", interned: bool = False
+) -> Union[dict, InternedGraph]:
     """
     Parse file into adjacency list graph.
 
@@ -162,21 +308,24 @@ def parse_graph(filename: str, directed: bool = False, separator: str = "-") ->
         filename: Path to input file
         directed: Create directed graph if True
         separator: Character(s) separating nodes in each line
+        interned: Return an InternedGraph (int ids, CSR arrays and, for small
+            graphs, neighbour bitmasks) instead of a dict of names
 
     Returns:
-        Dictionary mapping nodes to lists of neighbors
+        Dictionary mapping nodes to lists of neighbors, or an InternedGraph
 
     Example:
         # Input: "A-B\nB-C\nA-C"
         graph = parse_graph('input.txt')
         # {'A': ['B', 'C'], 'B': ['A', 'C'], 'C': ['B', 'A']}
+        graph = parse_graph('input.txt', interned=True)
+        # graph.names == ['A', 'B', 'C'], graph.neighbors(graph.id('A')) == array('i', [1, 2])
     """
     from collections import defaultdict
 
     graph = defaultdict(list)
-    lines = parse_lines(filename)
 
-    for line in lines:
+    for line in iter_lines(filename):
         parts = line.split(separator)
         if len(parts) == 2:
             a, b = parts[0].strip(), parts[1].strip()
@@ -184,9 +333,12 @@ def parse_graph(filename: str, directed: bool = False, separator: str = "-") ->
             if not directed:
                 graph[b].append(a)
 
+    if interned:
+        return InternedGraph.from_adjacency(graph)
     return dict(graph)
 
 
+@cached_parse()
 def parse_key_value(filename: str, separator: str = ":") -> dict:
     """
     Parse file with key-value pairs.
@@ -203,17 +355,10 @@ def parse_key_value(filename: str, separator: str = ":") -> dict:
         data = parse_key_value('input.txt')
         # {'name': 'John', 'age': '30'}
     """
-    data = {}
-    lines = parse_lines(filename)
-
-    for line in lines:
-        if separator in line:
-            key, value = line.split(separator, 1)
-            data[key.strip()] = value.strip()
-
-    return data
+    return dict(iter_key_values(filename, separator))
 
 
+@cached_parse()
 def parse_csv(filename: str, delimiter: str = ",", skip_header: bool = False) -> List[List[str]]:
     """
     Parse CSV-like file.
@@ -231,9 +376,169 @@ def parse_csv(filename: str, delimiter: str = ",", skip_header: bool = False) ->
         for row in rows:
             process(row)
     """
-    lines = parse_lines(filename)
+    return list(iter_records(filename, delimiter, skip_header))
+
+
+@cached_parse()
+def parse_int_array(
+    filename: str, arity: Optional[int] = None, signed: bool = True, as_numpy: bool = False
+) -> Union[array, List[Tuple[int, ...]], np.ndarray]:
+    """
+    Extract every integer in a file in one pass over its bytes.
+
+    Every byte that can't be part of a number is translated to a space and the
+    result is split or handed to NumPy, all in C, so no regex match or line
+    object is created per number. Integers are found as parse_ints() finds them:
+    with signed=True, '-' directly before a digit is a minus sign (so "3-5" is
+    3 and -5; use signed=False for ranges).
+
+    Args:
+        filename: Path to input file
+        arity: Group the integers into records of this many (e.g. 3 for x,y,z
+            lines); the count must divide evenly
+        signed: Treat '-' before a digit as a minus sign
+        as_numpy: Return an int64 NumPy array (shape (n, arity) if arity is given)
+
+    Every integer must fit in int64 (-2**63 to 2**63 - 1) in all modes; use
+    parse_ints() for bigger values.
+
+    Returns:
+        array('q') of all integers, a list of arity-tuples, or a NumPy array
+
+    Raises:
+        OverflowError: If an integer doesn't fit in int64
+        ValueError: If the number of integers isn't a multiple of arity
+
+    Example:
+        points = parse_int_array('input.txt', arity=3)  # [(162, 817, 812), ...]
+        coords = parse_int_array('input.txt', arity=3, as_numpy=True)  # shape (n, 3)
+    """
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    data = data.translate(_SIGNED_INT_BYTES if signed else _UNSIGNED_INT_BYTES)
+    if signed:
+        # Split "3-5" into "3 -5", then drop minus signs with no digit after them
+        data = (data + b" ").replace(b"-", b" -").replace(b"- ", b" ")
+
+    if as_numpy and not _LONG_DIGIT_RUN.search(data):
+        # strip(): NumPy reads whitespace-only input as a single 0
+        values = np.fromstring(data.strip(), dtype=np.int64, sep=" ")
+    else:
+        values = array("q", map(int, data.split()))  # Raises OverflowError past int64
+        if as_numpy:
+            values = np.array(values, dtype=np.int64)
+
+    if arity is None:
+        return values
+    if len(values) % arity:
+        raise ValueError(f"{len(values)} integers don't split into records of {arity}")
+    if as_numpy:
+        return values.reshape(-1, arity)
+    return list(zip(*[iter(values)] * arity))
+
+
+def iter_lines(filename: str, strip: bool = True, skip_empty: bool = True) -> Iterator[str]:
+    """
+    Lazily yield the lines of a file, as parse_lines() returns them.
+
+    Only the current line is held in memory, so inputs far larger than RAM can
+    be processed in one pass. Not cached.
+
+    Args:
+        filename: Path to input file
+        strip: Strip whitespace from each line
+        skip_empty: Skip empty lines
+
+    Yields:
+        Each line in file order
+
+    Example:
+        total = sum(int(line) for line in iter_lines('input.txt'))
+    """
+    with open(filename) as f:
+        for line in f:
+            if strip:
+                line = line.strip()
+            if line or not skip_empty:
+                yield line
+
+
+def iter_blocks(filename: str) -> Iterator[List[str]]:
+    """
+    Lazily yield blocks of lines separated by blank lines.
+
+    Memory is bounded by the largest block. Unlike parse_blocks(), a run of
+    several blank lines counts as a single separator, and whitespace-only
+    lines are blank too. Line endings are removed, including a stray "\r".
+    Not cached.
+
+    Args:
+        filename: Path to input file
+
+    Yields:
+        Each block as a list of lines (newlines removed)
+
+    Example:
+        blocks = iter_blocks('input.txt')
+        rules = next(blocks)
+        for update in next(blocks):
+            process(update)
+    """
+    block: List[str] = []
+    with open(filename) as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line.strip():
+                block.append(line)
+            elif block:
+                yield block
+                block = []
+    if block:
+        yield block
+
+
+def iter_records(
+    filename: str, delimiter: str = ",", skip_header: bool = False
+) -> Iterator[List[str]]:
+    """
+    Lazily yield the fields of each line, as parse_csv() returns them.
+
+    Args:
+        filename: Path to input file
+        delimiter: Field delimiter
+        skip_header: Skip first line if True
+
+    Yields:
+        Each non-empty line split on delimiter
+
+    Example:
+        for x, y in iter_records('input.txt'):
+            process(int(x), int(y))
+    """
+    lines = iter_lines(filename)
+    if skip_header:
+        next(lines, None)
+    for line in lines:
+        yield line.split(delimiter)
 
-    if skip_header and lines:
-        lines = lines[1:]
 
-    return [line.split(delimiter) for line in lines]
+def iter_key_values(filename: str, separator: str = ":") -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yield (key, value) pairs, as parse_key_value() reads them.
+
+    Args:
+        filename: Path to input file
+        separator: Character(s) separating key from value
+
+    Yields:
+        Stripped (key, value) for each line containing separator
+
+    Example:
+        for device, outputs in iter_key_values('input.txt'):
+            graph[device] = outputs.split()
+    """
+    for line in iter_lines(filename):
+        if separator in line:
+            key, value = line.split(separator, 1)
+            yield key.strip(), value.strip()
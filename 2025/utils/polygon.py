@@ -0,0 +1,231 @@
+"""
+Rectilinear (axis-aligned) polygons over integer tiles.
+
+Common patterns from AoC: 2025 Day 9 (largest rectangle inside a loop of red tiles)
+"""
+
+from bisect import bisect_right, insort
+from itertools import accumulate
+from operator import add
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Rectangle queries use a dense summed-area table while the compressed grid has
+# at most this many cells (about 40 bytes each, so ~40 MB at the limit) and a
+# segment tree over rows above it.
+DENSE_MAX_CELLS = 1 << 20
+
+Spans = Tuple[List[int], List[int]]
+
+
+def compress_axis(values: Sequence[int]) -> List[int]:
+    """
+    Split an axis into slots that are either one coordinate or a whole gap.
+
+    No edge starts or ends strictly between two neighbouring coordinates, so
+    every tile in such a gap behaves alike and one slot stands for all of them.
+
+    Returns:
+        First coordinate of each slot; the last slot is just the largest value
+    """
+    starts: List[int] = []
+    for value in sorted(set(values)):
+        if starts and value - starts[-1] > 1:
+            starts.append(starts[-1] + 1)
+        starts.append(value)
+    return starts
+
+
+def intersect_spans(a: Spans, b: Spans) -> Spans:
+    """Intersect two sorted lists of disjoint inclusive (starts, ends) spans."""
+    starts: List[int] = []
+    ends: List[int] = []
+    (a_starts, a_ends), (b_starts, b_ends) = a, b
+    i = j = 0
+    while i < len(a_starts) and j < len(b_starts):
+        lo = max(a_starts[i], b_starts[j])
+        hi = min(a_ends[i], b_ends[j])
+        if lo <= hi:
+            starts.append(lo)
+            ends.append(hi)
+        if a_ends[i] < b_ends[j]:
+            i += 1
+        else:
+            j += 1
+    return starts, ends
+
+
+class RectilinearPolygon:
+    """
+    Closed rectilinear polygon answering tile queries over compressed coordinates.
+
+    Tiles are integer points; a tile belongs to the polygon if it lies inside it
+    or on its boundary. Construction sweeps a line up through the compressed
+    rows, keeping the active vertical edges sorted, and stores each row's tiles
+    as inclusive spans of column slots. Concave rows simply get several spans.
+
+    Point queries are a bisect into one row. Rectangle queries use a summed-area
+    table of outside slots when the compressed grid has at most DENSE_MAX_CELLS
+    cells, otherwise a segment tree whose nodes hold the spans common to all
+    their rows: O(1) and O(log^2 n) respectively.
+
+    Attributes:
+        vertices: Corner tiles in loop order
+        xs: First x-coordinate of each column slot
+        ys: First y-coordinate of each row slot
+        spans: (starts, ends) of the column slots covered in each row slot
+
+    Example usage:
+        polygon = RectilinearPolygon([(7, 1), (11, 1), (11, 7), (9, 7), ...])
+        polygon.contains_point(8, 4)
+        polygon.contains_rectangle(2, 3, 9, 5)
+        polygon.area()
+    """
+
+    def __init__(self, vertices: Sequence[Tuple[int, int]]):
+        """
+        Build the polygon through the given corner tiles.
+
+        Args:
+            vertices: Tiles in loop order; consecutive tiles (wrapping around)
+                must share a row or a column
+
+        Raises:
+            ValueError: If an edge is not horizontal or vertical
+        """
+        self.vertices = list(vertices)
+        edges = list(zip(self.vertices, self.vertices[1:] + self.vertices[:1]))
+        for (x1, y1), (x2, y2) in edges:
+            if x1 != x2 and y1 != y2:
+                raise ValueError(f"Edge {(x1, y1)} -> {(x2, y2)} is not axis-aligned")
+
+        self.xs = compress_axis([x for x, _ in self.vertices])
+        self.ys = compress_axis([y for _, y in self.vertices])
+        self._column: Dict[int, int] = {x: c for c, x in enumerate(self.xs)}
+        self._row: Dict[int, int] = {y: r for r, y in enumerate(self.ys)}
+        column, row = self._column, self._row
+
+        # Vertical edges are active from their lower row up to, not including,
+        # their upper row, so a shared vertex is crossed once. Horizontal edges
+        # add their own row's boundary tiles.
+        enter: List[List[int]] = [[] for _ in self.ys]
+        leave: List[List[int]] = [[] for _ in self.ys]
+        flat: List[List[Tuple[int, int]]] = [[] for _ in self.ys]
+        for (x1, y1), (x2, y2) in edges:
+            if x1 == x2:
+                r1, r2 = sorted((row[y1], row[y2]))
+                enter[r1].append(column[x1])
+                leave[r2].append(column[x1])
+            else:
+                flat[row[y1]].append(tuple(sorted((column[x1], column[x2]))))
+
+        self.spans: List[Spans] = []
+        active: List[int] = []
+        for r in range(len(self.ys)):
+            for c in leave[r]:
+                active.remove(c)
+            for c in enter[r]:
+                insort(active, c)
+            # Even-odd pairs of crossings, then merge in the horizontal edges
+            pieces = sorted(list(zip(active[::2], active[1::2])) + flat[r])
+            starts: List[int] = []
+            ends: List[int] = []
+            for lo, hi in pieces:
+                if ends and lo <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], hi)
+                else:
+                    starts.append(lo)
+                    ends.append(hi)
+            self.spans.append((starts, ends))
+
+        self._outside: Optional[List[List[int]]] = None
+        self._tree: Optional[List[Spans]] = None
+        if len(self.xs) * len(self.ys) <= DENSE_MAX_CELLS:
+            self._build_table()
+        else:
+            self._build_tree()
+
+    def _build_table(self) -> None:
+        """Summed-area table of outside slots, with a leading zero row and column."""
+        cols = len(self.xs)
+        self._outside = [[0] * (cols + 1)]
+        for starts, ends in self.spans:
+            outside = [1] * cols
+            for lo, hi in zip(starts, ends):
+                outside[lo : hi + 1] = [0] * (hi - lo + 1)
+            running = accumulate(outside, initial=0)
+            self._outside.append(list(map(add, self._outside[-1], running)))
+
+    def _build_tree(self) -> None:
+        """Bottom-up segment tree over rows; each node keeps the spans all its rows share."""
+        size = 1
+        while size < len(self.spans):
+            size *= 2
+        self._tree = [([], [])] * size + self.spans + [([], [])] * (size - len(self.spans))
+        for node in range(size - 1, 0, -1):
+            self._tree[node] = intersect_spans(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def _slot(self, starts: List[int], index: Dict[int, int], value: int) -> int:
+        """Slot holding a coordinate, or -1 if it lies outside the bounding box."""
+        slot = index.get(value)
+        if slot is not None:
+            return slot
+        if value < starts[0] or value > starts[-1]:
+            return -1
+        return bisect_right(starts, value) - 1
+
+    def contains_point(self, x: int, y: int) -> bool:
+        """Check whether tile (x, y) is inside the polygon or on its boundary."""
+        c, r = self._slot(self.xs, self._column, x), self._slot(self.ys, self._row, y)
+        if c < 0 or r < 0:
+            return False
+        starts, ends = self.spans[r]
+        k = bisect_right(starts, c) - 1
+        return k >= 0 and ends[k] >= c
+
+    def contains_rectangle(self, x_min: int, y_min: int, x_max: int, y_max: int) -> bool:
+        """Check whether every tile of the inclusive rectangle belongs to the polygon."""
+        column, row = self._column, self._row
+        if x_min in column and x_max in column and y_min in row and y_max in row:
+            c1, c2, r1, r2 = column[x_min], column[x_max], row[y_min], row[y_max]
+        else:
+            c1, c2 = self._slot(self.xs, column, x_min), self._slot(self.xs, column, x_max)
+            r1, r2 = self._slot(self.ys, row, y_min), self._slot(self.ys, row, y_max)
+            if min(c1, c2, r1, r2) < 0:
+                return False
+
+        if self._outside is not None:
+            above, below = self._outside[r1], self._outside[r2 + 1]
+            return below[c2 + 1] - above[c2 + 1] - below[c1] + above[c1] == 0
+
+        tree = self._tree
+        lo, hi = r1 + len(tree) // 2, r2 + len(tree) // 2 + 1
+        while lo < hi:
+            nodes = []
+            if lo & 1:
+                nodes.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                nodes.append(hi)
+            for node in nodes:
+                starts, ends = tree[node]
+                k = bisect_right(starts, c1) - 1
+                if k < 0 or ends[k] < c2:
+                    return False
+            lo //= 2
+            hi //= 2
+        return True
+
+    def area(self) -> int:
+        """Number of tiles inside the polygon or on its boundary."""
+        x_ends = [x - 1 for x in self.xs[1:]] + [self.xs[-1]]
+        y_ends = [y - 1 for y in self.ys[1:]] + [self.ys[-1]]
+        total = 0
+        for r, (starts, ends) in enumerate(self.spans):
+            width = sum(x_ends[hi] - self.xs[lo] + 1 for lo, hi in zip(starts, ends))
+            total += width * (y_ends[r] - self.ys[r] + 1)
+        return total
+
+    def __len__(self) -> int:
+        """Number of vertices."""
+        return len(self.vertices)
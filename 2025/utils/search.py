@@ -4,17 +4,102 @@ Search algorithm templates for pathfinding and graph traversal.
 Common patterns from AoC 2024: Days 10, 16, 18, 20, 21
 """
 
+import functools
 import heapq
-from collections import deque
-from typing import Callable, Dict, List, Optional, Set, Tuple, TypeVar
+import time
+from array import array
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .grid import Grid
 
 T = TypeVar("T")
 
+# dijkstra(max_weight=...) uses a bucket queue up to this edge weight. Beyond it
+# the frontier is spread over so many distance values that each bucket holds a
+# node or two, and a heap is faster (e.g. the 1/1000 costs of 2024 day 16).
+DIAL_MAX_WEIGHT = 100
+
+# InternedGraph keeps a neighbour bitmask per node up to this many nodes, which
+# costs n * n / 8 bytes (512 KB at the limit).
+BITSET_MAX_NODES = 2048
+
+
+@dataclass
+class SearchStats:
+    """
+    Work counters filled in by the search functions when passed as stats=.
+
+    Reuse one object across calls to accumulate totals. Without a stats object
+    the only cost is an `is not None` check per expansion and per push.
+
+    Attributes:
+        expanded: Nodes taken off the frontier and processed
+        generated: Neighbours produced for expanded nodes (edges examined)
+        pushes: Entries added to the frontier, including start nodes
+        stale_pops: Entries popped but skipped (already settled or outdated)
+        max_frontier: Largest frontier size seen at an expansion
+        elapsed_s: Wall time spent inside the search
+
+    Example:
+        stats = SearchStats()
+        a_star(start, neighbors, heuristic, is_goal, stats=stats)
+        print(stats)
+    """
+
+    expanded: int = 0
+    generated: int = 0
+    pushes: int = 0
+    stale_pops: int = 0
+    max_frontier: int = 0
+    elapsed_s: float = 0.0
+
+    def expand(self, frontier: int, generated: int) -> None:
+        """Record one expansion with the current frontier size and neighbour count."""
+        self.expanded += 1
+        self.generated += generated
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+
+
+def _timed(search: Callable) -> Callable:
+    """Add the wall time of a search to its stats= argument, if one is given."""
 
+    @functools.wraps(search)
+    def wrapper(*args, **kwargs):
+        stats = kwargs.get("stats")
+        if stats is None:
+            return search(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return search(*args, **kwargs)
+        finally:
+            stats.elapsed_s += time.perf_counter() - started
+
+    return wrapper
+
+
+@_timed
 def bfs(
     start: T,
     get_neighbors: Callable[[T], List[T]],
     is_goal: Optional[Callable[[T], bool]] = None,
+    *,
+    stats: Optional[SearchStats] = None,
 ) -> Tuple[Set[T], Optional[T], Dict[T, int]]:
     """
     Breadth-First Search for unweighted graphs.
@@ -23,6 +108,7 @@ def bfs(
         start: Starting node
         get_neighbors: Function that returns list of neighbors for a node
         is_goal: Optional function to check if node is the goal
+        stats: Optional SearchStats to record work in
 
     Returns:
         Tuple of (visited_set, goal_node_or_none, distances_dict)
@@ -38,6 +124,8 @@ def bfs(
     visited = {start}
     distances = {start: 0}
     goal_node = None
+    if stats is not None:
+        stats.pushes += 1
 
     while queue:
         current = queue.popleft()
@@ -47,29 +135,509 @@ def bfs(
             if goal_node:  # Stop at first goal
                 break
 
-        for neighbor in get_neighbors(current):
+        neighbors = get_neighbors(current)
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors))
+
+        for neighbor in neighbors:
             if neighbor not in visited:
                 visited.add(neighbor)
                 distances[neighbor] = distances[current] + 1
                 queue.append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
 
     return visited, goal_node, distances
 
 
+@_timed
+def bfs_indexed(
+    start: int,
+    neighbors: Sequence[Sequence[int]],
+    goal: Optional[int] = None,
+    blocked: Optional[bytearray] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[array, Optional[int]]:
+    """
+    Breadth-First Search over int nodes 0..n-1 with a precomputed neighbour table.
+
+    Distances live in a flat array('i') that doubles as the visited set, so no
+    per-node dicts, sets or tuples are allocated.
+
+    Args:
+        start: Starting node index
+        neighbors: Entry i lists the neighbours of node i (e.g. FlatGrid.neighbors())
+        goal: Optional node index to stop at
+        blocked: Optional bytearray; nodes with a nonzero entry are never entered.
+            Lets callers add walls without rebuilding the neighbour table.
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        Tuple of (distances, goal_or_none) where distances[i] is -1 if unreached
+
+    Example:
+        grid = FlatGrid.from_file('input.txt')
+        distances, goal = bfs_indexed(grid.find('S'), grid.neighbors(), grid.find('E'))
+    """
+    distances = array("i", [-1]) * len(neighbors)
+    if blocked is not None and blocked[start]:
+        return distances, None
+
+    distances[start] = 0
+    queue = deque([start])
+    popleft, append = queue.popleft, queue.append
+    if stats is not None:
+        stats.pushes += 1
+
+    while queue:
+        current = popleft()
+        if current == goal:
+            return distances, current
+
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors[current]))
+
+        next_distance = distances[current] + 1
+        for neighbor in neighbors[current]:
+            if distances[neighbor] < 0 and (blocked is None or not blocked[neighbor]):
+                distances[neighbor] = next_distance
+                append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+
+    return distances, None
+
+
+@_timed
+def multi_source_bfs(
+    sources: Iterable[T],
+    get_neighbors: Callable[[T], List[T]],
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Dict[T, int], Dict[T, T]]:
+    """
+    Breadth-First Search seeded from many sources at once.
+
+    Equivalent to running bfs() from every source and keeping the minimum
+    distance per node, but in a single sweep.
+
+    Args:
+        sources: Starting nodes (all at distance 0)
+        get_neighbors: Function that returns list of neighbors for a node
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        Tuple of (distances_dict, nearest_dict) where nearest maps each reached
+        node to the source it is closest to (ties go to the earlier source)
+
+    Example:
+        distances, nearest = multi_source_bfs(
+            sources=grid.find_all('0'),
+            get_neighbors=lambda pos: grid.get_neighbors(*pos),
+        )
+    """
+    distances: Dict[T, int] = {}
+    nearest: Dict[T, T] = {}
+    queue = deque()
+    for source in sources:
+        if source not in distances:
+            distances[source] = 0
+            nearest[source] = source
+            queue.append(source)
+
+    if stats is not None:
+        stats.pushes += len(queue)
+
+    while queue:
+        current = queue.popleft()
+        neighbors = get_neighbors(current)
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors))
+
+        for neighbor in neighbors:
+            if neighbor not in distances:
+                distances[neighbor] = distances[current] + 1
+                nearest[neighbor] = nearest[current]
+                queue.append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+
+    return distances, nearest
+
+
+@_timed
+def distance_field(
+    sources: Iterable[int],
+    neighbors: Sequence[Sequence[int]],
+    with_sources: bool = False,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Union[array, Tuple[array, array]]:
+    """
+    Dense BFS distance from the nearest of several sources to every node.
+
+    For grids, pass FlatGrid.neighbors(); the result is indexed by flat cell
+    index. One call replaces a BFS per source, e.g. distances from both start
+    and end of a maze are just two fields.
+
+    Args:
+        sources: Source node indices (all at distance 0)
+        neighbors: Entry i lists the neighbours of node i
+        with_sources: Also return, per node, the index of its nearest source
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        array('i') of distances (-1 where unreachable), or a tuple of
+        (distances, nearest_source) arrays if with_sources is True
+
+    Example:
+        grid = FlatGrid.from_file('input.txt')
+        from_end = distance_field([grid.find('E')], grid.neighbors())
+    """
+    distances = array("i", [-1]) * len(neighbors)
+    nearest = array("i", [-1]) * len(neighbors) if with_sources else None
+    queue = deque()
+    for source in sources:
+        if distances[source] < 0:
+            distances[source] = 0
+            if nearest is not None:
+                nearest[source] = source
+            queue.append(source)
+
+    popleft, append = queue.popleft, queue.append
+    if stats is not None:
+        stats.pushes += len(queue)
+
+    while queue:
+        current = popleft()
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors[current]))
+
+        next_distance = distances[current] + 1
+        for neighbor in neighbors[current]:
+            if distances[neighbor] < 0:
+                distances[neighbor] = next_distance
+                if nearest is not None:
+                    nearest[neighbor] = nearest[current]
+                append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+
+    if with_sources:
+        return distances, nearest
+    return distances
+
+
+class CSRGraph:
+    """
+    Compressed sparse row adjacency for int nodes 0..n-1.
+
+    The neighbours of node i are targets[offsets[i]:offsets[i + 1]], with
+    matching entries in weights for weighted graphs. Everything lives in three
+    flat arrays, so large graphs cost a few bytes per edge instead of a list
+    object per node.
+
+    Example usage:
+        graph = CSRGraph.from_edges(4, [(0, 1, 5), (1, 2, 1), (0, 2, 9)])
+        distances, goal, parents = dijkstra_csr(graph, 0, goal=2)
+    """
+
+    def __init__(self, offsets: array, targets: array, weights: Optional[array] = None):
+        """
+        Initialize graph.
+
+        Args:
+            offsets: array('i') of length n + 1
+            targets: array('i') of neighbour ids
+            weights: Optional array('q') of edge costs aligned with targets
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.n = len(offsets) - 1
+
+    @classmethod
+    def from_adjacency(
+        cls,
+        adjacency: Sequence[Sequence[int]],
+        weights: Optional[Sequence[Sequence[int]]] = None,
+    ) -> "CSRGraph":
+        """
+        Build from per-node neighbour lists (e.g. FlatGrid.neighbors()).
+
+        Args:
+            adjacency: Entry i lists the neighbours of node i
+            weights: Optional costs, shaped like adjacency
+
+        Returns:
+            CSRGraph instance
+        """
+        offsets = array("i", [0])
+        targets = array("i")
+        for neighbors in adjacency:
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+        edge_weights = None
+        if weights is not None:
+            edge_weights = array("q")
+            for costs in weights:
+                edge_weights.extend(costs)
+        return cls(offsets, targets, edge_weights)
+
+    @classmethod
+    def from_edges(
+        cls, n: int, edges: Iterable[Tuple[int, ...]], directed: bool = True
+    ) -> "CSRGraph":
+        """
+        Build from an edge list.
+
+        Args:
+            n: Number of nodes
+            edges: (u, v) or (u, v, cost) tuples
+            directed: Add the reverse of each edge too if False
+
+        Returns:
+            CSRGraph instance (weighted if edges carry costs)
+        """
+        adjacency: List[List[int]] = [[] for _ in range(n)]
+        costs: List[List[int]] = [[] for _ in range(n)]
+        weighted = False
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            cost = edge[2] if len(edge) > 2 else 1
+            weighted = weighted or len(edge) > 2
+            adjacency[u].append(v)
+            costs[u].append(cost)
+            if not directed:
+                adjacency[v].append(u)
+                costs[v].append(cost)
+        return cls.from_adjacency(adjacency, costs if weighted else None)
+
+    def neighbors(self, node: int) -> array:
+        """Neighbour ids of node."""
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return self.n
+
+
+class InternedGraph:
+    """
+    Graph with hashable node names (e.g. strings) mapped to int ids 0..n-1.
+
+    Ids follow the sorted order of the names, so sorting ids sorts names. Edges
+    live in a CSRGraph, and graphs with at most BITSET_MAX_NODES nodes also get
+    one int bitmask of neighbours per node for O(1) edge tests and fast set
+    intersections. Names are only needed again when printing results.
+
+    Example usage:
+        graph = parse_graph('input.txt', interned=True)
+        node = graph.id('ka')
+        common = graph.bits[node] & graph.bits[graph.id('co')]
+        print([graph.names[i] for i in graph.members(common)])
+    """
+
+    def __init__(self, names: List[Any], csr: CSRGraph):
+        """
+        Initialize graph.
+
+        Args:
+            names: Node name for each id
+            csr: Adjacency over ids
+        """
+        self.names = names
+        self.ids: Dict[Any, int] = {name: i for i, name in enumerate(names)}
+        self.csr = csr
+        self.bits: Optional[List[int]] = None
+        if len(names) <= BITSET_MAX_NODES:
+            self.bits = []
+            for node in range(len(names)):
+                mask = 0
+                for neighbor in csr.neighbors(node):
+                    mask |= 1 << neighbor
+                self.bits.append(mask)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Dict[Any, Iterable[Any]]) -> "InternedGraph":
+        """
+        Build from an adjacency dict such as parse_graph() returns.
+
+        Args:
+            adjacency: Mapping from each node name to its neighbours' names;
+                names that only appear as neighbours are included
+
+        Returns:
+            InternedGraph instance
+        """
+        names = set(adjacency)
+        for neighbors in adjacency.values():
+            names.update(neighbors)
+        ordered = sorted(names)
+        ids = {name: i for i, name in enumerate(ordered)}
+        lists: List[List[int]] = [[] for _ in ordered]
+        for name, neighbors in adjacency.items():
+            lists[ids[name]] = [ids[neighbor] for neighbor in neighbors]
+        return cls(ordered, CSRGraph.from_adjacency(lists))
+
+    def id(self, name: Any) -> int:
+        """Id of a node name."""
+        return self.ids[name]
+
+    def neighbors(self, node: int) -> array:
+        """Neighbour ids of node."""
+        return self.csr.neighbors(node)
+
+    def has_edge(self, source: int, target: int) -> bool:
+        """Check for an edge between two ids."""
+        if self.bits is not None:
+            return bool(self.bits[source] >> target & 1)
+        return target in self.csr.neighbors(source)
+
+    @staticmethod
+    def members(mask: int) -> Iterator[int]:
+        """Ids whose bits are set in mask, in increasing order."""
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def __len__(self) -> int:
+        """Number of nodes."""
+        return len(self.names)
+
+
+@_timed
+def bfs_csr(
+    graph: CSRGraph, start: int, goal: Optional[int] = None, *, stats: Optional[SearchStats] = None
+) -> Tuple[array, Optional[int], array]:
+    """
+    Breadth-First Search over a CSRGraph.
+
+    Gives the same distances as bfs() on the equivalent neighbour function, but
+    visited, distances and parents are preallocated array('i') buffers.
+
+    Args:
+        graph: Graph to search
+        start: Starting node
+        goal: Optional node to stop at
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        Tuple of (distances, goal_or_none, parents); unreached nodes have
+        distance -1 and every node without a parent (including start) has -1
+    """
+    offsets, targets = graph.offsets, graph.targets
+    distances = array("i", [-1]) * graph.n
+    parents = array("i", [-1]) * graph.n
+    distances[start] = 0
+    queue = deque([start])
+    popleft, append = queue.popleft, queue.append
+    if stats is not None:
+        stats.pushes += 1
+
+    while queue:
+        current = popleft()
+        if current == goal:
+            return distances, current, parents
+
+        if stats is not None:
+            stats.expand(len(queue) + 1, offsets[current + 1] - offsets[current])
+
+        next_distance = distances[current] + 1
+        for edge in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[edge]
+            if distances[neighbor] < 0:
+                distances[neighbor] = next_distance
+                parents[neighbor] = current
+                append(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+
+    return distances, None, parents
+
+
+@_timed
+def dijkstra_csr(
+    graph: CSRGraph, start: int, goal: Optional[int] = None, *, stats: Optional[SearchStats] = None
+) -> Tuple[array, Optional[int], array]:
+    """
+    Dijkstra's algorithm over a weighted CSRGraph.
+
+    Same results as dijkstra() on the equivalent neighbour function, with
+    distances in array('q') and parents in array('i') instead of dicts. The
+    heap holds plain (cost, node) pairs of ints.
+
+    Args:
+        graph: Graph with non-negative weights (unweighted graphs use cost 1)
+        start: Starting node
+        goal: Optional node to stop at once settled
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        Tuple of (distances, goal_or_none, parents); unreached nodes have
+        distance -1 and every node without a parent (including start) has -1
+    """
+    offsets, targets = graph.offsets, graph.targets
+    weights = graph.weights
+    distances = array("q", [-1]) * graph.n
+    parents = array("i", [-1]) * graph.n
+    settled = bytearray(graph.n)
+    distances[start] = 0
+    queue = [(0, start)]
+    if stats is not None:
+        stats.pushes += 1
+
+    while queue:
+        current_dist, current = heapq.heappop(queue)
+        if settled[current]:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        settled[current] = 1
+
+        if current == goal:
+            return distances, current, parents
+
+        if stats is not None:
+            stats.expand(len(queue) + 1, offsets[current + 1] - offsets[current])
+
+        for edge in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[edge]
+            new_dist = current_dist + (weights[edge] if weights is not None else 1)
+            old_dist = distances[neighbor]
+            if old_dist < 0 or new_dist < old_dist:
+                distances[neighbor] = new_dist
+                parents[neighbor] = current
+                heapq.heappush(queue, (new_dist, neighbor))
+                if stats is not None:
+                    stats.pushes += 1
+
+    return distances, None, parents
+
+
+@_timed
 def dfs(
     start: T,
     get_neighbors: Callable[[T], List[T]],
     is_goal: Optional[Callable[[T], bool]] = None,
     visited: Optional[Set[T]] = None,
+    *,
+    stats: Optional[SearchStats] = None,
 ) -> Tuple[Set[T], Optional[T]]:
     """
     Depth-First Search for graph traversal.
 
+    Uses an explicit stack of neighbour iterators, so it visits nodes in the same
+    order as the recursive formulation but never touches the recursion limit.
+
     Args:
         start: Starting node
         get_neighbors: Function that returns list of neighbors for a node
         is_goal: Optional function to check if node is the goal
-        visited: Optional set of already visited nodes (for recursion)
+        visited: Optional set of already visited nodes (updated in place)
+        stats: Optional SearchStats to record work in (the frontier is the stack depth)
 
     Returns:
         Tuple of (visited_set, goal_node_or_none)
@@ -89,30 +657,67 @@ def dfs(
     if is_goal and is_goal(start):
         return visited, start
 
-    for neighbor in get_neighbors(start):
-        if neighbor not in visited:
-            result_visited, goal = dfs(neighbor, get_neighbors, is_goal, visited)
-            if goal:
-                return result_visited, goal
+    neighbors = get_neighbors(start)
+    if stats is not None:
+        stats.pushes += 1
+        stats.expand(1, len(neighbors))
+
+    stack = [iter(neighbors)]
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                if is_goal and is_goal(neighbor):
+                    return visited, neighbor
+                neighbors = get_neighbors(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+                    stats.expand(len(stack) + 1, len(neighbors))
+                stack.append(iter(neighbors))
+                break
+        else:
+            stack.pop()
 
     return visited, None
 
 
+@_timed
 def dijkstra(
     start: T,
     get_neighbors_with_cost: Callable[[T], List[Tuple[T, int]]],
     is_goal: Optional[Callable[[T], bool]] = None,
-) -> Tuple[Dict[T, int], Optional[T], Dict[T, Optional[T]]]:
+    max_weight: Optional[int] = None,
+    all_parents: bool = False,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Dict[T, int], Optional[T], Dict[T, Any]]:
     """
     Dijkstra's algorithm for weighted shortest path.
 
+    Passing max_weight lets small integer weights skip the heap: 0/1 weights
+    use zero_one_bfs and weights up to DIAL_MAX_WEIGHT use dial_dijkstra. The
+    bucket queue stays exact for heavier edges, only slower, but the deque
+    cannot order them, so max_weight <= 1 with a heavier edge raises.
+
+    With all_parents, each node maps to the list of every predecessor that
+    reaches it at its optimal distance, i.e. the shortest-path DAG; pass it to
+    shortest_path_dag() to find everything lying on any best path. Edge costs
+    must then be positive so all predecessors are settled before the node.
+
     Args:
         start: Starting node
         get_neighbors_with_cost: Function returning list of (neighbor, cost) tuples
         is_goal: Optional function to check if node is the goal
+        max_weight: Optional largest integer edge cost, used to pick the queue
+        all_parents: Record all optimal predecessors instead of one parent
+        stats: Optional SearchStats to record work in
 
     Returns:
-        Tuple of (distances_dict, goal_node_or_none, parent_dict)
+        Tuple of (distances_dict, goal_node_or_none, parent_dict); with
+        all_parents the parent dict holds lists (empty for start)
+
+    Raises:
+        ValueError: If max_weight is at most 1 and an edge costs anything else
 
     Example:
         distances, goal, parents = dijkstra(
@@ -123,15 +728,26 @@ def dijkstra(
             is_goal=lambda pos: pos == (9, 9)
         )
     """
+    if max_weight is not None and not all_parents:
+        # Unwrapped so the time isn't added to stats twice
+        if max_weight <= 1:
+            return zero_one_bfs.__wrapped__(start, get_neighbors_with_cost, is_goal, stats=stats)
+        if max_weight <= DIAL_MAX_WEIGHT:
+            return dial_dijkstra.__wrapped__(start, get_neighbors_with_cost, is_goal, stats=stats)
+
     queue = [(0, start)]
     distances = {start: 0}
-    parents = {start: None}
+    parents: Dict[T, Any] = {start: [] if all_parents else None}
     visited = set()
+    if stats is not None:
+        stats.pushes += 1
 
     while queue:
         current_dist, current = heapq.heappop(queue)
 
         if current in visited:
+            if stats is not None:
+                stats.stale_pops += 1
             continue
 
         visited.add(current)
@@ -139,22 +755,215 @@ def dijkstra(
         if is_goal and is_goal(current):
             return distances, current, parents
 
-        for neighbor, cost in get_neighbors_with_cost(current):
+        neighbors = get_neighbors_with_cost(current)
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors))
+
+        for neighbor, cost in neighbors:
             new_dist = current_dist + cost
 
             if neighbor not in distances or new_dist < distances[neighbor]:
                 distances[neighbor] = new_dist
-                parents[neighbor] = current
+                parents[neighbor] = [current] if all_parents else current
                 heapq.heappush(queue, (new_dist, neighbor))
+                if stats is not None:
+                    stats.pushes += 1
+            elif all_parents and new_dist == distances[neighbor]:
+                parents[neighbor].append(current)
+
+    return distances, None, parents
+
+
+def shortest_path_dag(
+    parents: Dict[T, List[T]], goals: Iterable[T]
+) -> Tuple[Set[T], Set[Tuple[T, T]]]:
+    """
+    Collect the nodes and edges lying on any shortest path to the goals.
+
+    Walks the predecessor lists from dijkstra(..., all_parents=True) backwards,
+    visiting each node once, so this is O(V + E) however many tied paths exist.
+
+    Args:
+        parents: All-predecessor map from dijkstra(..., all_parents=True)
+        goals: Goal nodes (all at the optimal distance) to walk back from
+
+    Returns:
+        Tuple of (nodes, edges) where edges are (predecessor, node) pairs
+
+    Example:
+        distances, _, parents = dijkstra(start, neighbors_with_cost, all_parents=True)
+        best = min(distances[g] for g in end_states if g in distances)
+        nodes, _ = shortest_path_dag(parents, [g for g in end_states if distances.get(g) == best])
+        tiles = {(node.row, node.col) for node in nodes}
+    """
+    nodes: Set[T] = set()
+    edges: Set[Tuple[T, T]] = set()
+    stack = [goal for goal in goals if goal in parents]
+
+    while stack:
+        node = stack.pop()
+        if node in nodes:
+            continue
+        nodes.add(node)
+        for parent in parents[node]:
+            edges.add((parent, node))
+            stack.append(parent)
+
+    return nodes, edges
+
+
+@_timed
+def zero_one_bfs(
+    start: T,
+    get_neighbors_with_cost: Callable[[T], List[Tuple[T, int]]],
+    is_goal: Optional[Callable[[T], bool]] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Dict[T, int], Optional[T], Dict[T, Optional[T]]]:
+    """
+    Shortest paths when every edge costs 0 or 1, using a deque instead of a heap.
+
+    Cost-0 neighbours go to the front of the deque and cost-1 neighbours to the
+    back, so nodes still leave the deque in distance order.
+
+    Args:
+        start: Starting node
+        get_neighbors_with_cost: Function returning list of (neighbor, cost) tuples
+        is_goal: Optional function to check if node is the goal
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        Tuple of (distances_dict, goal_node_or_none, parent_dict), as dijkstra()
+
+    Raises:
+        ValueError: If an edge costs anything other than 0 or 1
+    """
+    queue = deque([start])
+    distances = {start: 0}
+    parents = {start: None}
+    visited = set()
+    if stats is not None:
+        stats.pushes += 1
+
+    while queue:
+        current = queue.popleft()
+
+        if current in visited:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+
+        visited.add(current)
+
+        if is_goal and is_goal(current):
+            return distances, current, parents
+
+        neighbors = get_neighbors_with_cost(current)
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors))
+
+        current_dist = distances[current]
+        for neighbor, cost in neighbors:
+            if cost != 0 and cost != 1:
+                raise ValueError(f"Edge cost {cost!r} from {current!r} is not 0 or 1")
+            new_dist = current_dist + cost
+
+            if neighbor not in distances or new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                parents[neighbor] = current
+                if cost:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
 
     return distances, None, parents
 
 
+@_timed
+def dial_dijkstra(
+    start: T,
+    get_neighbors_with_cost: Callable[[T], List[Tuple[T, int]]],
+    is_goal: Optional[Callable[[T], bool]] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Dict[T, int], Optional[T], Dict[T, Optional[T]]]:
+    """
+    Dijkstra with a bucket queue (Dial's algorithm) for small integer weights.
+
+    Nodes are kept in one bucket per tentative distance and buckets are drained
+    in increasing order, so pushes and pops are O(1) instead of O(log n).
+    Finding the next non-empty bucket costs O(number of live buckets), which is
+    bounded by the largest edge weight plus one.
+
+    Args:
+        start: Starting node
+        get_neighbors_with_cost: Function returning list of (neighbor, int cost) tuples
+        is_goal: Optional function to check if node is the goal
+        stats: Optional SearchStats to record work in
+
+    Returns:
+        Tuple of (distances_dict, goal_node_or_none, parent_dict), as dijkstra()
+    """
+    buckets: Dict[int, List[T]] = defaultdict(list)
+    buckets[0].append(start)
+    distances = {start: 0}
+    parents = {start: None}
+    visited = set()
+    queued = 1
+    current_dist = 0
+    if stats is not None:
+        stats.pushes += 1
+
+    while queued:
+        bucket = buckets.get(current_dist)
+        if not bucket:
+            buckets.pop(current_dist, None)
+            # At most max_weight + 1 buckets are live, so jumping to the smallest
+            # one skips gaps (e.g. turn costs of 1000) without scanning them
+            current_dist = min(buckets)
+            continue
+
+        current = bucket.pop()
+        queued -= 1
+
+        if current in visited or distances[current] != current_dist:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue  # Stale entry from before a shorter path was found
+
+        visited.add(current)
+
+        if is_goal and is_goal(current):
+            return distances, current, parents
+
+        neighbors = get_neighbors_with_cost(current)
+        if stats is not None:
+            stats.expand(queued + 1, len(neighbors))
+
+        for neighbor, cost in neighbors:
+            new_dist = current_dist + cost
+
+            if neighbor not in distances or new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                parents[neighbor] = current
+                buckets[new_dist].append(neighbor)
+                queued += 1
+                if stats is not None:
+                    stats.pushes += 1
+
+    return distances, None, parents
+
+
+@_timed
 def a_star(
     start: T,
     get_neighbors_with_cost: Callable[[T], List[Tuple[T, int]]],
     heuristic: Callable[[T], int],
     is_goal: Callable[[T], bool],
+    *,
+    stats: Optional[SearchStats] = None,
 ) -> Tuple[Optional[int], Optional[List[T]], Dict[T, int]]:
     """
     A* algorithm for weighted shortest path with heuristic.
@@ -164,6 +973,7 @@ def a_star(
         get_neighbors_with_cost: Function returning list of (neighbor, cost) tuples
         heuristic: Heuristic function estimating cost to goal
         is_goal: Function to check if node is the goal
+        stats: Optional SearchStats to record work in
 
     Returns:
         Tuple of (path_cost_or_none, path_list_or_none, g_scores_dict)
@@ -183,11 +993,15 @@ def a_star(
     g_scores = {start: 0}
     parents = {start: None}
     visited = set()
+    if stats is not None:
+        stats.pushes += 1
 
     while queue:
         f_score, g_score, current = heapq.heappop(queue)
 
         if current in visited:
+            if stats is not None:
+                stats.stale_pops += 1
             continue
 
         visited.add(current)
@@ -202,7 +1016,11 @@ def a_star(
             path.reverse()
             return g_score, path, g_scores
 
-        for neighbor, cost in get_neighbors_with_cost(current):
+        neighbors = get_neighbors_with_cost(current)
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors))
+
+        for neighbor, cost in neighbors:
             new_g_score = g_score + cost
 
             if neighbor not in g_scores or new_g_score < g_scores[neighbor]:
@@ -210,15 +1028,640 @@ def a_star(
                 f = new_g_score + heuristic(neighbor)
                 parents[neighbor] = current
                 heapq.heappush(queue, (f, new_g_score, neighbor))
+                if stats is not None:
+                    stats.pushes += 1
 
     return None, None, g_scores
 
 
+def _walk_parents(node: Optional[T], parents: Dict[T, Optional[T]]) -> List[T]:
+    """Nodes from node back to the root of a parent map."""
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    return path
+
+
+@_timed
+def bidirectional_bfs(
+    start: T,
+    goal: T,
+    get_neighbors: Callable[[T], List[T]],
+    get_reverse_neighbors: Optional[Callable[[T], List[T]]] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Optional[int], Optional[List[T]]]:
+    """
+    Breadth-First Search from both ends for a single start/goal pair.
+
+    Each round expands one full level of whichever frontier is smaller, and
+    stops after the level in which the frontiers first touch. On open grids the
+    two searches each cover a radius of about half the distance, visiting far
+    fewer nodes than bfs().
+
+    Args:
+        start: Starting node
+        goal: Target node
+        get_neighbors: Function that returns list of neighbors for a node
+        get_reverse_neighbors: Function returning the nodes with an edge *into* a
+            node; defaults to get_neighbors (undirected graphs)
+        stats: Optional SearchStats to record work in (frontier is both sides)
+
+    Returns:
+        Tuple of (distance_or_none, path_or_none)
+
+    Example:
+        distance, path = bidirectional_bfs(
+            start=(0, 0),
+            goal=(70, 70),
+            get_neighbors=lambda pos: grid.get_neighbors(*pos, condition=lambda c: c != '#'),
+        )
+    """
+    if start == goal:
+        return 0, [start]
+
+    sides = [
+        # (parents, distances, frontier, neighbor function)
+        ({start: None}, {start: 0}, [start], get_neighbors),
+        ({goal: None}, {goal: 0}, [goal], get_reverse_neighbors or get_neighbors),
+    ]
+
+    if stats is not None:
+        stats.pushes += 2
+
+    while sides[0][2] and sides[1][2]:
+        side = 0 if len(sides[0][2]) <= len(sides[1][2]) else 1
+        parents, dist, frontier, neighbors = sides[side]
+        other_dist = sides[1 - side][1]
+        other_size = len(sides[1 - side][2])
+
+        best = None
+        meeting = None
+        next_frontier = []
+        for index, current in enumerate(frontier):
+            successors = neighbors(current)
+            if stats is not None:
+                pending = len(frontier) - index + len(next_frontier)
+                stats.expand(pending + other_size, len(successors))
+
+            for neighbor in successors:
+                if neighbor not in dist:
+                    dist[neighbor] = dist[current] + 1
+                    parents[neighbor] = current
+                    next_frontier.append(neighbor)
+                    if stats is not None:
+                        stats.pushes += 1
+                if neighbor in other_dist:
+                    total = dist[current] + 1 + other_dist[neighbor]
+                    if best is None or total < best:
+                        best, meeting = total, (current, neighbor)
+
+        if best is not None:
+            # Route through the meeting edge current -> neighbor
+            current, neighbor = meeting
+            near = _walk_parents(current, parents)
+            far = _walk_parents(neighbor, sides[1 - side][0])
+            if side == 0:
+                return best, near[::-1] + far
+            return best, far[::-1] + near
+
+        sides[side] = (parents, dist, next_frontier, neighbors)
+
+    return None, None
+
+
+@_timed
+def bidirectional_a_star(
+    start: T,
+    goal: T,
+    get_neighbors_with_cost: Callable[[T], List[Tuple[T, int]]],
+    heuristic: Callable[[T], int],
+    get_reverse_neighbors_with_cost: Optional[Callable[[T], List[Tuple[T, int]]]] = None,
+    reverse_heuristic: Optional[Callable[[T], int]] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Optional[int], Optional[List[T]]]:
+    """
+    A* from both ends for a single start/goal pair.
+
+    Alternately expands the forward search (guided by heuristic, an estimate of
+    the cost to goal) and the backward search (guided by reverse_heuristic, an
+    estimate of the cost from start). Whenever an edge links the two searches a
+    candidate path is recorded; the search stops once either queue's smallest
+    f-score can no longer beat the best candidate. Both heuristics must be
+    consistent, as for a_star().
+
+    Args:
+        start: Starting node
+        goal: Target node
+        get_neighbors_with_cost: Function returning list of (neighbor, cost) tuples
+        heuristic: Estimate of the remaining cost from a node to goal
+        get_reverse_neighbors_with_cost: Function returning (predecessor, cost)
+            tuples; defaults to get_neighbors_with_cost (undirected graphs)
+        reverse_heuristic: Estimate of the cost from start to a node; defaults to
+            0 (the backward search is then plain Dijkstra)
+        stats: Optional SearchStats to record work in (frontier is both queues)
+
+    Returns:
+        Tuple of (path_cost_or_none, path_list_or_none)
+
+    Example:
+        cost, path = bidirectional_a_star(
+            start=start,
+            goal=end,
+            get_neighbors_with_cost=lambda pos: [(n, 1) for n in open_neighbors(pos)],
+            heuristic=lambda pos: abs(pos[0] - end[0]) + abs(pos[1] - end[1]),
+            reverse_heuristic=lambda pos: abs(pos[0] - start[0]) + abs(pos[1] - start[1]),
+        )
+    """
+    sides = [
+        # (queue, g_scores, parents, closed, neighbor function, heuristic)
+        (
+            [(heuristic(start), 0, start)],
+            {start: 0},
+            {start: None},
+            set(),
+            get_neighbors_with_cost,
+            heuristic,
+        ),
+        (
+            [((reverse_heuristic or (lambda _: 0))(goal), 0, goal)],
+            {goal: 0},
+            {goal: None},
+            set(),
+            get_reverse_neighbors_with_cost or get_neighbors_with_cost,
+            reverse_heuristic or (lambda _: 0),
+        ),
+    ]
+    best = 0 if start == goal else None
+    meeting = start if start == goal else None
+    if stats is not None:
+        stats.pushes += 2
+
+    while sides[0][0] and sides[1][0]:
+        # Either side's smallest f-score bounds every path not yet found
+        if best is not None and max(sides[0][0][0][0], sides[1][0][0][0]) >= best:
+            break
+
+        side = 0 if len(sides[0][0]) <= len(sides[1][0]) else 1
+        queue, g_scores, parents, closed, neighbors, estimate = sides[side]
+        other_g = sides[1 - side][1]
+
+        _, g_score, current = heapq.heappop(queue)
+        if current in closed:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        closed.add(current)
+
+        successors = neighbors(current)
+        if stats is not None:
+            stats.expand(len(sides[0][0]) + len(sides[1][0]) + 1, len(successors))
+
+        for neighbor, cost in successors:
+            new_g_score = g_score + cost
+
+            if neighbor not in g_scores or new_g_score < g_scores[neighbor]:
+                g_scores[neighbor] = new_g_score
+                parents[neighbor] = current
+                heapq.heappush(queue, (new_g_score + estimate(neighbor), new_g_score, neighbor))
+                if stats is not None:
+                    stats.pushes += 1
+
+            if neighbor in other_g:
+                total = g_scores[neighbor] + other_g[neighbor]
+                if best is None or total < best:
+                    best, meeting = total, neighbor
+
+    if best is None:
+        return None, None
+    forward = _walk_parents(meeting, sides[0][2])
+    backward = _walk_parents(sides[1][2][meeting], sides[1][2])
+    return best, forward[::-1] + backward
+
+
+@_timed
+def jump_point_search(
+    grid: Grid,
+    start: Tuple[int, int],
+    goal: Tuple[int, int],
+    walls: Union[str, Callable[[int, int], bool]] = "#",
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Tuple[Optional[int], Optional[List[Tuple[int, int]]]]:
+    """
+    Shortest 4-connected path on a uniform-cost grid using jump point search.
+
+    Gives the same distance as bfs() but only expands jump points: cells where a
+    shortest path may have to turn. Straight runs are scanned without touching
+    the heap, so open areas with many equal-length paths cost one scan per row
+    or column instead of one expansion per cell. Mazes where nearly every cell
+    is a turn gain little over a plain BFS.
+
+    Paths are canonicalised as "vertical first": horizontal scans stop at cells
+    with a forced vertical neighbour, and vertical scans stop at any cell whose
+    horizontal scans reach a jump point.
+
+    Args:
+        grid: Grid to search; positions are (row, col)
+        start: Starting position
+        goal: Target position
+        walls: Characters that block movement, or a function is_wall(row, col)
+        stats: Optional SearchStats to record work in (expansions are jump points)
+
+    Returns:
+        Tuple of (distance, path) with every cell of the path, or (None, None)
+        if the goal is unreachable
+
+    Example:
+        grid = Grid.from_file('input.txt')
+        distance, path = jump_point_search(grid, grid.find('S'), grid.find('E'))
+    """
+    width = grid.cols + 2  # One-cell wall border, so scans need no bounds checks
+    passable = bytearray(width * (grid.rows + 2))
+    if callable(walls):
+        for row in range(grid.rows):
+            base = (row + 1) * width + 1
+            for col in range(grid.cols):
+                passable[base + col] = not walls(row, col)
+    else:
+        open_cells = bytes(chr(code) not in walls for code in range(256))
+        for row in range(grid.rows):
+            base = (row + 1) * width + 1
+            line = "".join(grid.data[row])
+            try:
+                passable[base : base + grid.cols] = line.encode("latin-1").translate(open_cells)
+            except UnicodeEncodeError:  # Box-drawing or other wide characters
+                passable[base : base + grid.cols] = bytes(cell not in walls for cell in line)
+
+    source = (start[0] + 1) * width + start[1] + 1
+    target = (goal[0] + 1) * width + goal[1] + 1
+    if not passable[source] or not passable[target]:
+        return None, None
+    goal_row, goal_col = divmod(target, width)
+
+    # Vertical scans repeat the horizontal scans of every row they cross. Those
+    # only depend on the grid, so each cell remembers its result per direction.
+    row_jumps = {step: array("i", [-2]) * len(passable) for step in (1, -1)}
+
+    def scan_row(node: int, step: int) -> int:
+        """First jump point east (step 1) or west (step -1) of node, or -1."""
+        known = row_jumps[step]
+        scanned = []
+        found = -1
+        while known[node] == -2:
+            scanned.append(node)
+            node += step
+            if not passable[node]:
+                break
+            if (
+                node == target
+                or (passable[node + width] and not passable[node - step + width])
+                or (passable[node - width] and not passable[node - step - width])
+            ):
+                found = node  # Forced neighbour: a path around an obstacle turns here
+                break
+        else:
+            found = known[node]
+        for cell in scanned:
+            known[cell] = found
+        return found
+
+    def jump(node: int, step: int) -> int:
+        """Scan from node in direction step; return the first jump point or -1."""
+        if step == 1 or step == -1:
+            return scan_row(node, step)
+        node += step
+        while passable[node]:
+            if (
+                node == target
+                or (passable[node + 1] and not passable[node - step + 1])
+                or (passable[node - 1] and not passable[node - step - 1])
+                or scan_row(node, 1) >= 0
+                or scan_row(node, -1) >= 0
+            ):
+                return node
+            node += step
+        return -1
+
+    def heuristic(node: int) -> int:
+        row, col = divmod(node, width)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    # Queue entries carry the step used to reach the node (0 for the start)
+    queue = [(heuristic(source), 0, source, 0)]
+    g_scores = {source: 0}
+    parents: Dict[int, Optional[int]] = {source: None}
+    closed = set()
+    if stats is not None:
+        stats.pushes += 1
+
+    while queue:
+        _, g_score, current, arrived = heapq.heappop(queue)
+        if current in closed:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        closed.add(current)
+
+        if current == target:
+            path = []
+            node = current
+            while parents[node] is not None:
+                parent = parents[node]
+                step = 1 if abs(node - parent) < width else width
+                step = step if node > parent else -step
+                path.extend(range(node, parent, -step))
+                node = parent
+            path.append(source)
+            return g_score, [((node // width) - 1, (node % width) - 1) for node in path[::-1]]
+
+        if arrived == 0:
+            steps: Tuple[int, ...] = (1, -1, width, -width)
+        elif arrived == 1 or arrived == -1:
+            steps = (arrived, width, -width)
+        else:
+            steps = (arrived, 1, -1)
+
+        successors = []
+        for step in steps:
+            node = jump(current, step)
+            if node >= 0:
+                successors.append((node, abs(node - current) // abs(step), step))
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(successors))
+
+        for node, cost, step in successors:
+            new_g_score = g_score + cost
+            if node not in g_scores or new_g_score < g_scores[node]:
+                g_scores[node] = new_g_score
+                parents[node] = current
+                heapq.heappush(queue, (new_g_score + heuristic(node), new_g_score, node, step))
+                if stats is not None:
+                    stats.pushes += 1
+
+    return None, None
+
+
+@_timed
+def find_all_paths_dfs(
+    start: T,
+    get_neighbors: Callable[[T], List[T]],
+    is_goal: Callable[[T], bool],
+    max_length: Optional[int] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> List[List[T]]:
+    """
+    Find all simple paths from start to any goal using an iterative DFS.
+
+    Returns the same paths as find_all_paths_bfs (in depth-first order), but
+    keeps a single path list that is extended and truncated while
+    backtracking. A path is only copied when it reaches a goal, and cycle checks
+    use a set rather than scanning the path.
+
+    Args:
+        start: Starting node
+        get_neighbors: Function that returns list of neighbors
+        is_goal: Function to check if node is a goal (paths stop at goals)
+        max_length: Optional maximum number of nodes in a path
+        stats: Optional SearchStats to record work in (the frontier is the path length)
+
+    Returns:
+        List of paths, where each path is a list of nodes
+
+    Example:
+        paths = find_all_paths_dfs(
+            start='you',
+            get_neighbors=lambda node: graph.get(node, []),
+            is_goal=lambda node: node == 'out',
+        )
+    """
+    if is_goal(start):
+        return [[start]]
+    if max_length is not None and max_length < 2:
+        return []
+
+    path = [start]
+    on_path = {start}
+    all_paths = []
+    neighbors = get_neighbors(start)
+    if stats is not None:
+        stats.pushes += 1
+        stats.expand(1, len(neighbors))
+    stack = [iter(neighbors)]
+
+    while stack:
+        for neighbor in stack[-1]:
+            if neighbor in on_path:
+                continue  # Avoid cycles
+            if is_goal(neighbor):
+                all_paths.append(path + [neighbor])
+            elif max_length is None or len(path) + 1 < max_length:
+                path.append(neighbor)
+                on_path.add(neighbor)
+                neighbors = get_neighbors(neighbor)
+                if stats is not None:
+                    stats.pushes += 1
+                    stats.expand(len(path), len(neighbors))
+                stack.append(iter(neighbors))
+                break
+        else:
+            stack.pop()
+            on_path.discard(path.pop())
+
+    return all_paths
+
+
+@_timed
+def count_paths(
+    start: T,
+    get_neighbors: Callable[[T], List[T]],
+    is_goal: Callable[[T], bool],
+    *,
+    stats: Optional[SearchStats] = None,
+) -> int:
+    """
+    Count paths from start to any goal in a directed acyclic graph.
+
+    Each node's count is the sum of its successors' counts, memoised and
+    computed in post-order with an explicit stack, so graphs of any depth work
+    without raising the recursion limit. Paths stop at the first goal reached.
+
+    Args:
+        start: Starting node
+        get_neighbors: Function that returns list of successors
+        is_goal: Function to check if node is a goal
+        stats: Optional SearchStats to record work in (the frontier is the stack)
+
+    Returns:
+        Number of distinct paths
+
+    Raises:
+        ValueError: If a cycle is reachable from start (the count would be infinite)
+
+    Example:
+        total = count_paths('svr', lambda node: graph.get(node, []), lambda node: node == 'out')
+    """
+    counts: Dict[T, int] = {}
+    in_progress: Set[T] = set()
+    stack: List[Tuple[T, Optional[List[T]]]] = [(start, None)]
+    if stats is not None:
+        stats.pushes += 1
+
+    while stack:
+        node, successors = stack.pop()
+        if node in counts:
+            if stats is not None:
+                stats.stale_pops += 1
+            continue
+        if is_goal(node):
+            counts[node] = 1
+            continue
+
+        if successors is None:
+            if node in in_progress:
+                raise ValueError(f"Cycle through {node!r}; path count is unbounded")
+            in_progress.add(node)
+            successors = list(get_neighbors(node))
+            if stats is not None:
+                stats.expand(len(stack) + 1, len(successors))
+            stack.append((node, successors))
+            for successor in successors:
+                if successor not in counts:
+                    stack.append((successor, None))
+                    if stats is not None:
+                        stats.pushes += 1
+        else:
+            in_progress.discard(node)
+            counts[node] = sum(counts[successor] for successor in successors)
+
+    return counts[start]
+
+
+class PathCounter:
+    """
+    Count paths in a directed acyclic graph, optionally through or around waypoints.
+
+    The graph is interned and topologically sorted once. Each query is then a
+    single forward pass over the nodes between start and goal in topological
+    order, carrying per node a count for every subset of required waypoints
+    seen so far. Forbidden waypoints are skipped rather than removed from the
+    graph, so any number of queries share the same tables.
+
+    Example:
+        counter = PathCounter(graph)
+        counter.count('svr', 'out', required=['dac', 'fft'])
+    """
+
+    def __init__(self, graph: Dict[T, Iterable[T]]):
+        """
+        Build the topological order.
+
+        Args:
+            graph: Adjacency list mapping each node to its successors; nodes
+                that only appear as successors are included
+
+        Raises:
+            ValueError: If the graph has a cycle
+        """
+        index: Dict[T, int] = {}
+        for node, successors in graph.items():
+            index.setdefault(node, len(index))
+            for successor in successors:
+                index.setdefault(successor, len(index))
+
+        nodes = list(index)
+        edges: List[List[int]] = [[] for _ in nodes]
+        in_degree = [0] * len(nodes)
+        for node, successors in graph.items():
+            for successor in successors:
+                edges[index[node]].append(index[successor])
+                in_degree[index[successor]] += 1
+
+        # Kahn's algorithm
+        order = [i for i, degree in enumerate(in_degree) if degree == 0]
+        for i in order:
+            for successor in edges[i]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    order.append(successor)
+        if len(order) < len(nodes):
+            raise ValueError("Graph has a cycle; path counts are unbounded")
+
+        position = {old: new for new, old in enumerate(order)}
+        self.nodes: List[T] = [nodes[i] for i in order]
+        self.index: Dict[T, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.successors: List[Tuple[int, ...]] = [
+            tuple(position[successor] for successor in edges[i]) for i in order
+        ]
+
+    def count(
+        self,
+        start: T,
+        goal: T,
+        required: Iterable[T] = (),
+        forbidden: Iterable[T] = (),
+    ) -> int:
+        """
+        Count paths from start to goal.
+
+        Args:
+            start: First node of every path
+            goal: Last node of every path
+            required: Nodes every counted path must visit
+            forbidden: Nodes no counted path may visit
+
+        Returns:
+            Number of distinct paths meeting the constraints (0 if start or
+            goal is not in the graph)
+        """
+        if start not in self.index or goal not in self.index:
+            return 0
+        first, last = self.index[start], self.index[goal]
+        if first > last:
+            return 0
+
+        required = list(dict.fromkeys(required))
+        if any(node not in self.index for node in required):
+            return 0
+        bits = {self.index[node]: 1 << i for i, node in enumerate(required)}
+        blocked = {self.index[node] for node in forbidden if node in self.index}
+        if first in blocked or last in blocked:
+            return 0
+
+        # counts[i][mask]: paths from start to node i that visited exactly the
+        # required waypoints in mask; only filled for nodes reached so far
+        states = 1 << len(bits)
+        counts: Dict[int, List[int]] = {first: [0] * states}
+        counts[first][bits.get(first, 0)] = 1
+
+        for i in range(first, last):
+            ways = counts.pop(i, None)
+            if ways is None:
+                continue
+            for successor in self.successors[i]:
+                if successor > last or successor in blocked:
+                    continue
+                target = counts.get(successor)
+                if target is None:
+                    target = counts[successor] = [0] * states
+                bit = bits.get(successor, 0)
+                for mask, ways_to_mask in enumerate(ways):
+                    if ways_to_mask:
+                        target[mask | bit] += ways_to_mask
+
+        return counts[last][states - 1] if last in counts else 0
+
+
 def find_all_paths_bfs(
     start: T,
     get_neighbors: Callable[[T], List[T]],
     is_goal: Callable[[T], bool],
     max_length: Optional[int] = None,
+    *,
+    stats: Optional[SearchStats] = None,
 ) -> List[List[T]]:
     """
     Find all paths from start to any goal using BFS.
@@ -228,6 +1671,7 @@ def find_all_paths_bfs(
         get_neighbors: Function that returns list of neighbors
         is_goal: Function to check if node is a goal
         max_length: Optional maximum path length
+        stats: Optional SearchStats to record work in
 
     Returns:
         List of paths, where each path is a list of nodes
@@ -240,21 +1684,80 @@ def find_all_paths_bfs(
             max_length=10
         )
     """
-    queue = deque([(start, [start])])
-    all_paths = []
+    return list(iter_all_paths_bfs(start, get_neighbors, is_goal, max_length, stats=stats))
 
-    while queue:
-        current, path = queue.popleft()
 
-        if max_length and len(path) > max_length:
-            continue
+def iter_all_paths_bfs(
+    start: T,
+    get_neighbors: Callable[[T], List[T]],
+    is_goal: Callable[[T], bool],
+    max_length: Optional[int] = None,
+    *,
+    stats: Optional[SearchStats] = None,
+) -> Iterator[List[T]]:
+    """
+    Lazily yield all simple paths from start to any goal in BFS order.
+
+    Queue entries are (node, parent_entry, length) so paths share their
+    prefixes instead of each holding a list; an entry is constant size however
+    many nodes the search has seen. The cycle check walks the parent chain, which
+    costs O(length) time but allocates nothing. A path is only built, by
+    following parent pointers, when it is yielded.
+
+    Args:
+        start: Starting node
+        get_neighbors: Function that returns list of neighbors
+        is_goal: Function to check if node is a goal (paths stop at goals)
+        max_length: Optional maximum path length
+        stats: Optional SearchStats to record work in; elapsed_s excludes time
+            spent by the caller between yields
+
+    Yields:
+        Each path as a list of nodes, shortest paths first
+
+    Example:
+        for path in iter_all_paths_bfs(start, get_neighbors, is_goal):
+            if good_enough(path):
+                break  # Remaining paths are never built
+    """
+    queue = deque([(start, None, 1)])
+    if stats is not None:
+        stats.pushes += 1
+        started = time.perf_counter()
+
+    while queue:
+        entry = queue.popleft()
+        current, _, length = entry
 
         if is_goal(current):
-            all_paths.append(path)
+            path = []
+            while entry is not None:
+                path.append(entry[0])
+                entry = entry[1]
+            path.reverse()
+            if stats is None:
+                yield path
+            else:
+                stats.elapsed_s += time.perf_counter() - started
+                yield path
+                started = time.perf_counter()
             continue
 
-        for neighbor in get_neighbors(current):
-            if neighbor not in path:  # Avoid cycles
-                queue.append((neighbor, path + [neighbor]))
+        if max_length and length >= max_length:
+            continue  # Children would exceed max_length
 
-    return all_paths
+        neighbors = get_neighbors(current)
+        if stats is not None:
+            stats.expand(len(queue) + 1, len(neighbors))
+
+        for neighbor in neighbors:
+            ancestor = entry
+            while ancestor is not None and ancestor[0] != neighbor:
+                ancestor = ancestor[1]
+            if ancestor is None:  # Avoid cycles
+                queue.append((neighbor, entry, length + 1))
+                if stats is not None:
+                    stats.pushes += 1
+
+    if stats is not None:
+        stats.elapsed_s += time.perf_counter() - started
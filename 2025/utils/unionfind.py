@@ -0,0 +1,108 @@
+"""
+Union-Find (disjoint set) for connected components.
+
+Common patterns from AoC: 2025 Day 8 (Kruskal), 2024 Days 12 and 18 (regions, connectivity)
+"""
+
+from collections import Counter
+from typing import List
+
+
+class UnionFind:
+    """
+    Disjoint sets over the ints 0..n-1 with union by size.
+
+    The number of components and a histogram of component sizes are updated on
+    every union, so both are available in O(1) rather than by scanning all
+    elements. find() is iterative with path halving, so long chains never hit
+    the recursion limit.
+
+    Attributes:
+        parent: Parent of each element (roots are their own parent)
+        size: Component size, valid at roots
+        components: Current number of components
+
+    Example usage:
+        uf = UnionFind(len(points))
+        for _, i, j in sorted_edges:
+            if uf.union(i, j) and uf.components == 1:
+                break
+        a, b, c = uf.largest(3)
+    """
+
+    def __init__(self, n: int):
+        """Initialize with n separate components."""
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+        self._size_counts = Counter({1: n}) if n else Counter()
+
+    def find(self, x: int) -> int:
+        """Find root of component containing x, halving the path on the way."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """
+        Union components containing x and y.
+
+        Returns:
+            True if they were in different components, False if already connected
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        # Union by size: attach the smaller tree under the larger root
+        size_x, size_y = self.size[root_x], self.size[root_y]
+        if size_x < size_y:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] = size_x + size_y
+        self.components -= 1
+
+        counts = self._size_counts
+        for old in (size_x, size_y):
+            counts[old] -= 1
+            if not counts[old]:
+                del counts[old]
+        counts[size_x + size_y] += 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        """Check whether x and y are in the same component."""
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        """Size of the component containing x."""
+        return self.size[self.find(x)]
+
+    def largest(self, k: int) -> List[int]:
+        """
+        Sizes of the k largest components, largest first.
+
+        Walks the size histogram, whose distinct sizes number at most about
+        sqrt(2n), instead of every element.
+        """
+        sizes: List[int] = []
+        for size in sorted(self._size_counts, reverse=True):
+            sizes.extend([size] * min(self._size_counts[size], k - len(sizes)))
+            if len(sizes) == k:
+                break
+        return sizes
+
+    def get_component_sizes(self) -> List[int]:
+        """Get sizes of all connected components, largest first."""
+        return self.largest(self.components)
+
+    def count_components(self) -> int:
+        """Count number of distinct connected components."""
+        return self.components
+
+    def __len__(self) -> int:
+        """Number of elements."""
+        return len(self.parent)
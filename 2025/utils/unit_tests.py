@@ -0,0 +1,931 @@
+"""Unit tests for the 2025 utility library."""
+
+import random
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from collections import Counter
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils import (  # noqa: E402
+    ALL_DIRS,
+    CARDINAL_DIRS,
+    ArrayGrid,
+    CSRGraph,
+    FlatGrid,
+    Grid,
+    InternedGraph,
+    PathCounter,
+    RectilinearPolygon,
+    UnionFind,
+    bfs,
+    bfs_csr,
+    bfs_indexed,
+    bidirectional_a_star,
+    cached_parse,
+    count_paths,
+    dfs,
+    dial_dijkstra,
+    dijkstra,
+    dijkstra_csr,
+    distance_field,
+    iter_blocks,
+    iter_key_values,
+    iter_lines,
+    iter_records,
+    jump_point_search,
+    multi_source_bfs,
+    neighbor_counts,
+    parse_int_array,
+    parse_ints,
+    parsing,
+    polygon,
+    search,
+    zero_one_bfs,
+)
+from utils.search import find_all_paths_bfs  # noqa: E402
+
+
+def make_parser(body: str):
+    """Compile a cached parser whose location and name stay fixed while its body varies."""
+    source = "def parse(filename):\n    with open(filename) as f:\n        return " + body
+    namespace = {}
+    exec(compile(source, "edited_parser.py", "exec"), namespace)
+    return cached_parse()(namespace["parse"])
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for the on-disk parse cache."""
+
+    def setUp(self):
+        """Point the cache at a fresh directory and write a small input."""
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(parsing, "CACHE_DIR", Path(self.tmp.name) / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.test_file = str(Path(self.tmp.name) / "input.txt")
+        with open(self.test_file, "w") as f:
+            f.write("a,b;c\n")
+
+    def test_repeat_call_hits_cache(self):
+        """An unchanged parser reuses its entry."""
+        parser = make_parser("f.read().strip().split(',')\n")
+        self.assertEqual(parser(self.test_file), ["a", "b;c"])
+        self.assertEqual(parser(self.test_file), ["a", "b;c"])
+        self.assertEqual(len(list(parsing.CACHE_DIR.glob("*.pickle"))), 1)
+
+    def test_edited_parser_invalidates_entry(self):
+        """Changing a literal, a called name or a nested function misses the cache."""
+        edits = [
+            ("f.read().strip().split(',')\n", ["a", "b;c"]),
+            ("f.read().strip().split(';')\n", ["a,b", "c"]),
+            ("f.read().strip().rsplit(',')\n", ["a", "b;c"]),
+            ("[s.upper() for s in f.read().strip().split(',')]\n", ["A", "B;C"]),
+            ("[s.lower() for s in f.read().strip().split(',')]\n", ["a", "b;c"]),
+            ("[s for s in f.read().strip().split(',') if s in {'a', 'x'}]\n", ["a"]),
+            ("[s for s in f.read().strip().split(',') if s in {'b;c', 'x'}]\n", ["b;c"]),
+        ]
+        for body, expected in edits:
+            with self.subTest(body=body):
+                self.assertEqual(make_parser(body)(self.test_file), expected)
+        self.assertEqual(len(list(parsing.CACHE_DIR.glob("*.pickle"))), len(edits))
+
+
+class TestParseIntArray(unittest.TestCase):
+    """Test cases for bulk integer extraction."""
+
+    def setUp(self):
+        """Parse without touching the shared cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(parsing, "CACHE_DIR", Path(self.tmp.name) / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.test_file = str(Path(self.tmp.name) / "input.txt")
+
+    def write(self, text: str) -> None:
+        """Write the test input."""
+        with open(self.test_file, "w") as f:
+            f.write(text)
+
+    def test_int64_limits_are_exact(self):
+        """Values at the int64 limits, and long zero-padded ones, parse exactly."""
+        text = "9223372036854775807,-9223372036854775808\n"
+        text += "1000000000000000000 -0000000000000000000042\n"
+        self.write(text)
+        expected = parse_ints(text)
+        self.assertEqual(list(parse_int_array(self.test_file)), expected)
+        self.assertEqual(parse_int_array(self.test_file, as_numpy=True).tolist(), expected)
+        self.assertEqual(
+            parse_int_array(self.test_file, arity=2, as_numpy=True).tolist(),
+            [expected[:2], expected[2:]],
+        )
+
+    def test_overflow_raises(self):
+        """Values outside int64 raise instead of being clamped, with or without NumPy."""
+        for text in ("1,99999999999999999999\n", "9223372036854775808\n", "-9223372036854775809\n"):
+            self.write(text)
+            for as_numpy in (False, True):
+                with self.subTest(text=text, as_numpy=as_numpy):
+                    with self.assertRaises(OverflowError):
+                        parse_int_array(self.test_file, as_numpy=as_numpy)
+
+
+class TestStreamingParsers(unittest.TestCase):
+    """Test cases for the lazy iter_* parsers."""
+
+    def setUp(self):
+        """Keep the parse_* counterparts out of the shared cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(parsing, "CACHE_DIR", Path(self.tmp.name) / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.test_file = str(Path(self.tmp.name) / "input.txt")
+
+    def write(self, data: bytes) -> None:
+        """Write the test input as raw bytes, so line endings are exact."""
+        with open(self.test_file, "wb") as f:
+            f.write(data)
+
+    def test_match_eager_parsers(self):
+        """Each iterator yields what its parse_* counterpart returns."""
+        self.write(b"name: ada\nrole : engineer\n\n  x,y ,z  \nno separator\n")
+        self.assertEqual(list(iter_lines(self.test_file)), parsing.parse_lines(self.test_file))
+        self.assertEqual(list(iter_records(self.test_file)), parsing.parse_csv(self.test_file))
+        self.assertEqual(
+            list(iter_records(self.test_file, skip_header=True)),
+            parsing.parse_csv(self.test_file, skip_header=True),
+        )
+        pairs = parsing.parse_key_value(self.test_file)
+        self.assertEqual(dict(iter_key_values(self.test_file)), pairs)
+        self.assertEqual(list(iter_blocks(self.test_file)), parsing.parse_blocks(self.test_file))
+        self.assertEqual(
+            list(iter_lines(self.test_file, strip=False, skip_empty=False)),
+            ["name: ada\n", "role : engineer\n", "\n", "  x,y ,z  \n", "no separator\n"],
+        )
+
+    def test_blocks_separators(self):
+        """Runs of blank, whitespace-only or CRLF lines all split blocks once."""
+        self.write(b"\n\n  a\r\nb \r\n\r\n \t\r\n\nc\n\n")
+        self.assertEqual(list(iter_blocks(self.test_file)), [["  a", "b "], ["c"]])
+        self.write(b"a\r\nb")
+        self.assertEqual(list(iter_blocks(self.test_file)), [["a", "b"]])
+
+    def test_empty_file(self):
+        """An empty file yields nothing, and next() can take a default."""
+        self.write(b"")
+        for iterator in (
+            iter_lines(self.test_file),
+            iter_blocks(self.test_file),
+            iter_records(self.test_file, skip_header=True),
+            iter_key_values(self.test_file),
+        ):
+            self.assertIsNone(next(iterator, None))
+
+
+class TestInternedGraph(unittest.TestCase):
+    """Test cases for parse_graph(interned=True) against the plain dict graph."""
+
+    def setUp(self):
+        """Parse into a fresh cache directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(parsing, "CACHE_DIR", Path(self.tmp.name) / "cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.test_file = str(Path(self.tmp.name) / "input.txt")
+
+    def write_random_graph(self, rng: random.Random, nodes: int, edges: int) -> None:
+        """Write 'ab-cd' lines over random two- or three-letter names."""
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        names = set()
+        while len(names) < nodes:
+            names.add("".join(rng.choice(letters) for _ in range(rng.choice([2, 3]))))
+        names = sorted(names)
+        with open(self.test_file, "w") as f:
+            for _ in range(edges):
+                f.write(f"{rng.choice(names)}-{rng.choice(names)}\n")
+
+    def check_matches_dict(self, rng: random.Random, directed: bool, bitsets: bool) -> None:
+        """Names, neighbours, edge tests and common neighbours all match the dict."""
+        plain = parsing.parse_graph(self.test_file, directed=directed)
+        graph = parsing.parse_graph(self.test_file, directed=directed, interned=True)
+        self.assertIsInstance(graph, InternedGraph)
+        names = sorted(set(plain) | {b for targets in plain.values() for b in targets})
+        self.assertEqual(graph.names, names)
+        self.assertEqual(len(graph), len(names))
+        self.assertEqual(graph.bits is not None, bitsets)
+
+        for name in names:
+            neighbors = [graph.names[i] for i in graph.neighbors(graph.id(name))]
+            self.assertEqual(neighbors, plain.get(name, []))
+        for _ in range(300):
+            a, b = rng.choice(names), rng.choice(names)
+            self.assertEqual(graph.has_edge(graph.id(a), graph.id(b)), b in plain.get(a, []))
+            if bitsets:
+                common = graph.bits[graph.id(a)] & graph.bits[graph.id(b)]
+                expected = sorted(set(plain.get(a, [])) & set(plain.get(b, [])))
+                self.assertEqual([graph.names[i] for i in graph.members(common)], expected)
+
+    def test_small_graph_uses_bitsets(self):
+        """Up to BITSET_MAX_NODES nodes, edge tests go through the bitmasks."""
+        rng = random.Random(23)
+        for directed in (False, True):
+            self.write_random_graph(rng, 60, 200)
+            with self.subTest(directed=directed):
+                self.check_matches_dict(rng, directed, bitsets=True)
+            with self.subTest(directed=directed, bitsets=False):
+                with mock.patch.object(search, "BITSET_MAX_NODES", 0):
+                    parsing.clear_parse_cache()
+                    self.check_matches_dict(rng, directed, bitsets=False)
+
+    def test_large_graph_skips_bitsets(self):
+        """Past BITSET_MAX_NODES nodes only the CSR arrays are built."""
+        rng = random.Random(24)
+        self.write_random_graph(rng, search.BITSET_MAX_NODES + 300, 6000)
+        self.check_matches_dict(rng, directed=False, bitsets=False)
+
+
+def random_lines(rng: random.Random, rows: int, cols: int, chars: str = ".#") -> List[str]:
+    """Random equal-length rows drawn from chars."""
+    return ["".join(rng.choice(chars) for _ in range(cols)) for _ in range(rows)]
+
+
+class TestGrids(unittest.TestCase):
+    """Test cases for the flat and NumPy grid representations."""
+
+    SHAPES = [(1, 1), (1, 5), (5, 1), (2, 2), (3, 4), (6, 7)]
+
+    def test_neighbor_tables(self):
+        """Tables match a bounds-checked scan at edges and corners, in both modes."""
+        rng = random.Random(7)
+        for rows, cols in self.SHAPES:
+            for lines in (["." * cols] * rows, random_lines(rng, rows, cols)):
+                grid = FlatGrid(lines)
+                for diagonal, directions in ((False, CARDINAL_DIRS), (True, ALL_DIRS)):
+                    expected = []
+                    for row in range(rows):
+                        for col in range(cols):
+                            steps = [(row + d.value[0], col + d.value[1]) for d in directions]
+                            expected.append(
+                                ()
+                                if lines[row][col] == "#"
+                                else tuple(
+                                    grid.index(r, c)
+                                    for r, c in steps
+                                    if 0 <= r < rows and 0 <= c < cols and lines[r][c] != "#"
+                                )
+                            )
+                    with self.subTest(lines=lines, diagonal=diagonal):
+                        self.assertEqual(grid.neighbors(diagonal), expected)
+
+        corners = FlatGrid(["...", "...", "..."]).neighbors
+        self.assertEqual(corners()[0], (1, 3))  # Right, down
+        self.assertEqual(corners()[8], (5, 7))  # Up, left
+        self.assertEqual(corners(diagonal=True)[0], (1, 3, 4))
+        self.assertEqual(len(corners(diagonal=True)[4]), 8)
+        self.assertEqual(corners(diagonal=True)[2], (5, 1, 4))  # Down, left, down-left
+
+    def test_find_missing(self):
+        """Missing characters give None and an empty list on every grid type."""
+        lines = ["#.S", "...", "S.#"]
+        flat, array, grid = FlatGrid(lines), ArrayGrid.from_lines(lines), Grid.from_lines(lines)
+        self.assertEqual((flat.find("S"), flat.find_all("S")), (2, [2, 6]))
+        self.assertEqual((array.find("S"), array.find_all("S")), ((0, 2), [(0, 2), (2, 0)]))
+        self.assertEqual(array.find_all("S"), grid.find_all("S"))
+        for missing in ("E", "@"):
+            self.assertIsNone(flat.find(missing))
+            self.assertIsNone(array.find(missing))
+            self.assertIsNone(grid.find(missing))
+            self.assertEqual(flat.find_all(missing), [])
+            self.assertEqual(array.find_all(missing), [])
+        empty = ArrayGrid.from_lines([])
+        self.assertEqual((empty.find("S"), empty.find_all("S")), (None, []))
+
+    def test_neighbor_counts(self):
+        """Vectorised counts match counting each cell's neighbours one by one."""
+        rng = random.Random(8)
+        for rows, cols in self.SHAPES:
+            lines = random_lines(rng, rows, cols, ".@@")
+            grid = ArrayGrid.from_lines(lines)
+            for diagonal, directions in ((False, CARDINAL_DIRS), (True, ALL_DIRS)):
+                expected = [
+                    [
+                        sum(
+                            0 <= row + d.value[0] < rows
+                            and 0 <= col + d.value[1] < cols
+                            and lines[row + d.value[0]][col + d.value[1]] == "@"
+                            for d in directions
+                        )
+                        for col in range(cols)
+                    ]
+                    for row in range(rows)
+                ]
+                with self.subTest(lines=lines, diagonal=diagonal):
+                    self.assertEqual(grid.neighbor_counts("@", diagonal).tolist(), expected)
+                    mask = grid.mask("@")
+                    self.assertEqual(neighbor_counts(mask, diagonal).tolist(), expected)
+
+
+def random_blob(rng: random.Random, width: int, height: int) -> set:
+    """A random 4-connected set of unit squares with its holes filled."""
+    squares = {(rng.randrange(width), rng.randrange(height))}
+    for _ in range(rng.randint(0, width * height // 2)):
+        x, y = rng.choice(sorted(squares))
+        dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
+        if 0 <= x + dx < width and 0 <= y + dy < height:
+            squares.add((x + dx, y + dy))
+
+    outside, stack = set(), [(-1, -1)]
+    while stack:
+        x, y = stack.pop()
+        if (x, y) in outside or (x, y) in squares or not (-1 <= x <= width and -1 <= y <= height):
+            continue
+        outside.add((x, y))
+        stack += [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+    return {(x, y) for x in range(width) for y in range(height) if (x, y) not in outside}
+
+
+def trace_outline(squares: set) -> list:
+    """Corners of the outline of a blob in loop order, or [] if it pinches at a corner."""
+    edges = {}
+    for x, y in squares:
+        corners = [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)]
+        for a, b in zip(corners, corners[1:] + corners[:1]):
+            if (b, a) in edges:
+                del edges[b, a]
+            else:
+                edges[a, b] = True
+    following = {}
+    for a, b in edges:
+        if a in following:
+            return []  # Two squares touching only at a corner
+        following[a] = b
+    loop = [next(iter(following))]
+    while following[loop[-1]] != loop[0]:
+        loop.append(following[loop[-1]])
+    if len(loop) != len(following):
+        return []
+    return [
+        b
+        for a, b, c in zip(loop[-1:] + loop[:-1], loop, loop[1:] + loop[:1])
+        if not (a[0] == b[0] == c[0] or a[1] == b[1] == c[1])
+    ]
+
+
+def tile_in_polygon(x: int, y: int, vertices: list) -> bool:
+    """Brute-force check of a tile: on an edge, or inside by the even-odd rule."""
+    inside = False
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+            return True
+        if x1 == x2 > x and min(y1, y2) <= y < max(y1, y2):
+            inside = not inside
+    return inside
+
+
+class TestRectilinearPolygon(unittest.TestCase):
+    """Test cases for rectilinear polygon queries."""
+
+    def random_polygons(self, seed: int, count: int):
+        """Traced random blobs with stretched gaps and width-1 slits."""
+        rng = random.Random(seed)
+        while count:
+            vertices = trace_outline(random_blob(rng, rng.randint(2, 8), rng.randint(2, 8)))
+            if not vertices:
+                continue
+            stretch = []
+            for axis in (0, 1):
+                coords, total = {}, 0
+                for value in sorted({vertex[axis] for vertex in vertices}):
+                    total += rng.choice([1, 1, 2, 4])  # 1 leaves no tiles in between
+                    coords[value] = total
+                stretch.append(coords)
+            vertices = [(stretch[0][x], stretch[1][y]) for x, y in vertices]
+            yield vertices[::-1] if rng.random() < 0.5 else vertices
+            count -= 1
+
+    def check_against_brute_force(self, seed: int):
+        """Points, area and rectangles agree with a tile-by-tile check."""
+        rng = random.Random(seed)
+        for vertices in self.random_polygons(seed, 40):
+            shape = RectilinearPolygon(vertices)
+            width = max(x for x, _ in vertices) + 2
+            height = max(y for _, y in vertices) + 2
+            tiles = {
+                (x, y)
+                for x in range(-1, width)
+                for y in range(-1, height)
+                if tile_in_polygon(x, y, vertices)
+            }
+            with self.subTest(vertices=vertices):
+                for x in range(-1, width):
+                    for y in range(-1, height):
+                        self.assertEqual(shape.contains_point(x, y), (x, y) in tiles)
+                self.assertEqual(shape.area(), len(tiles))
+                for _ in range(50):
+                    x1, x2 = sorted(rng.randrange(-1, width) for _ in range(2))
+                    y1, y2 = sorted(rng.randrange(-1, height) for _ in range(2))
+                    expected = all(
+                        (x, y) in tiles for x in range(x1, x2 + 1) for y in range(y1, y2 + 1)
+                    )
+                    self.assertEqual(shape.contains_rectangle(x1, y1, x2, y2), expected)
+
+    def test_dense_table_matches_brute_force(self):
+        """Summed-area table mode."""
+        self.check_against_brute_force(25)
+
+    def test_segment_tree_matches_brute_force(self):
+        """Segment tree mode, forced by lowering DENSE_MAX_CELLS."""
+        with mock.patch.object(polygon, "DENSE_MAX_CELLS", 0):
+            self.assertIsNotNone(RectilinearPolygon([(0, 0), (2, 0), (2, 2), (0, 2)])._tree)
+            self.check_against_brute_force(26)
+
+    def test_concave_slice(self):
+        """A U shape has two spans in its middle rows and none in the gap."""
+        u_shape = [(0, 0), (6, 0), (6, 6), (4, 6), (4, 2), (2, 2), (2, 6), (0, 6)]
+        for dense_max in (polygon.DENSE_MAX_CELLS, 0):
+            with mock.patch.object(polygon, "DENSE_MAX_CELLS", dense_max):
+                shape = RectilinearPolygon(u_shape)
+                with self.subTest(dense_max=dense_max):
+                    self.assertTrue(shape.contains_point(1, 4))
+                    self.assertFalse(shape.contains_point(3, 4))
+                    self.assertTrue(shape.contains_point(3, 2))
+                    self.assertTrue(shape.contains_rectangle(0, 0, 6, 2))
+                    self.assertFalse(shape.contains_rectangle(0, 0, 6, 3))
+                    self.assertTrue(shape.contains_rectangle(4, 0, 6, 6))
+                    self.assertEqual(shape.area(), 7 * 7 - 1 * 4)
+
+    def test_rejects_diagonal_edge(self):
+        """Edges must be horizontal or vertical."""
+        with self.assertRaises(ValueError):
+            RectilinearPolygon([(0, 0), (2, 0), (3, 3)])
+
+
+class TestUnionFind(unittest.TestCase):
+    """Test cases for the disjoint-set structure."""
+
+    def test_counts_match_relabelling(self):
+        """Components, the size histogram and largest() track a naive labelling."""
+        for seed in range(20):
+            rng = random.Random(seed)
+            n = rng.randint(1, 40)
+            uf = UnionFind(n)
+            label = list(range(n))
+            for _ in range(3 * n):
+                x, y = rng.randrange(n), rng.randrange(n)
+                merged = label[x] != label[y]
+                self.assertEqual(uf.union(x, y), merged)
+                if merged:
+                    old = label[y]
+                    label = [label[x] if value == old else value for value in label]
+
+                sizes = sorted(Counter(label).values(), reverse=True)
+                with self.subTest(seed=seed, x=x, y=y):
+                    self.assertEqual(uf.components, len(sizes))
+                    self.assertEqual(uf.count_components(), len(sizes))
+                    self.assertEqual(uf._size_counts, Counter(sizes))
+                    self.assertEqual(uf.get_component_sizes(), sizes)
+                    self.assertEqual(uf.component_size(x), label.count(label[x]))
+                    self.assertTrue(uf.connected(x, y) or not merged)
+                    for k in (0, 1, 3, len(sizes), len(sizes) + 5):
+                        self.assertEqual(uf.largest(k), sizes[:k])
+
+    def test_repeated_unions(self):
+        """Joining already-joined nodes changes nothing."""
+        uf = UnionFind(5)
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.union(1, 2))
+        for x, y in [(0, 1), (1, 0), (0, 2), (2, 2), (3, 3)]:
+            self.assertFalse(uf.union(x, y))
+        self.assertEqual(uf.components, 3)
+        self.assertEqual(uf.largest(10), [3, 1, 1])
+        self.assertEqual(uf._size_counts, Counter({3: 1, 1: 2}))
+
+    def test_empty(self):
+        """Zero elements have no components."""
+        uf = UnionFind(0)
+        self.assertEqual((uf.components, uf.largest(3), len(uf)), (0, [], 0))
+
+
+class TestSearch(unittest.TestCase):
+    """Test cases for search algorithms."""
+
+    def test_all_paths_skip_cycles(self):
+        """Paths never revisit a node, even around a cycle."""
+        graph = {"a": ["b", "c"], "b": ["a", "c", "d"], "c": ["b", "d"], "d": []}
+        paths = find_all_paths_bfs("a", graph.__getitem__, lambda node: node == "d")
+        self.assertEqual(
+            paths,
+            [["a", "b", "d"], ["a", "c", "d"], ["a", "b", "c", "d"], ["a", "c", "b", "d"]],
+        )
+
+    def test_bidirectional_a_star_matches_dijkstra(self):
+        """Stopping on either side's bound still finds the optimal cost."""
+        for seed in range(30):
+            rng = random.Random(seed)
+            size = rng.randint(2, 20)
+            cost = {(r, c): rng.randint(1, 5) for r in range(size) for c in range(size)}
+            for _ in range(size * size // 4):
+                cost.pop((rng.randrange(size), rng.randrange(size)), None)
+            start, goal = (0, 0), (size - 1, size - 1)
+            cost.setdefault(start, 1)
+            cost.setdefault(goal, 1)
+
+            def forward(pos):
+                r, c = pos
+                steps = [(r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)]
+                return [(step, cost[step]) for step in steps if step in cost]
+
+            def backward(pos):
+                return [(step, cost[pos]) for step, _ in forward(pos)]
+
+            distances, _, _ = dijkstra(start, forward)
+            best, path = bidirectional_a_star(
+                start,
+                goal,
+                forward,
+                lambda pos: goal[0] - pos[0] + goal[1] - pos[1],
+                backward,
+                lambda pos: pos[0] + pos[1],
+            )
+            with self.subTest(seed=seed):
+                self.assertEqual(best, distances.get(goal))
+                if best is not None:
+                    self.assertEqual((path[0], path[-1]), (start, goal))
+                    self.assertEqual(sum(cost[pos] for pos in path[1:]), best)
+
+    def test_dijkstra_max_weight_matches_heap(self):
+        """Deque and bucket queues give the heap's distances for their weights."""
+        for seed in range(40):
+            rng = random.Random(seed)
+            size = rng.randint(1, 30)
+            max_weight = rng.choice([1, search.DIAL_MAX_WEIGHT])
+            low = rng.choice([0, 1])
+            graph = {
+                node: [
+                    (rng.randrange(size), rng.randint(low, max_weight))
+                    for _ in range(rng.randint(0, 4))
+                ]
+                for node in range(size)
+            }
+            goal = rng.choice([None, rng.randrange(size)])
+            is_goal = None if goal is None else (lambda node: node == goal)
+            expected, found, _ = dijkstra(0, graph.__getitem__, is_goal)
+            queue = zero_one_bfs if max_weight == 1 else dial_dijkstra
+            with self.subTest(seed=seed, max_weight=max_weight):
+                inner = mock.Mock(wraps=queue.__wrapped__)
+                with mock.patch.object(search, queue.__name__, mock.Mock(__wrapped__=inner)):
+                    distances, reached, parents = dijkstra(
+                        0, graph.__getitem__, is_goal, max_weight=max_weight
+                    )
+                inner.assert_called_once()
+                self.assertEqual(reached, found)
+                if goal is None:
+                    self.assertEqual(distances, expected)
+                else:
+                    self.assertEqual(distances.get(goal), expected.get(goal))
+                for node, parent in parents.items():
+                    if parent is not None:
+                        costs = {cost for step, cost in graph[parent] if step == node}
+                        self.assertIn(distances[node] - distances[parent], costs)
+
+    def test_dijkstra_weight_above_max_weight(self):
+        """The bucket queue stays exact past max_weight; the 0/1 deque raises."""
+        graph = {"a": [("b", 150), ("c", 1)], "b": [("d", 1)], "c": [("d", 300)], "d": []}
+        expected, _, _ = dijkstra("a", graph.__getitem__)
+        distances, _, _ = dijkstra("a", graph.__getitem__, max_weight=50)
+        self.assertEqual(distances, expected)
+        self.assertEqual(distances["d"], 151)
+        with self.assertRaises(ValueError):
+            dijkstra("a", graph.__getitem__, max_weight=1)
+
+    def test_multi_source_matches_bfs_per_source(self):
+        """One sweep equals the minimum over bfs() from each source, earliest source on ties."""
+        for seed in range(40):
+            rng = random.Random(seed)
+            size = rng.randint(1, 40)
+            table = [
+                tuple(rng.sample(range(size), rng.randint(0, min(3, size))))
+                for _ in range(size)
+            ]
+            sources = [rng.randrange(size) for _ in range(rng.randint(1, 4))]
+            per_source = [bfs(source, table.__getitem__)[2] for source in sources]
+
+            expected_distances, expected_nearest = {}, {}
+            for node in range(size):
+                reached = [(d[node], i) for i, d in enumerate(per_source) if node in d]
+                if reached:
+                    distance, i = min(reached)
+                    expected_distances[node] = distance
+                    expected_nearest[node] = sources[i]
+
+            with self.subTest(seed=seed, sources=sources):
+                distances, nearest = multi_source_bfs(sources, table.__getitem__)
+                self.assertEqual((distances, nearest), (expected_distances, expected_nearest))
+
+                field, owner = distance_field(sources, table, with_sources=True)
+                self.assertEqual(distance_field(sources, table), field)
+                for node in range(size):
+                    self.assertEqual(field[node], expected_distances.get(node, -1))
+                    self.assertEqual(owner[node], expected_nearest.get(node, -1))
+
+                start = sources[0]
+                blocked = bytearray(rng.random() < 0.2 for _ in range(size))
+                blocked[start] = 0
+                goal = rng.choice([None, rng.randrange(size)])
+                open_table = [tuple(n for n in ns if not blocked[n]) for ns in table]
+                reference = bfs(start, open_table.__getitem__)[2]
+                dense, found = bfs_indexed(start, table, goal, blocked)
+                self.assertEqual(found, goal if goal in reference else None)
+                if found is None:
+                    self.assertEqual(list(dense), [reference.get(n, -1) for n in range(size)])
+                else:
+                    self.assertEqual(dense[goal], reference[goal])
+
+    def test_bfs_indexed_blocked_start(self):
+        """A blocked start reaches nothing, not even itself."""
+        distances, goal = bfs_indexed(0, [(1,), (0,)], 1, bytearray([1, 0]))
+        self.assertEqual((list(distances), goal), ([-1, -1], None))
+
+    def test_csr_matches_dict_searches(self):
+        """bfs_csr and dijkstra_csr agree with bfs and dijkstra on the same edges."""
+        for seed in range(40):
+            rng = random.Random(seed)
+            n = rng.randint(1, 30)
+            directed = rng.random() < 0.7
+            edges = [
+                (rng.randrange(n), rng.randrange(n), rng.randint(0, 9))
+                for _ in range(rng.randint(0, 3 * n))
+            ]
+            adjacency = {node: [] for node in range(n)}
+            for u, v, cost in edges:
+                adjacency[u].append((v, cost))
+                if not directed:
+                    adjacency[v].append((u, cost))
+            weighted = CSRGraph.from_edges(n, edges, directed)
+            unweighted = CSRGraph.from_edges(n, [edge[:2] for edge in edges], directed)
+            start = rng.randrange(n)
+            goal = rng.choice([None, rng.randrange(n)])
+
+            with self.subTest(seed=seed, directed=directed):
+                self.assertEqual(len(weighted), n)
+                self.assertIsNone(unweighted.weights)
+                for node in range(n):
+                    self.assertEqual(
+                        list(weighted.neighbors(node)), [v for v, _ in adjacency[node]]
+                    )
+
+                hops = bfs(start, lambda node: [v for v, _ in adjacency[node]])[2]
+                distances, found, parents = bfs_csr(unweighted, start)
+                self.assertIsNone(found)
+                self.assertEqual(list(distances), [hops.get(node, -1) for node in range(n)])
+                for node, parent in enumerate(parents):
+                    if parent >= 0:
+                        self.assertIn(node, unweighted.neighbors(parent))
+                        self.assertEqual(distances[node], distances[parent] + 1)
+                    else:
+                        self.assertTrue(node == start or distances[node] < 0)
+                if goal is not None:
+                    _, found, _ = bfs_csr(unweighted, start, goal)
+                    self.assertEqual(found, goal if goal in hops else None)
+
+                costs = dijkstra(start, adjacency.__getitem__)[0]
+                distances, found, parents = dijkstra_csr(weighted, start)
+                self.assertEqual(list(distances), [costs.get(node, -1) for node in range(n)])
+                for node, parent in enumerate(parents):
+                    if parent >= 0:
+                        options = {cost for v, cost in adjacency[parent] if v == node}
+                        self.assertIn(distances[node] - distances[parent], options)
+                if goal is not None:
+                    distances, found, _ = dijkstra_csr(weighted, start, goal)
+                    self.assertEqual(found, goal if goal in costs else None)
+                    if found is not None:
+                        self.assertEqual(distances[goal], costs[goal])
+                self.assertEqual(
+                    list(dijkstra_csr(unweighted, start)[0]), [hops.get(v, -1) for v in range(n)]
+                )
+
+    def test_dfs_matches_recursive_order(self):
+        """Nodes are expanded in the order of the recursive formulation."""
+
+        def recursive_dfs(node, get_neighbors, is_goal, visited):
+            visited.add(node)
+            if is_goal(node):
+                return node
+            for neighbor in get_neighbors(node):
+                if neighbor not in visited:
+                    goal = recursive_dfs(neighbor, get_neighbors, is_goal, visited)
+                    if goal is not None:
+                        return goal
+            return None
+
+        for seed in range(40):
+            rng = random.Random(seed)
+            size = rng.randint(1, 12)
+            graph = {
+                node: rng.sample(range(size), rng.randint(0, min(3, size)))
+                for node in range(size)
+            }
+            goal = rng.choice([None, rng.randrange(size)])
+            expanded = {"iterative": [], "recursive": []}
+
+            def neighbors_logged(name):
+                def get_neighbors(node):
+                    expanded[name].append(node)
+                    return graph[node]
+
+                return get_neighbors
+
+            visited, found = dfs(0, neighbors_logged("iterative"), lambda node: node == goal)
+            reference = set()
+            expected = recursive_dfs(
+                0, neighbors_logged("recursive"), lambda node: node == goal, reference
+            )
+            with self.subTest(seed=seed):
+                self.assertEqual(expanded["iterative"], expanded["recursive"])
+                self.assertEqual((visited, found), (reference, expected))
+
+    def test_deep_chain(self):
+        """A 300k-node chain needs no recursion."""
+        length = 300_000
+        visited, goal = dfs(0, lambda node: [node + 1] if node < length else [], None)
+        self.assertEqual((len(visited), goal), (length + 1, None))
+        _, goal = dfs(0, lambda node: [node + 1], lambda node: node == length)
+        self.assertEqual(goal, length)
+
+        # Every node also branches to a dead end, so only the chain itself counts
+        total = count_paths(
+            0,
+            lambda node: [node + 1, -node - 1] if node >= 0 else [],
+            lambda node: node == length,
+        )
+        self.assertEqual(total, 1)
+
+    def test_count_paths(self):
+        """Diamonds share counts, goals end paths and cycles raise."""
+        graph = {"a": ["b", "c"], "b": ["d", "e"], "c": ["d"], "d": ["e"], "e": []}
+        self.assertEqual(count_paths("a", graph.__getitem__, lambda node: node == "e"), 3)
+        self.assertEqual(count_paths("a", graph.__getitem__, lambda node: node == "d"), 2)
+        self.assertEqual(count_paths("e", graph.__getitem__, lambda node: node == "a"), 0)
+        cyclic = {"a": ["b"], "b": ["c"], "c": ["a", "d"], "d": []}
+        with self.assertRaises(ValueError):
+            count_paths("a", cyclic.__getitem__, lambda node: node == "d")
+
+    def test_all_paths_fan_out_memory(self):
+        """Queue entries stay small when a hub fans out to many nodes."""
+        spokes = 20000
+        graph = {"hub": [f"a{i}" for i in range(spokes)]}
+        for i in range(spokes):
+            graph[f"a{i}"] = [f"b{i}"]
+            graph[f"b{i}"] = ["goal"]
+
+        tracemalloc.start()
+        try:
+            paths = find_all_paths_bfs("hub", graph.get, lambda node: node == "goal")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(paths), spokes)
+        self.assertEqual(paths[0], ["hub", "a0", "b0", "goal"])
+        # A per-entry bitmask of every node seen needed over 300 MB here
+        self.assertLess(peak, 32 * 1024 * 1024, f"Peak allocation {peak} bytes")
+
+    def check_jump_point_search(self, lines, start, goal, walls="#"):
+        """Distance matches bfs and the path is a walk of open, adjacent cells."""
+        grid = Grid.from_lines(lines)
+        blocked = walls if callable(walls) else lambda row, col: lines[row][col] in walls
+
+        def neighbors(pos):
+            row, col = pos
+            steps = [(row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)]
+            return [step for step in steps if grid.in_bounds(*step) and not blocked(*step)]
+
+        _, _, distances = bfs(start, neighbors)
+        expected = distances.get(goal) if not blocked(*start) else None
+        distance, path = jump_point_search(grid, start, goal, walls)
+        self.assertEqual(distance, expected)
+        if expected is None:
+            self.assertIsNone(path)
+            return
+        self.assertEqual((path[0], path[-1], len(path)), (start, goal, distance + 1))
+        for (r1, c1), (r2, c2) in zip(path, path[1:]):
+            self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+            self.assertFalse(blocked(r2, c2))
+
+    def test_jump_point_search_matches_bfs(self):
+        """Random grids, with walls given as characters and as a function."""
+        for seed in range(60):
+            rng = random.Random(seed)
+            rows, cols = rng.randint(1, 15), rng.randint(1, 15)
+            density = rng.choice([0.0, 0.2, 0.35, 0.5])
+            lines = [
+                "".join("#" if rng.random() < density else "." for _ in range(cols))
+                for _ in range(rows)
+            ]
+            cells = [(r, c) for r in range(rows) for c in range(cols) if lines[r][c] == "."]
+            if not cells:
+                continue
+            start, goal = rng.choice(cells), rng.choice(cells)
+            with self.subTest(seed=seed):
+                self.check_jump_point_search(lines, start, goal)
+                self.check_jump_point_search(
+                    lines, start, goal, lambda row, col: lines[row][col] == "#"
+                )
+
+    def test_jump_point_search_edge_cases(self):
+        """Unreachable goals, walled endpoints and characters beyond latin-1."""
+        sealed = ["..#..", "..#..", "..#.."]
+        self.check_jump_point_search(sealed, (0, 0), (2, 4))
+        self.assertEqual(jump_point_search(Grid.from_lines(sealed), (0, 0), (2, 4)), (None, None))
+        self.check_jump_point_search(sealed, (0, 2), (2, 4))
+        self.check_jump_point_search(sealed, (0, 0), (1, 2))
+        self.check_jump_point_search(["...", "..."], (1, 1), (1, 1))
+        boxes = ["S.█.", "..█.", "█...", "...E"]
+        self.check_jump_point_search(boxes, (0, 0), (3, 3), walls="█")
+        self.assertEqual(jump_point_search(Grid.from_lines(boxes), (0, 0), (3, 3), "█")[0], 6)
+
+    def test_path_counter_matches_enumeration(self):
+        """Counts with required and forbidden waypoints match listing every path."""
+
+        def all_paths(graph, node, goal):
+            if node == goal:
+                yield [node]
+                return
+            for successor in graph.get(node, []):
+                for rest in all_paths(graph, successor, goal):
+                    yield [node] + rest
+
+        for seed in range(40):
+            rng = random.Random(seed)
+            size = rng.randint(1, 9)
+            # Edges only run from lower to higher labels, so the graph is acyclic
+            graph = {
+                node: [other for other in range(node + 1, size) if rng.random() < 0.4]
+                for node in rng.sample(range(size), size)
+            }
+            counter = PathCounter(graph)
+            for _ in range(10):
+                start, goal = rng.randrange(size), rng.randrange(size)
+                required = rng.sample(range(size), rng.randint(0, min(2, size)))
+                forbidden = rng.sample(range(size), rng.randint(0, min(2, size)))
+                expected = sum(
+                    1
+                    for path in all_paths(graph, start, goal)
+                    if set(required) <= set(path) and not set(forbidden) & set(path)
+                )
+                with self.subTest(seed=seed, start=start, goal=goal, required=required):
+                    self.assertEqual(counter.count(start, goal, required, forbidden), expected)
+
+    def test_path_counter_edge_cases(self):
+        """Unreachable and unknown goals, start == goal, and cyclic graphs."""
+        counter = PathCounter({"a": ["b", "c"], "b": ["d"], "c": ["d"], "e": ["d"]})
+        self.assertEqual(counter.count("a", "d"), 2)
+        self.assertEqual(counter.count("a", "e"), 0)
+        self.assertEqual(counter.count("d", "a"), 0)
+        self.assertEqual(counter.count("a", "missing"), 0)
+        self.assertEqual(counter.count("a", "d", required=["missing"]), 0)
+        self.assertEqual(counter.count("a", "a"), 1)
+        self.assertEqual(counter.count("a", "a", required=["a"]), 1)
+        self.assertEqual(counter.count("a", "a", required=["b"]), 0)
+        self.assertEqual(counter.count("a", "a", forbidden=["a"]), 0)
+        self.assertEqual(counter.count("a", "d", required=["b"], forbidden=["c"]), 1)
+        with self.assertRaises(ValueError):
+            PathCounter({"a": ["b"], "b": ["c"], "c": ["a"]})
+        with self.assertRaises(ValueError):
+            PathCounter({"a": ["a"]})
+
+
+def run_tests():
+    """Run all tests and return success status."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(case)
+            for case in (
+                TestParseCache,
+                TestParseIntArray,
+                TestStreamingParsers,
+                TestInternedGraph,
+                TestGrids,
+                TestRectilinearPolygon,
+                TestUnionFind,
+                TestSearch,
+            )
+        ]
+    )
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()
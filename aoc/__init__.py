@@ -0,0 +1,25 @@
+"""
+Advent of Code - Solution Runner
+
+Discovers YYYY/day-N/solution.py modules and runs their parts with consistent
+timing and memory reporting.
+
+Usage:
+    python -m aoc run 2025 8 --part 2
+    python -m aoc bench 2025 --save
+"""
+
+from .benchmark import BenchmarkResult, benchmark_part
+from .runner import PartResult, run_day, run_part
+from .solutions import DaySolution, discover_days, load_solution
+
+__all__ = [
+    "BenchmarkResult",
+    "DaySolution",
+    "PartResult",
+    "benchmark_part",
+    "discover_days",
+    "load_solution",
+    "run_day",
+    "run_part",
+]
@@ -0,0 +1,229 @@
+"""
+Command-line interface for the solution runner.
+
+Usage:
+    python -m aoc list [YEAR]
+    python -m aoc run YEAR DAY [--part N] [--input PATH] [--json] [--no-isolate]
+    python -m aoc run-all [YEAR] [--part N] [--jobs N] [--baseline REF] [--json]
+    python -m aoc bench [YEAR [DAY]] [--part N] [--repeat N] [--warmup N]
+                        [--save] [--baseline REF] [--threshold PCT]
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+
+from .benchmark import (
+    benchmark_part,
+    find_regressions,
+    format_row,
+    latest_baseline,
+    load_baseline,
+    save_baseline,
+    select_parts,
+)
+from .parallel import expected_durations, run_all
+from .runner import PartResult, run_day
+from .solutions import discover_days
+
+
+def format_result(result: PartResult) -> str:
+    """Format a result as a human-readable line."""
+    header = f"{result.year} day {result.day:>2} part {result.part}"
+    if result.error:
+        return f"{header}: ERROR {result.error}"
+
+    parse = f"{result.parse_s:.4f}s" if result.parse_s is not None else "-"
+    rss = f"{result.peak_rss_kb / 1024:.1f} MB" if result.peak_rss_kb is not None else "-"
+    note = " (both parts)" if result.combined else ""
+    return (
+        f"{header}: {result.answer}\n"
+        f"    parse {parse}  solve {result.solve_s:.4f}s{note}  "
+        f"cpu {result.cpu_s:.4f}s  peak rss {rss}"
+    )
+
+
+def emit(results: List[PartResult], as_json: bool) -> None:
+    """Print results as JSON lines or text."""
+    for result in results:
+        if as_json:
+            print(json.dumps(result.to_dict()), flush=True)
+        else:
+            print(format_result(result), flush=True)
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    """List discovered solutions."""
+    for year, day in discover_days(args.year):
+        print(f"{year} day {day}")
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    """Run one day's parts."""
+    parts = [args.part] if args.part else None
+    try:
+        results = run_day(args.year, args.day, parts, args.input, isolate=not args.no_isolate)
+    except FileNotFoundError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    emit(results, args.json)
+    return 1 if any(result.error for result in results) else 0
+
+
+def cmd_run_all(args: argparse.Namespace) -> int:
+    """Run every discovered day in a process pool."""
+    days = discover_days(args.year)
+    if not days:
+        print("No matching solutions found", file=sys.stderr)
+        return 1
+
+    baseline = load_baseline(args.baseline) if args.baseline else latest_baseline()
+    jobs = select_parts(days, args.part)
+
+    start = time.perf_counter()
+    results = []
+    for result in run_all(jobs, args.jobs, expected_durations(baseline)):
+        results.append(result)
+        emit([result], args.json)
+    elapsed = time.perf_counter() - start
+
+    work = sum((r.parse_s or 0.0) + (r.solve_s or 0.0) for r in results)
+    failed = sum(1 for r in results if r.error)
+    print(
+        f"{len(results)} parts in {elapsed:.2f}s wall ({work:.2f}s of work), {failed} failed",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """Benchmark parts and optionally check for regressions."""
+    days = discover_days(args.year)
+    if args.day is not None:
+        days = [(year, day) for year, day in days if day == args.day]
+    if not days:
+        print("No matching solutions found", file=sys.stderr)
+        return 1
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+
+    results = []
+    for year, day, part in select_parts(days, args.part):
+        result = benchmark_part(year, day, part, args.repeat, args.warmup)
+        results.append(result)
+        if args.json:
+            print(json.dumps(result.to_dict()), flush=True)
+        else:
+            print(format_row(result, baseline), flush=True)
+
+    if args.save:
+        path = save_baseline(results, args.repeat, args.warmup)
+        print(f"Saved baseline to {path}", file=sys.stderr)
+
+    failed = any(result.error for result in results)
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold, args.min_delta)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression.key}: {regression.baseline_s:.4f}s -> "
+                f"{regression.current_s:.4f}s ({regression.change_pct:+.1f}%)",
+                file=sys.stderr,
+            )
+        failed = failed or bool(regressions)
+
+    return 1 if failed else 0
+
+
+def positive_int(text: str) -> int:
+    """Argument type for counts that must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def non_negative_int(text: str) -> int:
+    """Argument type for counts that may be 0."""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m aoc", description=__doc__.split("\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List discovered solutions")
+    list_parser.add_argument("year", type=int, nargs="?", help="Only list this year")
+    list_parser.set_defaults(func=cmd_list)
+
+    run_parser = subparsers.add_parser("run", help="Run a single day")
+    run_parser.add_argument("year", type=int)
+    run_parser.add_argument("day", type=int)
+    run_parser.add_argument("--part", type=int, choices=(1, 2), help="Run only this part")
+    run_parser.add_argument("--input", help="Input file (default: the day's input.txt)")
+    run_parser.add_argument("--json", action="store_true", help="Emit one JSON object per part")
+    run_parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run parts in this process (faster, but peak RSS accumulates)",
+    )
+    run_parser.set_defaults(func=cmd_run)
+
+    run_all_parser = subparsers.add_parser("run-all", help="Run every day in a process pool")
+    run_all_parser.add_argument("year", type=int, nargs="?", help="Only run this year")
+    run_all_parser.add_argument("--part", type=int, choices=(1, 2), help="Only this part")
+    run_all_parser.add_argument(
+        "--jobs", type=positive_int, help="Worker processes (default: CPU count)"
+    )
+    run_all_parser.add_argument(
+        "--baseline", help="Baseline used for scheduling (default: most recent)"
+    )
+    run_all_parser.add_argument("--json", action="store_true", help="Emit one JSON object per part")
+    run_all_parser.set_defaults(func=cmd_run_all)
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark parts with repetition")
+    bench_parser.add_argument("year", type=int, nargs="?", help="Only benchmark this year")
+    bench_parser.add_argument("day", type=int, nargs="?", help="Only benchmark this day")
+    bench_parser.add_argument("--part", type=int, choices=(1, 2), help="Only this part")
+    bench_parser.add_argument(
+        "--repeat", type=positive_int, default=5, help="Measured runs (default 5)"
+    )
+    bench_parser.add_argument(
+        "--warmup", type=non_negative_int, default=1, help="Discarded runs (default 1)"
+    )
+    bench_parser.add_argument("--json", action="store_true", help="Emit one JSON object per part")
+    bench_parser.add_argument(
+        "--save", action="store_true", help="Store results as the baseline for this commit"
+    )
+    bench_parser.add_argument("--baseline", help="Commit or baseline file to compare against")
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Fail if a median slows down by more than this percent (default 10)",
+    )
+    bench_parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        help="Ignore slowdowns smaller than this many seconds (default 0.005)",
+    )
+    bench_parser.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main execution function."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
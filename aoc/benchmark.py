@@ -0,0 +1,310 @@
+"""
+Benchmark suite with repetition statistics and regression baselines.
+
+Each repetition runs in a fresh process (see run_part_isolated) so module-level
+caches like @cache in 2024 day 11 can't make later repetitions look free.
+
+Baselines are JSON files under benchmarks/, one per git commit:
+    benchmarks/<commit>.json
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .runner import run_part_isolated
+from .solutions import REPO_ROOT, load_solution
+
+BASELINE_DIR = REPO_ROOT / "benchmarks"
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Timing statistics for one part over several repetitions.
+
+    Attributes:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number
+        runs: Total seconds (parse + solve) for each measured repetition
+        answer: Answer from the last repetition
+        error: Exception description if any repetition failed
+    """
+
+    year: int
+    day: int
+    part: int
+    runs: List[float] = field(default_factory=list)
+    answer: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Baseline key 'YYYY/D/P'."""
+        return part_key(self.year, self.day, self.part)
+
+    @property
+    def median_s(self) -> float:
+        """Median of measured runs."""
+        return statistics.median(self.runs)
+
+    @property
+    def p95_s(self) -> float:
+        """95th percentile of measured runs."""
+        return percentile(self.runs, 95)
+
+    @property
+    def min_s(self) -> float:
+        """Fastest measured run."""
+        return min(self.runs)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict including summary statistics."""
+        data = asdict(self)
+        if self.runs:
+            data.update(median_s=self.median_s, p95_s=self.p95_s, min_s=self.min_s)
+        return data
+
+
+@dataclass
+class Regression:
+    """A part whose median time exceeded its baseline by more than the threshold."""
+
+    key: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def change_pct(self) -> float:
+        """Slowdown relative to baseline in percent."""
+        return (self.current_s / self.baseline_s - 1) * 100
+
+
+def part_key(year: int, day: int, part: int) -> str:
+    """Build the baseline key for a part."""
+    return f"{year}/{day}/{part}"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples (need not be sorted)
+        pct: Percentile in (0, 100]
+
+    Returns:
+        Smallest sample with at least pct% of samples at or below it
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil without floats
+    return ordered[int(rank) - 1]
+
+
+def benchmark_part(
+    year: int,
+    day: int,
+    part: int,
+    repeat: int = 5,
+    warmup: int = 1,
+    input_path: Optional[str] = None,
+) -> BenchmarkResult:
+    """
+    Run one part repeatedly and collect timings.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number (1 or 2)
+        repeat: Number of measured repetitions
+        warmup: Number of discarded repetitions run first
+        input_path: Input file (defaults to the day's input.txt)
+
+    Returns:
+        BenchmarkResult with one entry in runs per measured repetition
+
+    Raises:
+        ValueError: If repeat is less than 1 (there would be nothing to summarise)
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+
+    # Import once in the parent so forked repetitions don't pay for it
+    load_solution(year, day)
+
+    result = BenchmarkResult(year, day, part)
+    for i in range(warmup + repeat):
+        run = run_part_isolated(year, day, part, input_path)
+        if run.error:
+            result.error = run.error
+            break
+        if i >= warmup:
+            result.runs.append((run.parse_s or 0.0) + run.solve_s)
+        result.answer = run.answer
+    return result
+
+
+def current_commit() -> str:
+    """
+    Identify the working tree for baseline files.
+
+    Returns:
+        Short commit hash, suffixed with '-dirty' if tracked files have changes
+    """
+
+    def git(*args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=False
+        )
+
+    head = git("rev-parse", "--short", "HEAD")
+    if head.returncode != 0:
+        return "unknown"
+    commit = head.stdout.strip()
+    if git("diff", "--quiet", "HEAD").returncode != 0:
+        commit += "-dirty"
+    return commit
+
+
+def baseline_path(commit: str) -> Path:
+    """Path of the baseline file for a commit."""
+    return BASELINE_DIR / f"{commit}.json"
+
+
+def load_baseline(ref: str) -> Dict[str, dict]:
+    """
+    Load baseline results.
+
+    Args:
+        ref: Commit key (as used in the file name) or a path to a baseline file
+
+    Returns:
+        Dictionary mapping part keys to result dicts
+    """
+    path = Path(ref)
+    if not path.exists():
+        path = baseline_path(ref)
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def latest_baseline() -> Optional[Dict[str, dict]]:
+    """Load the most recently written baseline, or None if there are none."""
+    paths = sorted(BASELINE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    if not paths:
+        return None
+    return load_baseline(str(paths[-1]))
+
+
+def save_baseline(results: List[BenchmarkResult], repeat: int, warmup: int) -> Path:
+    """
+    Save results for the current commit, merging with any existing file.
+
+    Args:
+        results: Benchmark results to store (failed parts are skipped)
+        repeat: Repetitions used
+        warmup: Warmup repetitions used
+
+    Returns:
+        Path of the written baseline file
+    """
+    commit = current_commit()
+    path = baseline_path(commit)
+
+    stored: Dict[str, dict] = {}
+    if path.exists():
+        with open(path) as f:
+            stored = json.load(f)["results"]
+    for result in results:
+        if result.error is None and result.runs:
+            stored[result.key] = result.to_dict()
+
+    BASELINE_DIR.mkdir(exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "commit": commit,
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "repeat": repeat,
+                "warmup": warmup,
+                "results": dict(sorted(stored.items())),
+            },
+            f,
+            indent=2,
+        )
+    return path
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, dict],
+    threshold_pct: float = 10.0,
+    min_delta_s: float = 0.005,
+) -> List[Regression]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Current benchmark results
+        baseline: Baseline results from load_baseline()
+        threshold_pct: Allowed slowdown of the median in percent
+        min_delta_s: Ignore slowdowns smaller than this many seconds (timer noise)
+
+    Returns:
+        List of regressions, worst first
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if result.error or not result.runs or not previous:
+            continue
+        before, after = previous["median_s"], result.median_s
+        if after - before > min_delta_s and after > before * (1 + threshold_pct / 100):
+            regressions.append(Regression(result.key, before, after))
+    return sorted(regressions, key=lambda r: r.change_pct, reverse=True)
+
+
+def format_row(result: BenchmarkResult, baseline: Optional[Dict[str, dict]] = None) -> str:
+    """Format a result as a table row, with change vs baseline if available."""
+    label = f"{result.year} day {result.day:>2} part {result.part}"
+    if result.error:
+        return f"{label}  ERROR {result.error}"
+
+    row = (
+        f"{label}  median {result.median_s:9.4f}s  p95 {result.p95_s:9.4f}s  "
+        f"min {result.min_s:9.4f}s"
+    )
+    previous = baseline.get(result.key) if baseline else None
+    if previous:
+        change = (result.median_s / previous["median_s"] - 1) * 100
+        row += f"  ({change:+.1f}% vs baseline)"
+    return row
+
+
+def select_parts(
+    days: List[Tuple[int, int]], part: Optional[int] = None
+) -> List[Tuple[int, int, int]]:
+    """
+    Expand (year, day) pairs into (year, day, part) jobs.
+
+    Args:
+        days: Days to include
+        part: Only include this part if given
+
+    Returns:
+        List of (year, day, part) tuples
+    """
+    jobs = []
+    for year, day in days:
+        for available in load_solution(year, day).parts:
+            if part is None or available == part:
+                jobs.append((year, day, available))
+    return jobs
@@ -0,0 +1,81 @@
+"""
+Run many (year, day, part) jobs in a process pool.
+
+Jobs are submitted longest-expected-first (LPT scheduling) using the most recent
+benchmark baseline, so slow parts like 2024 day 6 part 2 start immediately
+instead of becoming the tail of the run. Parts with no recorded time are treated
+as slow and start first.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .benchmark import part_key
+from .runner import PartResult, mp_context, run_part, send_stdout_to_stderr
+
+Job = Tuple[int, int, int]
+
+
+def expected_durations(baseline: Optional[Dict[str, dict]]) -> Dict[str, float]:
+    """
+    Extract median times from a baseline.
+
+    Args:
+        baseline: Baseline results from load_baseline(), or None
+
+    Returns:
+        Dictionary mapping part keys to median seconds
+    """
+    if not baseline:
+        return {}
+    return {key: entry["median_s"] for key, entry in baseline.items() if "median_s" in entry}
+
+
+def schedule(jobs: List[Job], expected: Dict[str, float]) -> List[Job]:
+    """
+    Order jobs longest-expected-first.
+
+    Args:
+        jobs: (year, day, part) tuples
+        expected: Median seconds per part key
+
+    Returns:
+        Jobs sorted by descending expected time; unknown jobs come first
+    """
+    return sorted(jobs, key=lambda job: -expected.get(part_key(*job), math.inf))
+
+
+def run_all(
+    jobs: List[Job],
+    max_workers: Optional[int] = None,
+    expected: Optional[Dict[str, float]] = None,
+) -> Iterator[PartResult]:
+    """
+    Run jobs in a process pool, yielding results as they complete.
+
+    Workers are reused between jobs, so peak_rss_kb is the worker's high-water
+    mark rather than the job's own; use run_part_isolated for per-part memory.
+
+    Args:
+        jobs: (year, day, part) tuples
+        max_workers: Pool size (defaults to the CPU count)
+        expected: Median seconds per part key for scheduling
+
+    Yields:
+        PartResult for each job in completion order
+    """
+    ordered = schedule(jobs, expected or {})
+    workers = max_workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp_context(), initializer=send_stdout_to_stderr
+    ) as executor:
+        futures = {executor.submit(run_part, *job): job for job in ordered}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as exc:  # Worker died (e.g. killed by the OOM killer)
+                year, day, part = futures[future]
+                yield PartResult(year, day, part, error=f"{type(exc).__name__}: {exc}")
@@ -0,0 +1,194 @@
+"""
+Run solution parts with wall-clock, CPU and peak-memory measurement.
+
+Each part can run in a fresh child process so that peak RSS reflects that part
+alone rather than everything the parent process has done before it.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .solutions import load_solution
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class PartResult:
+    """
+    Measurements for one run of one part.
+
+    Attributes:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number
+        answer: Answer rendered as a string (None on error)
+        parse_s: Seconds spent preparing input (None if the part parses internally)
+        solve_s: Seconds spent in the part's entry point
+        cpu_s: CPU seconds for prepare + solve
+        peak_rss_kb: Peak resident set size of the process in KiB
+        combined: True if the entry point computes both parts in one call
+        error: Exception description if the part failed
+    """
+
+    year: int
+    day: int
+    part: int
+    answer: Optional[str] = None
+    parse_s: Optional[float] = None
+    solve_s: Optional[float] = None
+    cpu_s: Optional[float] = None
+    peak_rss_kb: Optional[int] = None
+    combined: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Get the peak resident set size of this process in KiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_part(year: int, day: int, part: int, input_path: Optional[str] = None) -> PartResult:
+    """
+    Run one part in the current process.
+
+    Solution output is redirected to stderr so stdout stays machine-readable.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number (1 or 2)
+        input_path: Input file (defaults to the day's input.txt)
+
+    Returns:
+        PartResult with timings, or with error set if the part raised
+    """
+    result = PartResult(year, day, part)
+    cpu_start = time.process_time()
+
+    try:
+        solution = load_solution(year, day)
+        entry = solution.entry_point(part)
+        if entry is None:
+            raise AttributeError(f"{year} day {day} has no entry point for part {part}")
+        result.combined = entry.combined
+        path = Path(input_path) if input_path else solution.default_input
+
+        with redirect_stdout(sys.stderr):
+            start = time.perf_counter()
+            arg = solution.prepare(part, path)
+            if entry.takes != "path":
+                result.parse_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            answer = solution.solve(part, arg)
+            result.solve_s = time.perf_counter() - start
+
+        result.answer = str(answer)
+    except Exception as exc:
+        result.error = f"{type(exc).__name__}: {exc}"
+
+    result.cpu_s = time.process_time() - cpu_start
+    result.peak_rss_kb = peak_rss_kb()
+    return result
+
+
+def mp_context():
+    """Prefer fork so workers inherit already-imported solution modules."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def send_stdout_to_stderr() -> None:
+    """
+    Point file descriptor 1 at stderr for the rest of this worker process.
+
+    Unlike redirect_stdout this also catches output from subprocesses
+    (clear_console() in several 2024 days shells out to 'clear').
+    """
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+
+def _isolated_worker(conn, year: int, day: int, part: int, input_path: Optional[str]) -> None:
+    send_stdout_to_stderr()
+    conn.send(run_part(year, day, part, input_path))
+    conn.close()
+
+
+def run_part_isolated(
+    year: int, day: int, part: int, input_path: Optional[str] = None
+) -> PartResult:
+    """
+    Run one part in a fresh child process.
+
+    A plain (non-daemon) Process is used so solutions that start their own
+    multiprocessing pools (2024 day 6) keep working.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number (1 or 2)
+        input_path: Input file (defaults to the day's input.txt)
+
+    Returns:
+        PartResult measured in the child process
+    """
+    ctx = mp_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_isolated_worker, args=(sender, year, day, part, input_path))
+    process.start()
+    sender.close()
+
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = PartResult(year, day, part, error="Worker exited without a result")
+    process.join()
+
+    if result.error is None and process.exitcode:
+        result.error = f"Worker exited with code {process.exitcode}"
+    return result
+
+
+def run_day(
+    year: int,
+    day: int,
+    parts: Optional[Iterable[int]] = None,
+    input_path: Optional[str] = None,
+    isolate: bool = True,
+) -> List[PartResult]:
+    """
+    Run several parts of one day.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+        parts: Parts to run (defaults to every part the solution implements)
+        input_path: Input file (defaults to the day's input.txt)
+        isolate: Run each part in its own process for accurate peak RSS
+
+    Returns:
+        List of PartResult, one per part
+    """
+    if parts is None:
+        parts = load_solution(year, day).parts
+    run = run_part_isolated if isolate else run_part
+    return [run(year, day, part, input_path) for part in parts]
@@ -0,0 +1,295 @@
+"""
+Solution discovery and entry-point adapters.
+
+Each day's solution.py was written before the runner existed, so entry points vary:
+- 2025 style: parse_input(input_file) followed by solve_part1(data) / solve_part2(data),
+  with part1(input_file) / part2(input_file) as file-path wrappers
+- Path style: part1(input_file) / part2(input_file) that parse internally
+- 2024 style: parse_input(filename) followed by part_one(data) / part_two(data)
+- Combined: solve(...) returning a (part1, part2) tuple
+
+DaySolution hides these differences behind prepare() and solve().
+"""
+
+import importlib.util
+import inspect
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PART_FUNCTIONS = {
+    1: ("solve_part1", "part1", "part_one"),
+    2: ("solve_part2", "part2", "part_two"),
+}
+PARSER_FUNCTIONS = ("parse_input", "read_input")
+PATH_PARAMS = {"input_file", "filename", "file_path"}
+TEXT_PARAMS = {"input_text"}
+
+
+def _first_param(func: Callable) -> Optional[str]:
+    """Get the name of the first parameter of a function."""
+    params = list(inspect.signature(func).parameters)
+    return params[0] if params else None
+
+
+def _required_params(func: Callable) -> int:
+    """Count positional parameters without defaults."""
+    return sum(
+        1
+        for param in inspect.signature(func).parameters.values()
+        if param.default is inspect.Parameter.empty
+        and param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+    )
+
+
+def _input_kind(func: Callable) -> str:
+    """Classify what a function expects as input: 'path', 'text' or 'parsed'."""
+    name = _first_param(func)
+    if name in PATH_PARAMS:
+        return "path"
+    if name in TEXT_PARAMS:
+        return "text"
+    return "parsed"
+
+
+def _solve_2024_day8(module: ModuleType, part: int, grid: List[List[str]]) -> int:
+    # Day 8 reads the grid from a module-level global that main() sets
+    module.grid = grid
+    return module.part_one() if part == 1 else module.part_two()
+
+
+def _solve_2024_day9(module: ModuleType, part: int, disk_map: str) -> int:
+    if part == 1:
+        return module.part_one_optimized(disk_map)
+    return module.part_two_optimized(disk_map)
+
+
+def _solve_2024_day17(module: ModuleType, part: int, parsed: Tuple[dict, List[int]]) -> Any:
+    registers, program = parsed
+    if part == 1:
+        return module.part1(registers, program)
+    return module.part2(program)
+
+
+def _solve_2024_day21(module: ModuleType, part: int, codes: List[str]) -> int:
+    return module.solve(codes, depth=2 if part == 1 else 25)
+
+
+# Days whose entry points don't follow any of the conventions above
+SPECIAL_CASES: Dict[Tuple[int, int], Callable[[ModuleType, int, Any], Any]] = {
+    (2024, 8): _solve_2024_day8,
+    (2024, 9): _solve_2024_day9,
+    (2024, 17): _solve_2024_day17,
+    (2024, 21): _solve_2024_day21,
+}
+
+
+@dataclass
+class EntryPoint:
+    """
+    How to run one part of a solution.
+
+    Attributes:
+        func: Function to call
+        takes: 'path', 'text' or 'parsed' - what func expects as its argument
+        index: Position in the result tuple when func solves both parts at once
+    """
+
+    func: Callable
+    takes: str
+    index: Optional[int] = None
+
+    @property
+    def combined(self) -> bool:
+        """True if func computes both parts in a single call."""
+        return self.index is not None
+
+    def call(self, arg: Any) -> Any:
+        """Call the entry point with prepared input."""
+        if self.takes == "parsed" and isinstance(arg, tuple) and _required_params(self.func) > 1:
+            result = self.func(*arg)
+        else:
+            result = self.func(arg)
+        if self.index is not None:
+            result = result[self.index]
+        return result
+
+
+class DaySolution:
+    """
+    Loaded solution module for a single day.
+
+    Example usage:
+        solution = load_solution(2025, 8)
+        arg = solution.prepare(2, solution.default_input)
+        answer = solution.solve(2, arg)
+    """
+
+    def __init__(self, year: int, day: int, module: ModuleType):
+        """
+        Initialize solution wrapper.
+
+        Args:
+            year: Puzzle year
+            day: Puzzle day
+            module: Imported solution.py module
+        """
+        self.year = year
+        self.day = day
+        self.module = module
+        self.directory = Path(module.__file__).parent
+        self.parser = next(
+            (getattr(module, name) for name in PARSER_FUNCTIONS if hasattr(module, name)), None
+        )
+
+    @property
+    def default_input(self) -> Path:
+        """Path to the day's puzzle input."""
+        return self.directory / "input.txt"
+
+    @property
+    def parts(self) -> List[int]:
+        """Parts this solution can run."""
+        return [part for part in (1, 2) if self.entry_point(part) is not None]
+
+    def entry_point(self, part: int) -> Optional[EntryPoint]:
+        """
+        Resolve the entry point for a part.
+
+        Args:
+            part: Part number (1 or 2)
+
+        Returns:
+            EntryPoint or None if the module doesn't implement the part
+        """
+        module = self.module
+
+        special = SPECIAL_CASES.get((self.year, self.day))
+        if special is not None:
+            return EntryPoint(lambda arg: special(module, part, arg), "parsed")
+
+        for name in PART_FUNCTIONS[part]:
+            func = getattr(module, name, None)
+            if callable(func):
+                return EntryPoint(func, _input_kind(func))
+
+        solve = getattr(module, "solve", None)
+        if callable(solve):
+            return EntryPoint(solve, _input_kind(solve), index=part - 1)
+
+        return None
+
+    def parse(self, input_path: Path) -> Any:
+        """
+        Run the module's parser on an input file.
+
+        Args:
+            input_path: Path to the input file
+
+        Returns:
+            Whatever the module's parse_input returns
+        """
+        if self.parser is None:
+            raise AttributeError(f"{self.year} day {self.day} has no parse_input")
+        if _input_kind(self.parser) == "text":
+            return self.parser(Path(input_path).read_text())
+        return self.parser(str(input_path))
+
+    def prepare(self, part: int, input_path: Path) -> Any:
+        """
+        Build the argument the part's entry point expects.
+
+        Args:
+            part: Part number (1 or 2)
+            input_path: Path to the input file
+
+        Returns:
+            File path, file contents or parsed data depending on the entry point
+        """
+        entry = self._require_entry_point(part)
+        if entry.takes == "path":
+            return str(input_path)
+        if entry.takes == "text":
+            return Path(input_path).read_text()
+        return self.parse(input_path)
+
+    def solve(self, part: int, arg: Any) -> Any:
+        """
+        Run one part on input from prepare().
+
+        Args:
+            part: Part number (1 or 2)
+            arg: Prepared input
+
+        Returns:
+            The part's answer
+        """
+        return self._require_entry_point(part).call(arg)
+
+    def _require_entry_point(self, part: int) -> EntryPoint:
+        entry = self.entry_point(part)
+        if entry is None:
+            raise AttributeError(f"{self.year} day {self.day} has no entry point for part {part}")
+        return entry
+
+
+def discover_days(year: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Find all (year, day) pairs with a solution.py.
+
+    Day 0 directories are templates and are skipped.
+
+    Args:
+        year: Only return days for this year if given
+
+    Returns:
+        Sorted list of (year, day) tuples
+    """
+    days = []
+    for path in REPO_ROOT.glob("[0-9][0-9][0-9][0-9]/day-*/solution.py"):
+        match = re.fullmatch(r"day-(\d+)", path.parent.name)
+        if not match:
+            continue
+        found_year, found_day = int(path.parent.parent.name), int(match.group(1))
+        if found_day == 0 or (year is not None and found_year != year):
+            continue
+        if path.stat().st_size == 0:
+            continue
+        days.append((found_year, found_day))
+    return sorted(days)
+
+
+@lru_cache(maxsize=None)
+def load_solution(year: int, day: int) -> DaySolution:
+    """
+    Import a day's solution.py.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+
+    Returns:
+        DaySolution wrapping the imported module
+    """
+    path = REPO_ROOT / str(year) / f"day-{day}" / "solution.py"
+    if not path.exists():
+        raise FileNotFoundError(f"No solution found at {path}")
+
+    # Unique module name so days don't shadow each other's 'solution' module.
+    # Registered in sys.modules so forked workers can pickle its functions.
+    name = f"aoc_solution_{year}_day{day}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return DaySolution(year, day, module)
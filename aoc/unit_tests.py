@@ -0,0 +1,290 @@
+"""Unit tests for the aoc runner package"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from textwrap import dedent
+from types import ModuleType
+from unittest import mock
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from aoc import (  # noqa: E402
+    BenchmarkResult,
+    DaySolution,
+    PartResult,
+    benchmark,
+    load_solution,
+    run_part,
+)
+from aoc.__main__ import build_parser  # noqa: E402
+from aoc.benchmark import benchmark_part, find_regressions, percentile  # noqa: E402
+from aoc.parallel import expected_durations, schedule  # noqa: E402
+from aoc.solutions import SPECIAL_CASES  # noqa: E402
+
+# Official examples for the days whose entry points need SPECIAL_CASES
+SPECIAL_EXAMPLES = {
+    (2024, 8): (
+        """\
+        ............
+        ........0...
+        .....0......
+        .......0....
+        ....0.......
+        ......A.....
+        ............
+        ............
+        ........A...
+        .........A..
+        ............
+        ............
+        """,
+        14,
+        34,
+    ),
+    (2024, 9): ("2333133121414131402\n", 1928, 2858),
+    (2024, 17): (
+        """\
+        Register A: 2024
+        Register B: 0
+        Register C: 0
+
+        Program: 0,3,5,4,3,0
+        """,
+        "5,7,3,0",
+        117440,
+    ),
+    (2024, 21): ("029A\n980A\n179A\n456A\n379A\n", 126384, 154115708116294),
+}
+
+
+def fake_solution(directory: str, **functions) -> DaySolution:
+    """Wrap made-up entry points in a DaySolution as if loaded from solution.py."""
+    module = ModuleType("fake_solution")
+    module.__file__ = str(Path(directory) / "solution.py")
+    for name, func in functions.items():
+        setattr(module, name, func)
+    return DaySolution(2099, 1, module)
+
+
+class TestEntryPoints(unittest.TestCase):
+    """Test cases for entry-point resolution and the parse/solve split."""
+
+    def setUp(self):
+        """Create a temporary input file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_path = Path(self.tmp.name) / "input.txt"
+        self.input_path.write_text("1\n2\n3\n")
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.tmp.cleanup()
+
+    def test_special_cases(self):
+        """Days with unusual signatures run both parts through SPECIAL_CASES."""
+        self.assertEqual(set(SPECIAL_EXAMPLES), set(SPECIAL_CASES))
+        for (year, day), (text, *answers) in SPECIAL_EXAMPLES.items():
+            solution = load_solution(year, day)
+            self.input_path.write_text(dedent(text))
+            self.assertEqual(solution.parts, [1, 2])
+            for part, expected in enumerate(answers, start=1):
+                entry = solution.entry_point(part)
+                with self.subTest(year=year, day=day, part=part):
+                    self.assertEqual((entry.takes, entry.combined), ("parsed", False))
+                    arg = solution.prepare(part, self.input_path)
+                    self.assertEqual(solution.solve(part, arg), expected)
+
+    def test_parsed_entry_points(self):
+        """2025 style: parse_input once, then solve_partN on the parsed data."""
+        parsed = []
+
+        def parse_input(input_file):
+            parsed.append(input_file)
+            return [int(line) for line in Path(input_file).read_text().split()]
+
+        solution = fake_solution(
+            self.tmp.name,
+            parse_input=parse_input,
+            solve_part1=lambda data: sum(data),
+            solve_part2=lambda data: max(data),
+            part1=lambda input_file: "wrapper must not win",
+        )
+        self.assertEqual(solution.default_input, self.input_path)
+        arg = solution.prepare(1, self.input_path)
+        self.assertEqual((arg, parsed), ([1, 2, 3], [str(self.input_path)]))
+        self.assertEqual(solution.solve(1, arg), 6)
+        self.assertEqual(solution.solve(2, solution.prepare(2, self.input_path)), 3)
+
+    def test_path_text_and_combined_entry_points(self):
+        """Path and text arguments are passed through; solve() splits its tuple."""
+        by_path = fake_solution(self.tmp.name, part1=lambda input_file: input_file)
+        self.assertEqual(by_path.entry_point(1).takes, "path")
+        self.assertEqual(by_path.prepare(1, self.input_path), str(self.input_path))
+        self.assertEqual(by_path.parts, [1])
+        with self.assertRaises(AttributeError):
+            by_path.prepare(2, self.input_path)
+
+        by_text = fake_solution(self.tmp.name, part_two=lambda input_text: input_text.split())
+        self.assertEqual(by_text.entry_point(2).takes, "text")
+        arg = by_text.prepare(2, self.input_path)
+        self.assertEqual(by_text.solve(2, arg), ["1", "2", "3"])
+
+        both = fake_solution(
+            self.tmp.name,
+            read_input=lambda filename: Path(filename).read_text().split(),
+            solve=lambda lines, extra=0: (len(lines), lines[-1]),
+        )
+        entries = [both.entry_point(part) for part in (1, 2)]
+        self.assertEqual([entry.index for entry in entries], [0, 1])
+        self.assertTrue(all(entry.combined and entry.takes == "parsed" for entry in entries))
+        answers = [both.solve(part, both.prepare(part, self.input_path)) for part in (1, 2)]
+        self.assertEqual(answers, [3, "3"])
+
+    def test_parsed_tuple_is_spread(self):
+        """A parser returning a tuple feeds a multi-argument part function."""
+        solution = fake_solution(
+            self.tmp.name,
+            parse_input=lambda filename: (2, 5),
+            part1=lambda base, exponent: base**exponent,
+            part2=lambda pair: len(pair),
+        )
+        arg = solution.prepare(1, self.input_path)
+        self.assertEqual((solution.solve(1, arg), solution.solve(2, arg)), (32, 2))
+
+
+class TestPartResult(unittest.TestCase):
+    """Test cases for run_part results and their JSON form."""
+
+    def test_json_round_trip(self):
+        """Answers and timings survive json.dumps/json.loads."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "example.txt"
+            path.write_text("2333133121414131402\n")
+            result = run_part(2024, 9, 2, str(path))
+
+        self.assertIsNone(result.error)
+        self.assertEqual(result.answer, "2858")
+        self.assertGreaterEqual(result.parse_s, 0)
+        self.assertGreaterEqual(result.solve_s, 0)
+        data = json.loads(json.dumps(result.to_dict()))
+        self.assertEqual(data["answer"], "2858")
+        self.assertEqual(PartResult(**data), result)
+
+    def test_error_result(self):
+        """Failures are recorded as strings, not raised."""
+        result = run_part(2024, 9, 1, "/nonexistent/input.txt")
+        self.assertIsNone(result.answer)
+        self.assertTrue(result.error.startswith("FileNotFoundError"))
+        data = json.loads(json.dumps(result.to_dict()))
+        self.assertEqual((data["year"], data["day"], data["part"]), (2024, 9, 1))
+        self.assertIsNone(data["solve_s"])
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test cases for benchmark statistics and regression checks."""
+
+    def test_percentile(self):
+        """Nearest rank: the smallest sample with pct% of samples at or below it."""
+        self.assertEqual(percentile([7.0], 95), 7.0)
+        self.assertEqual(percentile([4, 1, 3, 2], 50), 2)
+        self.assertEqual(percentile([4, 1, 3, 2], 51), 3)
+        self.assertEqual(percentile([4, 1, 3, 2], 100), 4)
+        self.assertEqual(percentile([4, 1, 3, 2], 1), 1)
+        samples = list(range(1, 101))
+        for pct in (1, 5, 50, 95, 99, 100):
+            self.assertEqual(percentile(samples[::-1], pct), pct)
+        self.assertEqual(percentile(list(range(1, 21)), 95), 19)
+
+    def test_find_regressions(self):
+        """Only slowdowns past both thresholds count; new and failed parts are skipped."""
+        results = [
+            BenchmarkResult(2025, 1, 1, runs=[0.50, 0.52, 0.51]),  # +27.5%
+            BenchmarkResult(2025, 1, 2, runs=[0.21, 0.20, 0.22]),  # +5%: under threshold
+            BenchmarkResult(2025, 2, 1, runs=[0.003, 0.003]),  # +200% but only 2 ms
+            BenchmarkResult(2025, 2, 2, runs=[3.0]),  # +50%
+            BenchmarkResult(2025, 3, 1, runs=[9.0]),  # New since the baseline
+            BenchmarkResult(2025, 3, 2, error="ValueError: boom"),
+            BenchmarkResult(2025, 4, 1, runs=[0.1]),  # Faster
+        ]
+        baseline = {
+            "2025/1/1": {"median_s": 0.40},
+            "2025/1/2": {"median_s": 0.20},
+            "2025/2/1": {"median_s": 0.001},
+            "2025/2/2": {"median_s": 2.0},
+            "2025/3/2": {"median_s": 1.0},
+            "2025/4/1": {"median_s": 1.0},
+        }
+        regressions = find_regressions(results, baseline)
+        self.assertEqual([r.key for r in regressions], ["2025/2/2", "2025/1/1"])
+        self.assertAlmostEqual(regressions[0].change_pct, 50.0)
+        self.assertEqual((regressions[1].baseline_s, regressions[1].current_s), (0.40, 0.51))
+        self.assertEqual(find_regressions(results, {}), [])
+        self.assertEqual(len(find_regressions(results, baseline, min_delta_s=0)), 3)
+        self.assertEqual(len(find_regressions(results, baseline, threshold_pct=60)), 0)
+
+    def test_repeat_must_be_positive(self):
+        """--repeat 0 is rejected up front instead of failing in statistics.median."""
+        parser = build_parser()
+        self.assertEqual(parser.parse_args(["bench", "--repeat", "1"]).repeat, 1)
+        self.assertEqual(parser.parse_args(["bench", "--warmup", "0"]).warmup, 0)
+        for argv in (["bench", "--repeat", "0"], ["bench", "--warmup", "-1"]):
+            with self.subTest(argv=argv), contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    parser.parse_args(argv)
+        with self.assertRaises(ValueError):
+            benchmark_part(2024, 9, 1, repeat=0)
+
+
+class TestSchedule(unittest.TestCase):
+    """Test cases for longest-expected-first job ordering."""
+
+    def test_longest_first(self):
+        """Unknown parts lead, then descending median; ties keep their input order."""
+        jobs = [(2025, 1, 1), (2025, 1, 2), (2025, 2, 1), (2025, 2, 2), (2025, 3, 1), (2024, 6, 2)]
+        baseline = {
+            "2025/1/1": {"median_s": 0.5},
+            "2025/1/2": {"median_s": 2.0},
+            "2025/2/1": {"median_s": 0.5},
+            "2025/2/2": {"error": "no timing"},
+            "2024/6/2": {"median_s": 9.0},
+            "2023/1/1": {"median_s": 99.0},  # Not being run
+        }
+        expected = expected_durations(baseline)
+        self.assertNotIn("2025/2/2", expected)
+        self.assertEqual(
+            schedule(jobs, expected),
+            [(2025, 2, 2), (2025, 3, 1), (2024, 6, 2), (2025, 1, 2), (2025, 1, 1), (2025, 2, 1)],
+        )
+
+    def test_no_baseline(self):
+        """Without any baseline every job is unknown and the input order is kept."""
+        jobs = [(2025, 3, 1), (2024, 1, 2), (2025, 1, 1)]
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.object(benchmark, "BASELINE_DIR", Path(tmp) / "benchmarks"):
+                baseline = benchmark.latest_baseline()
+        self.assertIsNone(baseline)
+        self.assertEqual(expected_durations(baseline), {})
+        self.assertEqual(schedule(jobs, expected_durations(baseline)), jobs)
+        self.assertEqual(schedule([], {}), [])
+
+
+def run_tests():
+    """Run all tests and return success status."""
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite(
+        [
+            loader.loadTestsFromTestCase(case)
+            for case in (TestEntryPoints, TestPartResult, TestBenchmark, TestSchedule)
+        ]
+    )
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+
+if __name__ == "__main__":
+    unittest.main()